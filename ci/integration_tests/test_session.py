@@ -1,6 +1,9 @@
+from pathlib import Path
 from unittest.mock import MagicMock
 import os
+import shutil
 import socket
+import threading
 
 from ssh2.channel import Channel
 from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
@@ -11,6 +14,7 @@ from ssh2.listener import Listener
 from ssh2.session import Session, LIBSSH2_HOSTKEY_HASH_MD5, \
     LIBSSH2_HOSTKEY_HASH_SHA1, LIBSSH2_METHOD_KEX, LIBSSH2_METHOD_CRYPT_CS
 from ssh2.sftp import SFTP
+from ssh2.transport import ChannelTransport
 from ssh2.utils import wait_socket
 
 from .base_test import SSH2TestCase
@@ -74,6 +78,227 @@ class SessionTestCase(SSH2TestCase):
         chan = self.session.direct_tcpip(self.host, self.port)
         self.assertTrue(chan is not None)
 
+    def _echo_server(self, unix_path=None):
+        if unix_path is not None:
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(unix_path)
+        else:
+            server = socket.socket()
+            server.bind(('127.0.0.1', 0))
+        server.listen(10)
+
+        def echo(conn):
+            with conn:
+                data = conn.recv(65536)
+                while data:
+                    conn.sendall(data)
+                    data = conn.recv(65536)
+
+        def serve():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                threading.Thread(target=echo, args=(conn,), daemon=True).start()
+        threading.Thread(target=serve, daemon=True).start()
+        return server
+
+    def _socks_connect(self, port, host, dest_port):
+        """Connect to destination through SOCKS5 proxy on port, sending
+        greeting and request without waiting for replies."""
+        sock = socket.create_connection(('127.0.0.1', port))
+        b_host = host.encode('utf-8')
+        sock.sendall(b'\x05\x01\x00' + b'\x05\x01\x00\x03' + bytes([len(b_host)])
+                     + b_host + dest_port.to_bytes(2, 'big'))
+        reply = b''
+        while len(reply) < 12:
+            buf = sock.recv(12 - len(reply))
+            if not buf:
+                break
+            reply += buf
+        return sock, reply
+
+    def _echo_clients(self, address, data, count=8, socks_target=None):
+        """Run ``count`` concurrent clients echoing ``data`` through port
+        or unix socket path, or through SOCKS5 proxy on port to
+        ``socks_target`` host and port, returning whether each received its
+        data back in full."""
+        results = {}
+
+        def connect():
+            if isinstance(address, str):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(address)
+                return sock
+            if socks_target is not None:
+                sock, reply = self._socks_connect(address, *socks_target)
+                self.assertEqual(reply[:4], b'\x05\x00\x05\x00')
+                return sock
+            return socket.create_connection(('127.0.0.1', address))
+
+        def client(i):
+            with connect() as sock:
+                writer = threading.Thread(target=sock.sendall, args=(data,))
+                writer.start()
+                received = bytearray()
+                while len(received) < len(data):
+                    buf = sock.recv(65536)
+                    if not buf:
+                        break
+                    received += buf
+                writer.join()
+                results[i] = bytes(received) == data
+        clients = [threading.Thread(target=client, args=(i,)) for i in range(count)]
+        for _client in clients:
+            _client.start()
+        for _client in clients:
+            _client.join()
+        return [results.get(i) for i in range(count)]
+
+    def test_forward_local(self):
+        self.assertEqual(self._auth(), 0)
+        server = self._echo_server()
+        data = os.urandom(1024 * 1024)
+        try:
+            with self.session.forward_local(
+                    '127.0.0.1', 0, '127.0.0.1', server.getsockname()[1]) as fwd:
+                self.assertTrue(fwd.running)
+                self.assertNotEqual(fwd.bind_port, 0)
+                self.assertEqual(self._echo_clients(fwd.bind_port, data), [True] * 8)
+                self.assertEqual(fwd.connections, 8)
+                self.assertEqual(fwd.bytes_sent, len(data) * 8)
+                self.assertEqual(fwd.bytes_received, len(data) * 8)
+                self.assertEqual(fwd.failed_connections, 0)
+            self.assertFalse(fwd.running)
+            self.assertEqual(fwd.active_connections, 0)
+        finally:
+            server.close()
+        # Session usable again after forwarding stops
+        chan = self.session.open_session()
+        chan.execute('echo me')
+        self.assertEqual(chan.read(), (3, b'me\n'))
+
+    def test_forward_remote(self):
+        self.assertEqual(self._auth(), 0)
+        server = self._echo_server()
+        data = os.urandom(1024 * 1024)
+        try:
+            with self.session.forward_remote(
+                    0, '127.0.0.1', server.getsockname()[1]) as fwd:
+                self.assertTrue(fwd.running)
+                self.assertNotEqual(fwd.remote_port, 0)
+                self.assertEqual(self._echo_clients(fwd.remote_port, data), [True] * 8)
+                self.assertEqual(fwd.connections, 8)
+                self.assertEqual(fwd.bytes_sent, len(data) * 8)
+                self.assertEqual(fwd.bytes_received, len(data) * 8)
+                self.assertEqual(fwd.failed_connections, 0)
+            self.assertFalse(fwd.running)
+        finally:
+            server.close()
+        chan = self.session.open_session()
+        chan.execute('echo me')
+        self.assertEqual(chan.read(), (3, b'me\n'))
+
+    def test_forward_streamlocal(self):
+        self.assertEqual(self._auth(), 0)
+        remote_path = '/tmp/ssh2_fwd_remote.sock'
+        local_path = '/tmp/ssh2_fwd_local.sock'
+        for path in (remote_path, local_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        server = self._echo_server(unix_path=remote_path)
+        data = os.urandom(1024 * 1024)
+        try:
+            with self.session.forward_streamlocal(local_path, remote_path) as fwd:
+                self.assertTrue(fwd.running)
+                self.assertTrue(os.path.exists(local_path))
+                self.assertEqual(self._echo_clients(local_path, data), [True] * 8)
+                self.assertEqual(fwd.connections, 8)
+                self.assertEqual(fwd.bytes_sent, len(data) * 8)
+                self.assertEqual(fwd.bytes_received, len(data) * 8)
+            self.assertFalse(os.path.exists(local_path))
+        finally:
+            server.close()
+            os.unlink(remote_path)
+
+    def test_forward_dynamic(self):
+        self.assertEqual(self._auth(), 0)
+        pooled = Session()
+        pooled_sock = socket.create_connection((self.host, self.port))
+        pooled.handshake(pooled_sock)
+        self.assertEqual(pooled.userauth_publickey_fromfile(self.user, self.user_key), 0)
+        server = self._echo_server()
+        data = os.urandom(256 * 1024)
+        try:
+            with self.session.forward_dynamic('127.0.0.1', 0, max_channels=4, pool=[pooled]) as fwd:
+                self.assertTrue(fwd.running)
+                self.assertTrue(fwd.pool[0].running)
+                self.assertEqual(fwd.pool[0].bind_port, fwd.bind_port)
+                target = ('127.0.0.1', server.getsockname()[1])
+                self.assertEqual(self._echo_clients(fwd.bind_port, data, count=16, socks_target=target),
+                                 [True] * 16)
+                connections = [fwd.connections] + [_fwd.connections for _fwd in fwd.pool]
+                self.assertEqual(sum(connections), 16)
+                self.assertEqual(fwd.bytes_sent + fwd.pool[0].bytes_sent, len(data) * 16)
+                # Unsupported command
+                sock = socket.create_connection(('127.0.0.1', fwd.bind_port))
+                sock.sendall(b'\x05\x01\x00\x05\x02\x00\x01\x7f\x00\x00\x01\x00\x16')
+                self.assertEqual(sock.recv(12)[:4], b'\x05\x00\x05\x07')
+                sock.close()
+                # Channel open failure
+                sock, reply = self._socks_connect(fwd.bind_port, 'host.invalid', 22)
+                self.assertEqual(reply[:4], b'\x05\x00\x05\x01')
+                self.assertEqual(sock.recv(1), b'')
+                sock.close()
+            self.assertFalse(fwd.running)
+            self.assertFalse(fwd.pool[0].running)
+        finally:
+            server.close()
+        self.assertEqual(fwd.failed_connections + fwd.pool[0].failed_connections, 1)
+        chan = pooled.open_session()
+        chan.execute(self.cmd)
+        self.assertEqual(chan.read(), (3, b'me\n'))
+        pooled.disconnect()
+        pooled_sock.close()
+
+    def test_handshake_via(self):
+        self.assertEqual(self._auth(), 0)
+        child = Session()
+        self.assertEqual(child.handshake_via(self.session, self.host, self.port), 0)
+        self.assertEqual(child.userauth_publickey_fromfile(self.user, self.user_key), 0)
+        grandchild = Session()
+        self.assertEqual(grandchild.handshake_via(child, self.host, self.port), 0)
+        self.assertEqual(grandchild.userauth_publickey_fromfile(self.user, self.user_key), 0)
+        chan = grandchild.open_session()
+        chan.execute(self.cmd)
+        self.assertEqual(chan.read(), (3, b'me\n'))
+        self.assertEqual(self.session.tunnels.connections, 1)
+        self.assertEqual(child.tunnels.connections, 1)
+        grandchild.disconnect()
+        child.tunnels.stop()
+        child.disconnect()
+        self.session.tunnels.stop()
+        self.assertFalse(self.session.tunnels.running)
+        self.assertRaises(ValueError, self.session.tunnels.open, self.host, self.port)
+        chan = self.session.open_session()
+        chan.execute(self.cmd)
+        self.assertEqual(chan.read(), (3, b'me\n'))
+
+    def test_channel_transport(self):
+        self.assertEqual(self._auth(), 0)
+        chan = self.session.direct_tcpip(self.host, self.port)
+        transport = ChannelTransport(chan)
+        child = Session()
+        child.set_transport(transport)
+        self.assertEqual(child.handshake(transport), 0)
+        self.assertEqual(child.userauth_publickey_fromfile(self.user, self.user_key), 0)
+        child_chan = child.open_session()
+        child_chan.execute(self.cmd)
+        self.assertEqual(child_chan.read(), (3, b'me\n'))
+        self.assertIsNone(transport.error)
+        child.disconnect()
+
     def test_agent(self):
         agent = self.session.agent_init()
         self.assertTrue(agent.connect() == 0)
@@ -129,6 +354,209 @@ class SessionTestCase(SSH2TestCase):
             os.unlink(remote_filename)
         self.assertRaises(SCPProtocolError, self.session.scp_recv2, remote_filename)
 
+    def test_scp_put_file(self):
+        self.assertEqual(self._auth(), 0)
+        test_data = os.urandom(1024 * 1024 + 7)
+        local_filename = os.sep.join([os.path.dirname(__file__),
+                                      "local_test_file"])
+        to_copy = os.sep.join([os.path.dirname(__file__),
+                               "copied"])
+        with open(local_filename, 'wb') as fh:
+            fh.write(test_data)
+        os.chmod(local_filename, 0o640)
+        os.utime(local_filename, (1500000000, 1500000000))
+        try:
+            self.assertEqual(self.session.scp_put_file(local_filename, to_copy,
+                                                       chunk_size=65536), len(test_data))
+            with open(to_copy, 'rb') as fh:
+                self.assertEqual(fh.read(), test_data)
+            self.assertEqual(os.stat(to_copy).st_mode & 0o777, 0o640)
+            self.assertEqual(int(os.stat(to_copy).st_mtime), 1500000000)
+            os.unlink(to_copy)
+            self.session.set_blocking(False)
+            with open(local_filename, 'rb') as fh:
+                fh.seek(7)
+                self.assertEqual(self.session.scp_put_file(
+                    fh, to_copy, mode=0o600, preserve_times=False), len(test_data) - 7)
+            self.assertFalse(self.session.get_blocking())
+            self.session.set_blocking(True)
+            with open(to_copy, 'rb') as fh:
+                self.assertEqual(fh.read(), test_data[7:])
+            self.assertEqual(os.stat(to_copy).st_mode & 0o777, 0o600)
+            self.assertNotEqual(int(os.stat(to_copy).st_mtime), 1500000000)
+        finally:
+            os.unlink(local_filename)
+            try:
+                os.unlink(to_copy)
+            except OSError:
+                pass
+        self.assertRaises(SCPProtocolError, self.session.scp_put_file,
+                          __file__, '/__non_existent_dir__/copied')
+
+    def test_scp_get_file(self):
+        self.assertEqual(self._auth(), 0)
+        test_data = os.urandom(1024 * 1024 + 7)
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       "remote_test_file"])
+        to_copy = os.sep.join([os.path.dirname(__file__),
+                               "copied"])
+        with open(remote_filename, 'wb') as fh:
+            fh.write(test_data)
+        os.chmod(remote_filename, 0o640)
+        os.utime(remote_filename, (1500000000, 1500000000))
+        try:
+            self.assertEqual(self.session.scp_get_file(remote_filename, to_copy,
+                                                       chunk_size=65536), len(test_data))
+            with open(to_copy, 'rb') as fh:
+                self.assertEqual(fh.read(), test_data)
+            self.assertEqual(os.stat(to_copy).st_mode & 0o777, 0o640)
+            self.assertEqual(int(os.stat(to_copy).st_mtime), 1500000000)
+            self.session.set_blocking(False)
+            with open(to_copy, 'wb') as fh:
+                fh.write(b'header')
+                self.assertEqual(self.session.scp_get_file(remote_filename, fh),
+                                 len(test_data))
+            self.assertFalse(self.session.get_blocking())
+            self.session.set_blocking(True)
+            with open(to_copy, 'rb') as fh:
+                self.assertEqual(fh.read(), b'header' + test_data)
+        finally:
+            os.unlink(remote_filename)
+            try:
+                os.unlink(to_copy)
+            except OSError:
+                pass
+        self.assertRaises(SCPProtocolError, self.session.scp_get_file,
+                          remote_filename, to_copy)
+        self.assertFalse(os.path.exists(to_copy))
+
+    def test_scp_put_get_many(self):
+        self.assertEqual(self._auth(), 0)
+        src_dir = os.sep.join([os.path.dirname(__file__), "scp_src"])
+        dst_dir = os.sep.join([os.path.dirname(__file__), "scp_dst"])
+        for _dir in (src_dir, dst_dir):
+            shutil.rmtree(_dir, ignore_errors=True)
+            os.mkdir(_dir)
+        sizes = [0, 1, 100, 65536, 1024 * 1024 + 3] + list(range(20))
+        names = ['file_%s' % (i,) for i in range(len(sizes))]
+        for name, size in zip(names, sizes):
+            with open(os.path.join(src_dir, name), 'wb') as fh:
+                fh.write(os.urandom(size))
+            os.utime(os.path.join(src_dir, name), (1500000000, 1500000000))
+        try:
+            pairs = [(os.path.join(src_dir, name), os.path.join(dst_dir, name))
+                     for name in names]
+            missing = os.path.join(src_dir, 'missing')
+            self.session.set_blocking(False)
+            results = self.session.scp_put_many(
+                pairs + [(missing, os.path.join(dst_dir, 'missing'))],
+                concurrency=4, chunk_size=65536)
+            self.assertFalse(self.session.get_blocking())
+            self.session.set_blocking(True)
+            self.assertEqual(results[:-1], sizes)
+            self.assertIsInstance(results[-1], OSError)
+            for name in names:
+                with open(os.path.join(src_dir, name), 'rb') as src, \
+                        open(os.path.join(dst_dir, name), 'rb') as dst:
+                    self.assertEqual(src.read(), dst.read())
+                self.assertEqual(int(os.stat(os.path.join(dst_dir, name)).st_mtime),
+                                 1500000000)
+            for name in names:
+                os.unlink(os.path.join(src_dir, name))
+            results = self.session.scp_get_many(
+                [(dst, src) for src, dst in pairs] + [(missing, missing)], concurrency=3)
+            self.assertEqual(results[:-1], sizes)
+            self.assertIsInstance(results[-1], SCPProtocolError)
+            self.assertFalse(os.path.exists(missing))
+            for name in names:
+                with open(os.path.join(src_dir, name), 'rb') as src, \
+                        open(os.path.join(dst_dir, name), 'rb') as dst:
+                    self.assertEqual(src.read(), dst.read())
+            self.assertEqual(self.session.scp_put_file(
+                os.path.join(src_dir, names[2]), os.path.join(dst_dir, 'single')), 100)
+        finally:
+            shutil.rmtree(src_dir)
+            shutil.rmtree(dst_dir)
+
+    def _make_scp_tree(self, root):
+        os.makedirs(os.path.join(root, 'sub', 'nested'))
+        os.mkdir(os.path.join(root, 'empty'))
+        files = {'file_a': os.urandom(1024 * 1024 + 1), "it's": b'quoted',
+                 os.path.join('sub', 'file_b'): b'',
+                 os.path.join('sub', 'nested', 'file_c'): os.urandom(100)}
+        for name, data in files.items():
+            with open(os.path.join(root, name), 'wb') as fh:
+                fh.write(data)
+        os.chmod(os.path.join(root, 'file_a'), 0o600)
+        os.chmod(os.path.join(root, 'sub'), 0o750)
+        os.utime(os.path.join(root, 'sub', 'nested', 'file_c'), (1500000000, 1500000000))
+        return files
+
+    def _check_scp_tree(self, root, files):
+        for name, data in files.items():
+            with open(os.path.join(root, name), 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        self.assertTrue(os.path.isdir(os.path.join(root, 'empty')))
+        self.assertEqual(os.stat(os.path.join(root, 'file_a')).st_mode & 0o777, 0o600)
+        self.assertEqual(os.stat(os.path.join(root, 'sub')).st_mode & 0o777, 0o750)
+        self.assertEqual(
+            int(os.stat(os.path.join(root, 'sub', 'nested', 'file_c')).st_mtime), 1500000000)
+
+    def test_scp_put_get_dir(self):
+        self.assertEqual(self._auth(), 0)
+        src_dir = os.sep.join([os.path.dirname(__file__), "scp_src"])
+        dst_dir = os.sep.join([os.path.dirname(__file__), "scp_dst"])
+        copy_dir = os.sep.join([os.path.dirname(__file__), "scp_copy"])
+        for _dir in (src_dir, dst_dir, copy_dir):
+            shutil.rmtree(_dir, ignore_errors=True)
+        files = self._make_scp_tree(src_dir)
+        size = sum(len(data) for data in files.values())
+        try:
+            self.assertEqual(self.session.scp_put_dir(src_dir, dst_dir), size)
+            self._check_scp_tree(dst_dir, files)
+            self.session.set_blocking(False)
+            # Existing directory is copied into, not under
+            self.assertEqual(self.session.scp_put_dir(src_dir, dst_dir + '/'), size)
+            self.assertFalse(os.path.exists(os.path.join(dst_dir, 'scp_src')))
+            self.assertEqual(self.session.scp_get_dir(dst_dir, copy_dir, chunk_size=1024), size)
+            self.assertFalse(self.session.get_blocking())
+            self.session.set_blocking(True)
+            self._check_scp_tree(copy_dir, files)
+            self.assertRaises(SCPProtocolError, self.session.scp_get_dir,
+                              os.path.join(dst_dir, 'file_a'), copy_dir)
+            self.assertRaises(SCPProtocolError, self.session.scp_get_dir,
+                              os.path.join(dst_dir, 'missing'), copy_dir)
+            shutil.rmtree(copy_dir)
+            self.assertEqual(self.session.scp_get_dir(dst_dir, Path(copy_dir)), size)
+            self._check_scp_tree(copy_dir, files)
+        finally:
+            for _dir in (src_dir, dst_dir, copy_dir):
+                shutil.rmtree(_dir, ignore_errors=True)
+
+    def test_scp_put_dir_symlinks(self):
+        self.assertEqual(self._auth(), 0)
+        src_dir = os.sep.join([os.path.dirname(__file__), "scp_src"])
+        dst_dir = os.sep.join([os.path.dirname(__file__), "scp_dst"])
+        for _dir in (src_dir, dst_dir):
+            shutil.rmtree(_dir, ignore_errors=True)
+        files = self._make_scp_tree(src_dir)
+        os.symlink(src_dir, os.path.join(src_dir, 'sub', 'nested', 'loop'))
+        os.symlink(os.path.join(src_dir, 'sub'), os.path.join(src_dir, 'sub_link'))
+        os.symlink('file_a', os.path.join(src_dir, 'file_link'))
+        size = sum(len(data) for data in files.values())
+        try:
+            self.assertEqual(self.session.scp_put_dir(src_dir, dst_dir),
+                             size + len(files['file_a']) + 100)
+            self._check_scp_tree(dst_dir, files)
+            self.assertFalse(os.path.lexists(os.path.join(dst_dir, 'sub', 'nested', 'loop')))
+            with open(os.path.join(dst_dir, 'file_link'), 'rb') as fh:
+                self.assertEqual(fh.read(), files['file_a'])
+            with open(os.path.join(dst_dir, 'sub_link', 'nested', 'file_c'), 'rb') as fh:
+                self.assertEqual(fh.read(), files[os.path.join('sub', 'nested', 'file_c')])
+        finally:
+            for _dir in (src_dir, dst_dir):
+                shutil.rmtree(_dir, ignore_errors=True)
+
     def test_scp_send64(self):
         self.assertEqual(self._auth(), 0)
         test_data = b"data"
@@ -1,18 +1,26 @@
 import os
 import platform
 import shutil
+import glob
+import hashlib
+import io
 import stat
+import tarfile
+import zipfile
+import zlib
 from sys import version_info
+from time import sleep
 from unittest import skipUnless
 
 from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
-from ssh2.exceptions import SFTPProtocolError, BufferTooSmallError
+from ssh2.exceptions import SFTPProtocolError
 from ssh2.session import Session
-from ssh2.sftp import LIBSSH2_FXF_CREAT, LIBSSH2_FXF_WRITE, \
+from ssh2.sftp import LIBSSH2_FXF_CREAT, LIBSSH2_FXF_WRITE, LIBSSH2_FXF_READ, \
     LIBSSH2_SFTP_S_IRUSR, LIBSSH2_SFTP_S_IRGRP, LIBSSH2_SFTP_S_IROTH, LIBSSH2_SFTP_S_IXUSR, SFTP, \
     LIBSSH2_SFTP_S_IWUSR, LIBSSH2_SFTP_S_IWGRP, LIBSSH2_SFTP_S_IWOTH, \
-    LIBSSH2_SFTP_ATTR_PERMISSIONS
-from ssh2.sftp_handle import SFTPHandle, SFTPAttributes
+    LIBSSH2_SFTP_ATTR_PERMISSIONS, TRANSFER_JOURNAL_SUFFIX, TransferJournal, \
+    SFTPFileIO
+from ssh2.sftp_handle import SFTPHandle, SFTPAttributes, SFTPDirListing
 from ssh2.utils import wait_socket
 
 from .base_test import SSH2TestCase
@@ -173,12 +181,41 @@ class SFTPTestCase(SSH2TestCase):
         finally:
             os.unlink(remote_filename)
 
-    def test_realpath_failure(self):
+    def test_realpath_buffer_growth(self):
         self.assertEqual(self._auth(), 0)
         sftp = self.session.sftp_init()
         self.assertTrue(sftp is not None)
-        self.assertRaises(
-            BufferTooSmallError, sftp.realpath, '/', max_len=0)
+        self.assertEqual(sftp.realpath('/', max_len=0), '/')
+        test_dir = os.sep.join([os.path.dirname(__file__), 'remote_test_dir'])
+        long_dir = os.sep.join([test_dir] + ['d' * 200] * 4)
+        os.makedirs(long_dir)
+        try:
+            self.assertEqual(sftp.realpath(os.sep.join([long_dir, '.']), max_len=16),
+                             long_dir)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_readlink(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        _dir = os.path.dirname(__file__)
+        link = os.sep.join([_dir, 'remote_test_link'])
+        target = os.sep.join([_dir] + ['t' * 200] * 3)
+        os.symlink(target, link)
+        try:
+            self.assertEqual(sftp.readlink(link), target)
+            self.assertEqual(sftp.readlink(link, max_len=1), target)
+            self.assertRaises(SFTPProtocolError, sftp.readlink, _dir)
+            cache = sftp.enable_attr_cache()
+            self.assertEqual(sftp.readlink(link), target)
+            hits = cache.hits
+            self.assertEqual(sftp.readlink(link), target)
+            self.assertEqual(cache.hits, hits + 1)
+            sftp.unlink(link)
+            sftp.symlink(_dir, link)
+            self.assertEqual(sftp.readlink(link), _dir)
+        finally:
+            os.unlink(link)
 
     def test_realpath(self):
         self.assertEqual(self._auth(), 0)
@@ -228,6 +265,653 @@ class SFTPTestCase(SSH2TestCase):
         self.assertTrue(b'..' in (_ls for (_, _ls, _, _) in dir_data))
         self.assertTrue(len(dir_data[0][2].split(b' ')) > 0)
 
+    def _make_test_dir(self, num_files):
+        test_dir = os.sep.join([os.path.dirname(__file__), 'remote_test_dir'])
+        try:
+            shutil.rmtree(test_dir)
+        except OSError:
+            pass
+        os.mkdir(test_dir)
+        for i in range(num_files):
+            with open(os.path.join(test_dir, 'file_%s' % (i,)), 'wb') as fh:
+                fh.write(b'a' * i)
+        os.mkdir(os.path.join(test_dir, 'sub_dir'))
+        return test_dir
+
+    def test_listdir_attr(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_dir(500)
+        try:
+            entries = sftp.listdir_attr(test_dir)
+            self.assertEqual(sorted(_name for _name, _ in entries),
+                             sorted(_name.encode() for _name in os.listdir(test_dir)))
+            for _name, attrs in entries:
+                self.assertIsInstance(attrs, SFTPAttributes)
+                _stat = os.lstat(os.path.join(test_dir, _name.decode()))
+                self.assertEqual(attrs.filesize, _stat.st_size)
+                self.assertEqual(attrs.permissions, _stat.st_mode)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_listdir_attr_nonblocking(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_dir(100)
+        self.session.set_blocking(False)
+        try:
+            entries = sftp.listdir_attr(test_dir)
+            self.assertEqual(len(entries), 101)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_listdir_columns(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_dir(500)
+        try:
+            listing = sftp.listdir_columns(test_dir)
+            self.assertIsInstance(listing, SFTPDirListing)
+            self.assertEqual(len(listing), 501)
+            self.assertEqual(sorted(listing),
+                             sorted(_name.encode() for _name in os.listdir(test_dir)))
+            self.assertEqual(len(listing.name_offsets), len(listing) + 1)
+            self.assertEqual(listing.name_offsets[-1], len(listing.names))
+            for i, _name in enumerate(listing):
+                _stat = os.lstat(os.path.join(test_dir, _name.decode()))
+                self.assertEqual(listing.filesizes[i], _stat.st_size)
+                self.assertEqual(listing.permissions[i], _stat.st_mode)
+                self.assertEqual(listing.mtimes[i], int(_stat.st_mtime))
+                self.assertEqual(listing.uids[i], _stat.st_uid)
+                self.assertEqual(listing.attributes(i).filesize, _stat.st_size)
+            self.assertEqual(listing[0][0], listing.name(0))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_listdir_attr_failure(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        self.assertRaises(SFTPProtocolError, sftp.listdir_attr, 'fakeyfakey')
+
+    def _make_test_tree(self):
+        test_dir = self._make_test_dir(5)
+        for sub_dir in ('sub_dir2', 'sub_dir2/sub_sub_dir', 'sub_dir3'):
+            os.mkdir(os.path.join(test_dir, sub_dir))
+            with open(os.path.join(test_dir, sub_dir, 'file'), 'wb') as fh:
+                fh.write(b'a')
+        os.symlink(os.path.join(test_dir, 'sub_dir2'),
+                   os.path.join(test_dir, 'link_dir'))
+        return test_dir
+
+    def _walk_sorted(self, walk):
+        return sorted((_path, sorted(_dirs), sorted(_files))
+                      for _path, _dirs, _files in walk)
+
+    def test_sftp_pool(self):
+        self.assertEqual(self._auth(), 0)
+        pool = self.session.sftp_pool(size=4)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.session, self.session)
+        test_dir = self._make_test_dir(50)
+        paths = [os.path.join(test_dir, 'file_%s' % (i,)) for i in range(50)]
+        try:
+            self.assertEqual([attrs.filesize for attrs in pool.stat_many(paths)],
+                             list(range(50)))
+            self.assertEqual([attrs.filesize for attrs in pool.lstat_many(paths[:3])],
+                             [0, 1, 2])
+            missing = os.path.join(test_dir, 'missing')
+            self.assertRaises(SFTPProtocolError, pool.stat_many, paths + [missing])
+            results = pool.stat_many([paths[1], missing, paths[2]], return_exceptions=True)
+            self.assertEqual(results[0].filesize, 1)
+            self.assertIsInstance(results[1], SFTPProtocolError)
+            self.assertEqual(results[2].filesize, 2)
+            attrs = SFTPAttributes()
+            attrs.flags = LIBSSH2_SFTP_ATTR_PERMISSIONS
+            attrs.permissions = 0o600
+            self.assertEqual(pool.setstat_many([(path, attrs) for path in paths]), [0] * 50)
+            self.assertEqual(stat.S_IMODE(os.stat(paths[10]).st_mode), 0o600)
+            self.session.set_blocking(False)
+            self.assertEqual(pool.unlink_many(paths[:25]), [0] * 25)
+            self.assertFalse(self.session.get_blocking())
+            self.session.set_blocking(True)
+            self.assertEqual(sorted(os.listdir(test_dir)),
+                             sorted([os.path.basename(path) for path in paths[25:]] + ['sub_dir']))
+            nested = [os.path.join(test_dir, 'a', 'b', 'c'), os.path.join(test_dir, 'a', 'd'),
+                      os.path.join(test_dir, 'e')]
+            self.assertEqual(sorted(pool.makedirs_many(nested)),
+                             sorted([os.path.join(test_dir, 'a'), os.path.join(test_dir, 'a', 'b'),
+                                     os.path.join(test_dir, 'e'), os.path.join(test_dir, 'a', 'd'),
+                                     os.path.join(test_dir, 'a', 'b', 'c')]))
+            for path in nested:
+                self.assertTrue(os.path.isdir(path))
+            self.assertEqual(pool.makedirs_many(nested), [])
+            undecodable = os.path.join(test_dir, 'f_\udcff', 'g')
+            self.assertEqual(pool.makedirs_many([undecodable]),
+                             [os.path.dirname(undecodable), undecodable])
+            self.assertTrue(os.path.isdir(os.fsencode(undecodable)))
+            self.assertRaises(SFTPProtocolError, pool.makedirs_many,
+                              [os.path.join(paths[30], 'sub')])
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_glob(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        with open(os.path.join(test_dir, 'sub_dir3', '.hidden'), 'wb'):
+            pass
+        try:
+            for pattern in ('*/file', 'sub_dir[23]/*', '*/sub_sub_dir/fil?',
+                            'sub_dir2/file', 'sub_dir*', '*/.*', 'nonexistent/*',
+                            '*/nonexistent', '', '*/', 'sub_dir2/', 'sub_dir2/*/'):
+                pattern = os.path.join(test_dir, pattern)
+                expected = sorted(glob.glob(pattern))
+                for concurrency in (1, 3):
+                    self.assertEqual(sorted(sftp.glob(pattern, concurrency=concurrency)),
+                                     expected, pattern)
+            self.assertEqual(sorted(sftp.iglob(os.path.join(test_dir, '*', 'file').encode())),
+                             sorted(glob.glob(os.path.join(test_dir, '*', 'file').encode())))
+            self.session.set_blocking(False)
+            self.assertEqual(sorted(sftp.glob(os.path.join(test_dir, '*', '*'),
+                                              concurrency=2)),
+                             sorted(glob.glob(os.path.join(test_dir, '*', '*'))))
+            self.assertFalse(self.session.get_blocking())
+        finally:
+            self.session.set_blocking(True)
+            shutil.rmtree(test_dir)
+
+    def test_glob_undecodable_name_early_close(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        with open(os.path.join(test_dir.encode(), b'sub_dir3', b'file_\xff'), 'wb'):
+            pass
+        try:
+            for concurrency in (1, 2):
+                self.assertEqual(
+                    sftp.glob(os.path.join(test_dir, '*', 'file_?'), concurrency=concurrency),
+                    [os.path.join(test_dir, 'sub_dir3', 'file_\udcff')])
+                self.assertEqual(
+                    sftp.glob(os.path.join(test_dir, '*', 'file_?').encode(),
+                              concurrency=concurrency),
+                    [os.path.join(test_dir.encode(), b'sub_dir3', b'file_\xff')])
+            # Stopping iteration early closes additional channels
+            for _ in range(10):
+                paths = sftp.iglob(os.path.join(test_dir, '*', '*'), concurrency=3)
+                next(paths)
+                paths.close()
+                walk = sftp.walk(test_dir, concurrency=3)
+                next(walk)
+                walk.close()
+            self.assertTrue(self.session.get_blocking())
+            self.assertEqual(sftp.stat(test_dir).permissions & 0o40000, 0o40000)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_walk(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        try:
+            for topdown in (True, False):
+                for followlinks in (False, True):
+                    expected = self._walk_sorted(os.walk(
+                        test_dir, topdown=topdown, followlinks=followlinks))
+                    for concurrency in (1, 4):
+                        self.assertEqual(
+                            self._walk_sorted(sftp.walk(
+                                test_dir, topdown=topdown,
+                                followlinks=followlinks,
+                                concurrency=concurrency)),
+                            expected)
+            self.assertEqual(list(sftp.walk(test_dir, topdown=False)),
+                             list(os.walk(test_dir, topdown=False)))
+            self.assertEqual(list(sftp.walk(test_dir)), list(os.walk(test_dir)))
+            bytes_walk = list(sftp.walk(test_dir.encode(), concurrency=2))
+            self.assertTrue(isinstance(bytes_walk[0][0], bytes))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_walk_undecodable_name(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        with open(os.path.join(test_dir.encode(), b'sub_dir3', b'file_\xff'), 'wb') as fh:
+            fh.write(b'data')
+        try:
+            for concurrency in (1, 2):
+                self.assertEqual(
+                    self._walk_sorted(sftp.walk(test_dir, concurrency=concurrency)),
+                    self._walk_sorted(os.walk(test_dir)))
+            name = os.path.join(test_dir, 'sub_dir3', 'file_\udcff')
+            self.assertEqual(sftp.stat(name).filesize, 4)
+            bytes_files = [_files for _path, _dirs, _files in sftp.walk(test_dir.encode())
+                           if _path.endswith(b'sub_dir3')][0]
+            self.assertIn(b'file_\xff', bytes_files)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_walk_concurrent_prune(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        try:
+            paths = []
+            for _path, _dirs, _files in sftp.walk(test_dir, concurrency=3):
+                paths.append(_path)
+                _dirs[:] = [_dir for _dir in _dirs if _dir != 'sub_dir2']
+                # Session is usable while walk is suspended
+                self.assertTrue(self.session.get_blocking())
+                self.assertEqual(sftp.stat(_path).permissions & 0o40000, 0o40000)
+            self.assertEqual(sorted(paths), sorted(
+                [test_dir, os.path.join(test_dir, 'sub_dir'),
+                 os.path.join(test_dir, 'sub_dir3')]))
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_walk_nonblocking(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        test_dir = self._make_test_tree()
+        expected = self._walk_sorted(os.walk(test_dir))
+        self.session.set_blocking(False)
+        try:
+            for concurrency in (1, 3):
+                self.assertEqual(
+                    self._walk_sorted(sftp.walk(test_dir, concurrency=concurrency)),
+                    expected)
+                self.assertFalse(self.session.get_blocking())
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_walk_failure(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        errors = []
+        self.assertEqual(list(sftp.walk('fakeyfakey', concurrency=2,
+                                        onerror=errors.append)), [])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], SFTPProtocolError)
+
+    def test_attr_cache(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        cache = sftp.enable_attr_cache(ttl=60)
+        test_dir = self._make_test_dir(5)
+        remote_filename = os.path.join(test_dir, 'file_3')
+        try:
+            attrs = sftp.stat(remote_filename)
+            self.assertEqual(attrs.filesize, 3)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            # Served from cache, changes to returned attributes not cached
+            attrs.filesize = 100
+            self.assertEqual(sftp.stat(remote_filename).filesize, 3)
+            self.assertEqual(cache.hits, 1)
+            with open(remote_filename, 'wb') as fh:
+                fh.write(b'a' * 10)
+            self.assertEqual(sftp.stat(remote_filename).filesize, 3)
+            # Writes through handle invalidate
+            with sftp.open(remote_filename, LIBSSH2_FXF_WRITE, 0) as fh:
+                fh.write(b'b' * 20)
+            self.assertEqual(sftp.stat(remote_filename).filesize, 20)
+            # Listing populates
+            hits = cache.hits
+            sftp.listdir_attr(test_dir)
+            self.assertEqual(sftp.lstat(os.path.join(test_dir, 'file_4')).filesize, 4)
+            self.assertEqual(sftp.stat(os.path.join(test_dir, 'file_2')).filesize, 2)
+            self.assertEqual(cache.hits, hits + 2)
+            # Mutating calls invalidate
+            new_filename = os.path.join(test_dir, 'renamed')
+            sftp.rename(remote_filename, new_filename)
+            self.assertRaises(SFTPProtocolError, sftp.stat, remote_filename)
+            self.assertEqual(sftp.stat(new_filename).filesize, 20)
+            sftp.unlink(new_filename)
+            self.assertRaises(SFTPProtocolError, sftp.stat, new_filename)
+            sub_dir = os.path.join(test_dir, 'sub_dir')
+            self.assertTrue(sftp.stat(sub_dir) is not None)
+            sftp.rmdir(sub_dir)
+            self.assertRaises(SFTPProtocolError, sftp.stat, sub_dir)
+            real_path = sftp.realpath(os.path.join(test_dir, '.', 'file_2'))
+            self.assertEqual(real_path, os.path.realpath(
+                os.path.join(test_dir, 'file_2')))
+            hits = cache.hits
+            self.assertEqual(sftp.realpath(os.path.join(test_dir, '.', 'file_2')),
+                             real_path)
+            self.assertEqual(cache.hits, hits + 1)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_attr_cache_expiry_eviction(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        cache = sftp.enable_attr_cache(max_entries=2, ttl=0.2)
+        test_dir = self._make_test_dir(5)
+        try:
+            for i in range(4):
+                sftp.stat(os.path.join(test_dir, 'file_%s' % (i,)))
+            self.assertEqual(len(cache), 2)
+            # Least recently used entry evicted
+            sftp.stat(os.path.join(test_dir, 'file_0'))
+            self.assertEqual(cache.hits, 0)
+            sftp.stat(os.path.join(test_dir, 'file_0'))
+            self.assertEqual(cache.hits, 1)
+            sleep(.3)
+            sftp.stat(os.path.join(test_dir, 'file_0'))
+            self.assertEqual(cache.hits, 1)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_open_file_zipfile(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file.zip'])
+        contents = dict(('file_%s' % (i,), os.urandom(10000 * i))
+                        for i in range(10))
+        try:
+            with zipfile.ZipFile(remote_filename, 'w') as zip_fh:
+                for name, data in contents.items():
+                    zip_fh.writestr(name, data)
+            with sftp.open_file(remote_filename, 'rb') as remote_fh:
+                self.assertIsInstance(remote_fh, io.BufferedReader)
+                self.assertTrue(remote_fh.seekable())
+                with zipfile.ZipFile(remote_fh) as zip_fh:
+                    self.assertEqual(sorted(zip_fh.namelist()),
+                                     sorted(contents))
+                    for name in ('file_7', 'file_2'):
+                        self.assertEqual(zip_fh.read(name), contents[name])
+        finally:
+            os.unlink(remote_filename)
+
+    def test_open_file_tarfile_write(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file.tar'])
+        try:
+            with sftp.open_file(remote_filename, 'wb') as remote_fh:
+                self.assertIsInstance(remote_fh, io.BufferedWriter)
+                with tarfile.open(fileobj=remote_fh, mode='w') as tar_fh:
+                    tar_fh.add(__file__, arcname='test_file')
+            with tarfile.open(remote_filename) as tar_fh:
+                with open(__file__, 'rb') as fh:
+                    self.assertEqual(tar_fh.extractfile('test_file').read(),
+                                     fh.read())
+        finally:
+            os.unlink(remote_filename)
+
+    def test_open_file_text(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        try:
+            with sftp.open_file(remote_filename, 'w', encoding='utf-8') as fh:
+                fh.write(u'line one\n')
+            with sftp.open_file(remote_filename, 'a', encoding='utf-8') as fh:
+                fh.write(u'line two\n')
+            with sftp.open_file(remote_filename, encoding='utf-8') as fh:
+                self.assertEqual(fh.readlines(), [u'line one\n', u'line two\n'])
+            self.assertRaises(SFTPProtocolError, sftp.open_file,
+                              remote_filename, 'x')
+        finally:
+            os.unlink(remote_filename)
+
+    def test_open_file_seek(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        data = os.urandom(1024 * 1024 * 3)
+        with open(remote_filename, 'wb') as fh:
+            fh.write(data)
+        try:
+            with sftp.open_file(remote_filename, 'r+b') as fh:
+                self.assertEqual(fh.seek(-10, io.SEEK_END), len(data) - 10)
+                self.assertEqual(fh.read(), data[-10:])
+                self.assertEqual(fh.seek(1000), 1000)
+                self.assertEqual(fh.read(10), data[1000:1010])
+                self.assertEqual(fh.tell(), 1010)
+                fh.seek(5)
+                fh.write(b'written')
+                fh.seek(0)
+                self.assertEqual(fh.read(12), data[:5] + b'written')
+                fh.truncate(100)
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data[:5] + b'written' + data[12:100])
+            with sftp.open_file(remote_filename, 'rb', buffering=0) as fh:
+                self.assertIsInstance(fh, SFTPFileIO)
+                buf = bytearray(50)
+                self.assertEqual(fh.readinto(buf), 50)
+                self.assertEqual(fh.readall(), data[50:100])
+            # Line buffering does not apply to binary mode, as with open()
+            with self.assertWarns(RuntimeWarning):
+                fh = sftp.open_file(remote_filename, 'rb', buffering=1)
+            with fh:
+                self.assertEqual(fh.peek(1), data[:5] + b'written' + data[12:100])
+        finally:
+            os.unlink(remote_filename)
+
+    def test_open_file_nonblocking(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        data = os.urandom(1024 * 1024 * 3)
+        self.session.set_blocking(False)
+        try:
+            with sftp.open_file(remote_filename, 'wb') as fh:
+                fh.write(data)
+            with sftp.open_file(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+
+    def test_read_cache(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        data = os.urandom(1024 * 1024)
+        with open(remote_filename, 'wb') as fh:
+            fh.write(data)
+        try:
+            with sftp.open(remote_filename, LIBSSH2_FXF_READ | LIBSSH2_FXF_WRITE,
+                           0) as fh:
+                fh.seek64(100)
+                fh.enable_read_cache(block_size=4096, capacity_mb=0.5)
+                self.assertTrue(fh.read_cache_enabled)
+                self.assertEqual(fh.tell64(), 100)
+                self.assertEqual(fh.read(10), (10, data[100:110]))
+                self.assertEqual(fh.read_cache_misses, 1)
+                # Overlapping reads served from cache
+                fh.seek64(50)
+                self.assertEqual(fh.read(100), (100, data[50:150]))
+                fh.seek64(4000)
+                self.assertEqual(fh.read(200), (200, data[4000:4200]))
+                self.assertEqual(fh.read_cache_misses, 2)
+                self.assertEqual(fh.read_cache_hits, 2)
+                self.assertEqual(fh.tell64(), 4200)
+                # Forward scan prefetches increasing number of blocks
+                fh.seek64(0)
+                misses = fh.read_cache_misses
+                scanned = b''.join(fh.read(4096)[1] for _ in range(256))
+                self.assertEqual(scanned, data)
+                self.assertLess(fh.read_cache_misses - misses, 20)
+                self.assertEqual(fh.read(), (0, b''))
+                # Cache capacity is 128 blocks, start of file was evicted
+                misses = fh.read_cache_misses
+                fh.seek64(0)
+                self.assertEqual(fh.read(10), (10, data[:10]))
+                self.assertEqual(fh.read_cache_misses, misses + 1)
+                # Writes update cached blocks
+                fh.seek64(5)
+                self.assertEqual(fh.write(b'written')[1], 7)
+                self.assertEqual(fh.tell64(), 12)
+                fh.seek64(0)
+                self.assertEqual(fh.read(20)[1],
+                                 data[:5] + b'written' + data[12:20])
+                fh.disable_read_cache()
+                self.assertFalse(fh.read_cache_enabled)
+                self.assertEqual(fh.read(10), (10, data[20:30]))
+            self.session.set_blocking(False)
+            fh = sftp.open(remote_filename, LIBSSH2_FXF_READ, 0)
+            while fh == LIBSSH2_ERROR_EAGAIN:
+                wait_socket(self.sock, self.session)
+                fh = sftp.open(remote_filename, LIBSSH2_FXF_READ, 0)
+            fh.enable_read_cache()
+            fh.seek64(len(data) - 100)
+            self.assertEqual(fh.read(1000), (100, data[-100:]))
+            self.session.set_blocking(True)
+            fh.close()
+            with sftp.open_file(remote_filename, 'rb') as fh:
+                fh.raw.handle.enable_read_cache(block_size=8192)
+                fh.seek(10000)
+                self.assertEqual(fh.read(100), data[10000:10100])
+                fh.seek(-10, io.SEEK_END)
+                self.assertEqual(fh.read(), data[-10:])
+                self.assertGreater(fh.raw.handle.read_cache_misses, 0)
+        finally:
+            os.unlink(remote_filename)
+
+    def test_read_cache_write_nonblocking(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        data = os.urandom(1024 * 1024)
+        written = os.urandom(1024 * 1024 * 2)
+        with open(remote_filename, 'wb') as fh:
+            fh.write(data)
+        self.session.set_blocking(False)
+        try:
+            fh = sftp.open(remote_filename,
+                           LIBSSH2_FXF_READ | LIBSSH2_FXF_WRITE, 0)
+            while fh == LIBSSH2_ERROR_EAGAIN:
+                wait_socket(self.sock, self.session)
+                fh = sftp.open(remote_filename,
+                               LIBSSH2_FXF_READ | LIBSSH2_FXF_WRITE, 0)
+            fh.enable_read_cache(block_size=8192)
+            fh.seek64(1000)
+            self.assertEqual(fh.read(100), (100, data[1000:1100]))
+            # Resume writes after EAGAIN, from cache offset
+            fh.seek64(10)
+            total = 0
+            while total < len(written):
+                rc, bytes_written = fh.write(written[total:])
+                total += bytes_written
+                if rc == LIBSSH2_ERROR_EAGAIN:
+                    wait_socket(self.sock, self.session)
+            self.assertEqual(fh.tell64(), 10 + len(written))
+            fh.seek64(0)
+            self.assertEqual(fh.read(20)[1], data[:10] + written[:10])
+            self.session.set_blocking(True)
+            fh.close()
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data[:10] + written)
+        finally:
+            self.session.set_blocking(True)
+            os.unlink(remote_filename)
+
+    def test_read_cache_file_seek_handle_write(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__),
+                                       'remote_test_file'])
+        data = os.urandom(100000)
+        with open(remote_filename, 'wb') as fh:
+            fh.write(data)
+        try:
+            with sftp.open_file(remote_filename, 'r+b', buffering=0) as fh:
+                handle = fh.handle
+                handle.enable_read_cache(block_size=8192)
+                self.assertEqual(fh.read(100), data[:100])
+                self.assertEqual(fh.write(b'abc'), 3)
+                # Seek through file object, then write through its handle
+                fh.seek(10)
+                self.assertEqual(handle.write(b'xyz')[1], 3)
+                self.assertEqual(handle.tell64(), 13)
+                fh.seek(50000)
+                self.assertEqual(fh.write(b'def'), 3)
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(
+                    fh.read(), data[:10] + b'xyz' + data[13:100] + b'abc' +
+                    data[103:50000] + b'def' + data[50003:])
+        finally:
+            os.unlink(remote_filename)
+
+    def _require_extension(self, sftp, name):
+        if name not in sftp.extensions:
+            self.skipTest("Server does not support %s" % (name,))
+
+    def test_extensions_limits(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        self.assertIsInstance(sftp.extensions, dict)
+        self._require_extension(sftp, 'limits@openssh.com')
+        limits = sftp.limits()
+        self.assertGreater(limits.max_packet_length, 0)
+        self.assertGreater(limits.max_read_length, 0)
+        self.assertGreater(limits.max_write_length, 0)
+
+    def test_copy_data(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        self._require_extension(sftp, 'copy-data')
+        _dir = os.path.dirname(__file__)
+        src = os.sep.join([_dir, 'remote_test_file'])
+        dst = os.sep.join([_dir, 'remote_test_file_copy'])
+        data = os.urandom(1024 * 1024)
+        with open(src, 'wb') as fh:
+            fh.write(data)
+        os.chmod(src, 0o640)
+        try:
+            self.assertEqual(sftp.copy_data(src, dst), 0)
+            with open(dst, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertEqual(stat.S_IMODE(os.stat(dst).st_mode), 0o640)
+            self.session.set_blocking(False)
+            self.assertEqual(sftp.copy_data(src, dst, source_offset=10, length=100,
+                                            dest_offset=5), 0)
+            self.session.set_blocking(True)
+            with open(dst, 'rb') as fh:
+                self.assertEqual(fh.read(), data[:5] + data[10:110] + data[105:])
+            self.assertRaises(SFTPProtocolError, sftp.copy_data, 'fakeyfakey', dst)
+        finally:
+            os.unlink(src)
+            if os.path.exists(dst):
+                os.unlink(dst)
+
+    def test_posix_rename_hardlink(self):
+        self.assertEqual(self._auth(), 0)
+        sftp = self.session.sftp_init()
+        self._require_extension(sftp, 'posix-rename@openssh.com')
+        self._require_extension(sftp, 'hardlink@openssh.com')
+        _dir = os.path.dirname(__file__)
+        src = os.sep.join([_dir, 'remote_test_file'])
+        link = os.sep.join([_dir, 'remote_test_file_link'])
+        dst = os.sep.join([_dir, 'remote_test_file_dst'])
+        with open(src, 'wb') as fh:
+            fh.write(b'src')
+        with open(dst, 'wb') as fh:
+            fh.write(b'dst')
+        try:
+            sftp.enable_attr_cache()
+            self.assertEqual(sftp.stat(src).filesize, 3)
+            self.assertEqual(sftp.hardlink(src, link), 0)
+            self.assertEqual(os.stat(src).st_ino, os.stat(link).st_ino)
+            # Existing destination replaced
+            self.assertEqual(sftp.posix_rename(link, dst), 0)
+            self.assertFalse(os.path.exists(link))
+            with open(dst, 'rb') as fh:
+                self.assertEqual(fh.read(), b'src')
+            self.assertRaises(SFTPProtocolError, sftp.hardlink, 'fakeyfakey', link)
+            self.assertRaises(SFTPProtocolError, sftp.posix_rename, 'fakeyfakey', link)
+        finally:
+            for path in (src, link, dst):
+                if os.path.exists(path):
+                    os.unlink(path)
+
     def test_readdir_failure(self):
         self.assertEqual(self._auth(), 0)
         sftp = self.session.sftp_init()
@@ -327,3 +1011,201 @@ class SFTPTestCase(SSH2TestCase):
             pass
         else:
             raise Exception("Should have raised SFTPProtocolError")
+
+    def _make_local_file(self, filename, size):
+        data = os.urandom(size)
+        with open(filename, 'wb') as fh:
+            fh.write(data)
+        return data
+
+    def test_get_file(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        data = self._make_local_file(remote_filename, 3 * 1024 * 1024 + 7)
+        try:
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, chunk_size=65536), len(data))
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_get_file_mmap(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        data = self._make_local_file(remote_filename, 3 * 1024 * 1024 + 7)
+        # Existing longer local file is resized
+        with open(local_filename, 'wb') as fh:
+            fh.write(b'a' * (4 * 1024 * 1024))
+        try:
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, chunk_size=65536,
+                                           mmap=True), len(data))
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.session.set_blocking(False)
+            with open(local_filename, 'w+b') as fh:
+                self.assertEqual(sftp.get_file(remote_filename, fh, mmap=True), len(data))
+                fh.seek(0)
+                self.assertEqual(fh.read(), data)
+            self.session.set_blocking(True)
+            with open(remote_filename, 'wb'):
+                pass
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, mmap=True), 0)
+            self.assertEqual(os.stat(local_filename).st_size, 0)
+            self.assertRaises(ValueError, sftp.get_file, remote_filename, local_filename,
+                              mmap=True, resume=True)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_transfer_hash(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        data = self._make_local_file(local_filename, 3 * 1024 * 1024 + 7)
+        digest = hashlib.sha256(data).digest()
+        try:
+            self.assertEqual(sftp.put_file(local_filename, remote_filename, chunk_size=65536,
+                                           hash='sha256'), (len(data), digest))
+            os.unlink(local_filename)
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, hash='sha256'),
+                             (len(data), digest))
+            self.session.set_blocking(False)
+            md5 = hashlib.md5()
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, chunk_size=65536,
+                                           mmap=True, hash=md5),
+                             (len(data), hashlib.md5(data).digest()))
+            self.session.set_blocking(True)
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_put_file(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        data = self._make_local_file(local_filename, 3 * 1024 * 1024 + 7)
+        os.chmod(local_filename, 0o640)
+        try:
+            self.assertEqual(sftp.put_file(local_filename, remote_filename), len(data))
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertEqual(stat.S_IMODE(os.stat(remote_filename).st_mode), 0o640)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_get_file_resume(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        journal_filename = local_filename + TRANSFER_JOURNAL_SUFFIX
+        range_size = 1024 * 1024
+        data = self._make_local_file(remote_filename, 4 * range_size + 7)
+        attrs = sftp.stat(remote_filename)
+        # Interrupted transfer with first three ranges completed and second range
+        # since changed locally.
+        with open(local_filename, 'wb') as fh:
+            fh.write(data[:3 * range_size])
+            fh.seek(range_size + 10)
+            fh.write(b'changed')
+        journal = TransferJournal(journal_filename, attrs.filesize, attrs.mtime, range_size)
+        journal.begin()
+        for offset in range(0, 3 * range_size, range_size):
+            journal.record(offset, range_size, zlib.crc32(data[offset:offset + range_size]))
+        journal.close()
+        try:
+            transferred = sftp.get_file(remote_filename, local_filename, resume=True,
+                                        checksums=True, journal_range_size=range_size)
+            self.assertEqual(transferred, len(data) - 2 * range_size)
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertFalse(os.path.exists(journal_filename))
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_get_file_resume_remote_changed(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        journal_filename = local_filename + TRANSFER_JOURNAL_SUFFIX
+        data = self._make_local_file(remote_filename, 1024 * 1024)
+        with open(local_filename, 'wb') as fh:
+            fh.write(b'\0' * len(data))
+        journal = TransferJournal(journal_filename, len(data) + 1, 0)
+        journal.begin()
+        journal.record(0, len(data))
+        journal.close()
+        try:
+            self.assertEqual(sftp.get_file(remote_filename, local_filename, resume=True), len(data))
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_put_file_resume(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        journal_filename = local_filename + TRANSFER_JOURNAL_SUFFIX
+        range_size = 1024 * 1024
+        data = self._make_local_file(local_filename, 4 * range_size + 7)
+        # Remote file is shorter than the journal claims - second range must be re-sent
+        with open(remote_filename, 'wb') as fh:
+            fh.write(data[:range_size + 10])
+        journal = TransferJournal(journal_filename, len(data), int(os.stat(local_filename).st_mtime),
+                                  range_size)
+        journal.begin()
+        journal.record(0, range_size)
+        journal.record(range_size, range_size,
+                       dest_mtime=int(os.stat(remote_filename).st_mtime))
+        journal.close()
+        try:
+            transferred = sftp.put_file(local_filename, remote_filename, resume=True,
+                                        journal_range_size=range_size)
+            self.assertEqual(transferred, len(data) - range_size)
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertFalse(os.path.exists(journal_filename))
+            # Remote file replaced since journal was written - upload restarts
+            with open(remote_filename, 'wb') as fh:
+                fh.write(os.urandom(len(data)))
+            journal.begin()
+            journal.record(0, range_size, dest_mtime=int(os.stat(remote_filename).st_mtime) - 10)
+            journal.close()
+            transferred = sftp.put_file(local_filename, remote_filename, resume=True,
+                                        journal_range_size=range_size)
+            self.assertEqual(transferred, len(data))
+            with open(remote_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
+
+    def test_get_file_nonblocking(self):
+        self._auth()
+        sftp = self.session.sftp_init()
+        remote_filename = os.sep.join([os.path.dirname(__file__), 'remote_test_file'])
+        local_filename = os.sep.join([os.path.dirname(__file__), 'local_test_file'])
+        data = self._make_local_file(remote_filename, 1024 * 1024 + 7)
+        self.session.set_blocking(False)
+        try:
+            self.assertEqual(sftp.get_file(remote_filename, local_filename), len(data))
+            with open(local_filename, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_filename)
+            os.unlink(local_filename)
@@ -0,0 +1,120 @@
+import os
+import shutil
+
+from ssh2.exceptions import SFTPError
+from ssh2.sftp_sync import mirror, MIRROR_DOWNLOAD, MirrorResult
+
+from .base_test import SSH2TestCase
+
+
+class SFTPSyncTestCase(SSH2TestCase):
+
+    def setUp(self):
+        super(SFTPSyncTestCase, self).setUp()
+        self.assertEqual(self._auth(), 0)
+        self.sftp = self.session.sftp_init()
+        _dir = os.path.dirname(__file__)
+        self.src_dir = os.path.join(_dir, 'mirror_src')
+        self.dst_dir = os.path.join(_dir, 'mirror_dst')
+        for _dir in (self.src_dir, self.dst_dir):
+            shutil.rmtree(_dir, ignore_errors=True)
+        os.makedirs(os.path.join(self.src_dir, 'sub_dir', 'sub_sub_dir'))
+        os.mkdir(os.path.join(self.src_dir, 'empty_dir'))
+        for _path, size in (('file', 10), ('sub_dir/file', 1000),
+                            ('sub_dir/sub_sub_dir/file', 300000)):
+            with open(os.path.join(self.src_dir, _path), 'wb') as fh:
+                fh.write(os.urandom(size))
+        os.chmod(os.path.join(self.src_dir, 'sub_dir', 'file'), 0o600)
+
+    def tearDown(self):
+        for _dir in (self.src_dir, self.dst_dir):
+            for dirpath, _, _ in os.walk(_dir):
+                os.chmod(dirpath, 0o700)
+            shutil.rmtree(_dir, ignore_errors=True)
+        super(SFTPSyncTestCase, self).tearDown()
+
+    def _tree(self, root):
+        tree = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            for _name in dirnames:
+                _path = os.path.join(dirpath, _name)
+                tree[os.path.relpath(_path, root)] = os.stat(_path).st_mode
+            for _name in filenames:
+                _path = os.path.join(dirpath, _name)
+                _stat = os.stat(_path)
+                with open(_path, 'rb') as fh:
+                    tree[os.path.relpath(_path, root)] = (
+                        fh.read(), _stat.st_mode, int(_stat.st_mtime))
+        return tree
+
+    def test_mirror_upload(self):
+        result = mirror(self.sftp, self.src_dir, self.dst_dir)
+        self.assertIsInstance(result, MirrorResult)
+        self.assertEqual(sorted(result.transferred), sorted(
+            ['file', 'sub_dir/file', 'sub_dir/sub_sub_dir/file']))
+        self.assertEqual(sorted(result.created), sorted(
+            ['', 'empty_dir', 'sub_dir', 'sub_dir/sub_sub_dir']))
+        self.assertEqual(result.bytes_transferred, 301010)
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+        # Nothing to do
+        result = mirror(self.sftp, self.src_dir, self.dst_dir)
+        self.assertEqual(result.transferred, [])
+        self.assertEqual(result.updated, [])
+        self.assertEqual(result.created, [])
+        self.assertEqual(result.unchanged, 3)
+        self.assertEqual(result.bytes_transferred, 0)
+
+    def test_mirror_changes_delete_checksum(self):
+        mirror(self.sftp, self.src_dir, self.dst_dir)
+        with open(os.path.join(self.src_dir, 'sub_dir', 'file'), 'wb') as fh:
+            fh.write(b'changed')
+        os.chmod(os.path.join(self.src_dir, 'file'), 0o640)
+        # Same contents, different modification time
+        os.utime(os.path.join(self.dst_dir, 'sub_dir', 'sub_sub_dir', 'file'),
+                 (1, 1))
+        with open(os.path.join(self.dst_dir, 'extra_file'), 'wb') as fh:
+            fh.write(b'extra')
+        os.makedirs(os.path.join(self.dst_dir, 'extra_dir', 'extra_sub_dir'))
+        result = mirror(self.sftp, self.src_dir, self.dst_dir, delete=True,
+                        checksum=True)
+        self.assertEqual(result.transferred, ['sub_dir/file'])
+        self.assertEqual(sorted(result.updated),
+                         ['file', 'sub_dir/sub_sub_dir/file'])
+        self.assertEqual(sorted(result.deleted), sorted(
+            ['extra_file', 'extra_dir', 'extra_dir/extra_sub_dir']))
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+
+    def test_mirror_download(self):
+        # Remote source directory to local destination
+        mirror(self.sftp, self.dst_dir, self.src_dir, direction=MIRROR_DOWNLOAD)
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+        os.unlink(os.path.join(self.src_dir, 'file'))
+        result = mirror(self.sftp, self.dst_dir, self.src_dir,
+                        direction=MIRROR_DOWNLOAD, delete=True)
+        self.assertEqual(result.deleted, ['file'])
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+
+    def test_mirror_type_conflict(self):
+        mirror(self.sftp, self.src_dir, self.dst_dir)
+        os.rmdir(os.path.join(self.src_dir, 'empty_dir'))
+        with open(os.path.join(self.src_dir, 'empty_dir'), 'wb') as fh:
+            fh.write(b'now a file')
+        self.assertRaises(SFTPError, mirror, self.sftp, self.src_dir,
+                          self.dst_dir)
+        result = mirror(self.sftp, self.src_dir, self.dst_dir, delete=True)
+        self.assertEqual(result.transferred, ['empty_dir'])
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+
+    def test_mirror_read_only_dirs_undecodable_names(self):
+        with open(os.path.join(self.src_dir.encode(), b'sub_dir', b'file_\xff'), 'wb') as fh:
+            fh.write(b'data')
+        os.chmod(os.path.join(self.src_dir, 'sub_dir', 'sub_sub_dir'), 0o500)
+        os.chmod(os.path.join(self.src_dir, 'sub_dir'), 0o555)
+        result = mirror(self.sftp, self.src_dir, self.dst_dir)
+        self.assertIn('sub_dir/file_\udcff', result.transferred)
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
+        for dirpath, _, _ in os.walk(self.dst_dir):
+            os.chmod(dirpath, 0o700)
+        shutil.rmtree(self.dst_dir)
+        mirror(self.sftp, self.dst_dir, self.src_dir.encode(), direction=MIRROR_DOWNLOAD)
+        self.assertEqual(self._tree(self.src_dir), self._tree(self.dst_dir))
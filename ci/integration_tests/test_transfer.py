@@ -0,0 +1,139 @@
+import hashlib
+import os
+import socket
+
+from ssh2.exceptions import SFTPProtocolError, SCPProtocolError
+from ssh2.session import Session
+from ssh2.transfer import copy, scp_copy, copy_channel
+
+from .base_test import SSH2TestCase
+
+
+class TransferTestCase(SSH2TestCase):
+
+    def setUp(self):
+        super(TransferTestCase, self).setUp()
+        self.assertEqual(self._auth(), 0)
+        self.dst_sock = socket.create_connection((self.host, self.port))
+        self.dst_session = Session()
+        self.dst_session.handshake(self.dst_sock)
+        self.dst_session.userauth_publickey_fromfile(self.user, self.user_key)
+        _dir = os.path.dirname(__file__)
+        self.src_file = os.path.join(_dir, 'transfer_src')
+        self.dst_file = os.path.join(_dir, 'transfer_dst')
+        self.data = os.urandom(5 * 1024 * 1024 + 123)
+        with open(self.src_file, 'wb') as fh:
+            fh.write(self.data)
+        os.chmod(self.src_file, 0o640)
+
+    def tearDown(self):
+        for _file in (self.src_file, self.dst_file):
+            try:
+                os.unlink(_file)
+            except OSError:
+                pass
+        self.dst_session.disconnect()
+        self.dst_sock.close()
+        super(TransferTestCase, self).tearDown()
+
+    def _dst_data(self):
+        with open(self.dst_file, 'rb') as fh:
+            return fh.read()
+
+    def test_copy(self):
+        src_sftp = self.session.sftp_init()
+        dst_sftp = self.dst_session.sftp_init()
+        self.assertEqual(copy(src_sftp, self.src_file, dst_sftp, self.dst_file,
+                              chunk_size=65536),
+                         len(self.data))
+        self.assertEqual(self._dst_data(), self.data)
+        self.assertEqual(os.stat(self.dst_file).st_mode & 0o777, 0o640)
+        self.assertTrue(self.session.get_blocking())
+        self.assertTrue(self.dst_session.get_blocking())
+        # Same session, existing destination truncated
+        self.assertEqual(copy(src_sftp, self.src_file, src_sftp, self.dst_file),
+                         len(self.data))
+        self.assertEqual(self._dst_data(), self.data)
+
+    def test_copy_hash(self):
+        src_sftp = self.session.sftp_init()
+        dst_sftp = self.dst_session.sftp_init()
+        digest = hashlib.sha256(self.data).digest()
+        self.assertEqual(copy(src_sftp, self.src_file, dst_sftp, self.dst_file,
+                              chunk_size=65536, hash='sha256'),
+                         (len(self.data), digest))
+        self.assertEqual(self._dst_data(), self.data)
+        md5 = hashlib.md5()
+        self.assertEqual(scp_copy(self.session, self.src_file,
+                                  self.dst_session, self.dst_file, hash=md5),
+                         (len(self.data), md5.digest()))
+        self.assertEqual(md5.digest(), hashlib.md5(self.data).digest())
+        src_chan = self.session.open_session()
+        src_chan.execute('cat %s' % (self.src_file,))
+        dst_chan = self.dst_session.open_session()
+        dst_chan.execute('cat > %s' % (self.dst_file,))
+        self.assertEqual(copy_channel(src_chan, dst_chan, length=1000,
+                                      hash='sha1'),
+                         (1000, hashlib.sha1(self.data[:1000]).digest()))
+
+    def test_copy_nonblocking(self):
+        src_sftp = self.session.sftp_init()
+        dst_sftp = self.dst_session.sftp_init()
+        self.dst_session.set_blocking(False)
+        self.assertEqual(copy(src_sftp, self.src_file, dst_sftp, self.dst_file),
+                         len(self.data))
+        self.assertFalse(self.dst_session.get_blocking())
+        self.dst_session.set_blocking(True)
+        self.assertEqual(self._dst_data(), self.data)
+
+    def test_copy_failure(self):
+        src_sftp = self.session.sftp_init()
+        dst_sftp = self.dst_session.sftp_init()
+        self.assertRaises(SFTPProtocolError, copy, src_sftp, 'fakeyfakey',
+                          dst_sftp, self.dst_file)
+        self.assertFalse(os.path.exists(self.dst_file))
+
+    def test_scp_copy(self):
+        self.assertEqual(scp_copy(self.session, self.src_file,
+                                  self.dst_session, self.dst_file),
+                         len(self.data))
+        self.assertEqual(self._dst_data(), self.data)
+        self.assertEqual(os.stat(self.dst_file).st_mode & 0o777, 0o640)
+        self.assertRaises(SCPProtocolError, scp_copy, self.session,
+                          'fakeyfakey', self.dst_session, self.dst_file)
+
+    def test_scp_copy_repeated(self):
+        # Both remote SCP commands complete, leaving sessions usable
+        for _ in range(3):
+            self.assertEqual(scp_copy(self.session, self.src_file,
+                                      self.dst_session, self.dst_file),
+                             len(self.data))
+        self.assertEqual(self._dst_data(), self.data)
+        chan = self.session.open_session()
+        chan.execute('echo me')
+        self.assertEqual(chan.read(), (3, b'me\n'))
+
+    def test_copy_channel(self):
+        src_chan = self.session.open_session()
+        src_chan.execute('cat %s' % (self.src_file,))
+        src_chan.send_eof()
+        dst_chan = self.dst_session.open_session()
+        dst_chan.execute('cat > %s' % (self.dst_file,))
+        self.assertEqual(copy_channel(src_chan, dst_chan), len(self.data))
+        dst_chan.send_eof()
+        dst_chan.wait_eof()
+        dst_chan.close()
+        dst_chan.wait_closed()
+        self.assertEqual(self._dst_data(), self.data)
+
+    def test_copy_channel_length(self):
+        src_chan = self.session.open_session()
+        src_chan.execute('cat %s' % (self.src_file,))
+        dst_chan = self.dst_session.open_session()
+        dst_chan.execute('cat > %s' % (self.dst_file,))
+        self.assertEqual(copy_channel(src_chan, dst_chan, length=1000), 1000)
+        dst_chan.send_eof()
+        dst_chan.wait_eof()
+        dst_chan.close()
+        dst_chan.wait_closed()
+        self.assertEqual(self._dst_data(), self.data[:1000])
@@ -36,14 +36,10 @@ def main():
     s.handshake(sock)
     s.agent_auth(args.user)
     fileinfo = os.stat(args.source)
-    chan = s.scp_send64(args.destination, fileinfo.st_mode & 0o777, fileinfo.st_size,
-                        fileinfo.st_mtime, fileinfo.st_atime)
     print("Starting SCP of local file %s to remote %s:%s" % (
         args.source, args.host, args.destination))
     now = datetime.now()
-    with open(args.source, 'rb') as local_fh:
-        for data in local_fh:
-            chan.write(data)
+    s.scp_put_file(args.source, args.destination)
     taken = datetime.now() - now
     rate = (fileinfo.st_size / (1024000.0)) / taken.total_seconds()
     print("Finished writing remote file in %s, transfer rate %s MB/s" % (
@@ -4,6 +4,7 @@
 {
     "distutils": {
         "depends": [
+            "ssh2/ext/fileio.h",
             "ssh2/ext/find_eol.h"
         ],
         "extra_compile_args": [
@@ -1154,6 +1155,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <sys/stat.h>
 #include "libssh2.h"
 #include "ext/find_eol.h"
+#include "ext/fileio.h"
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1562,10 +1564,12 @@ struct __pyx_obj_4ssh2_7session_Session {
   int _sock;
   PyObject *sock;
   PyObject *_kbd_callback;
+  PyObject *tunnels;
+  PyObject *transport;
 };
 
 
-/* "session.pxd":26
+/* "session.pxd":34
  * 
  * 
  * cdef class MethodType:             # <<<<<<<<<<<<<<
@@ -1578,7 +1582,7 @@ struct __pyx_obj_4ssh2_7session_MethodType {
 };
 
 
-/* "session.pxd":30
+/* "session.pxd":38
  * 
  * 
  * cdef class FlagType:             # <<<<<<<<<<<<<<
@@ -5714,7 +5718,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(struct __pyx_obj_4ssh2_7session_MethodType), __PYX_GET_STRUCT_ALIGNMENT_3_1_4(struct __pyx_obj_4ssh2_7session_MethodType),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_4); if (!__pyx_mstate->__pyx_ptype_4ssh2_7session_MethodType) __PYX_ERR(2, 26, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_4); if (!__pyx_mstate->__pyx_ptype_4ssh2_7session_MethodType) __PYX_ERR(2, 34, __pyx_L1_error)
   __pyx_mstate->__pyx_ptype_4ssh2_7session_FlagType = __Pyx_ImportType_3_1_4(__pyx_t_1, "ssh2.session", "FlagType",
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
   sizeof(struct __pyx_obj_4ssh2_7session_FlagType), __PYX_GET_STRUCT_ALIGNMENT_3_1_4(struct __pyx_obj_4ssh2_7session_FlagType),
@@ -5723,7 +5727,7 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   #else
   sizeof(struct __pyx_obj_4ssh2_7session_FlagType), __PYX_GET_STRUCT_ALIGNMENT_3_1_4(struct __pyx_obj_4ssh2_7session_FlagType),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_1_4); if (!__pyx_mstate->__pyx_ptype_4ssh2_7session_FlagType) __PYX_ERR(2, 30, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_1_4); if (!__pyx_mstate->__pyx_ptype_4ssh2_7session_FlagType) __PYX_ERR(2, 38, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_1 = PyImport_ImportModule("ssh2.pkey"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -28,6 +28,10 @@ cdef extern from "libssh2_sftp.h" nogil:
         unsigned long uid, gid
         unsigned long permissions
         unsigned long atime, mtime
+    # SFTP open types
+    enum:
+        LIBSSH2_SFTP_OPENFILE
+        LIBSSH2_SFTP_OPENDIR
     # SFTP statvfs flag bits
     enum:
         LIBSSH2_SFTP_ST_RDONLY
@@ -54,6 +58,9 @@ cdef extern from "libssh2_sftp.h" nogil:
         LIBSSH2_SFTP_S_IFREG        # regular
         LIBSSH2_SFTP_S_IFLNK        # symbolic link
         LIBSSH2_SFTP_S_IFSOCK       # socket
+    # SFTP status codes
+    enum:
+        LIBSSH2_FX_OP_UNSUPPORTED
     # SFTP File Transfer Flags
     enum:
         LIBSSH2_FXF_READ
@@ -145,6 +152,11 @@ cdef extern from "libssh2_sftp.h" nogil:
     int libssh2_sftp_rename(LIBSSH2_SFTP *sftp,
                             const char *sourcefile,
                             const char *destfile)
+    int libssh2_sftp_posix_rename_ex(LIBSSH2_SFTP *sftp,
+                                     const char *source_filename,
+                                     size_t source_filename_len,
+                                     const char *dest_filename,
+                                     size_t dest_filename_len)
     int libssh2_sftp_unlink_ex(LIBSSH2_SFTP *sftp,
                                const char *filename,
                                unsigned int filename_len)
@@ -99,6 +99,9 @@ cdef extern from "libssh2.h" nogil:
     void **libssh2_session_abstract(LIBSSH2_SESSION *session)
     void *libssh2_session_callback_set(LIBSSH2_SESSION *session,
                                        int cbtype, void *callback)
+    enum:
+        LIBSSH2_CALLBACK_SEND
+        LIBSSH2_CALLBACK_RECV
     int libssh2_session_banner_set(LIBSSH2_SESSION *session,
                                    const char *banner)
     int libssh2_banner_set(LIBSSH2_SESSION *session,
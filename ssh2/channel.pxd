@@ -24,3 +24,7 @@ cdef object PyChannel(c_ssh2.LIBSSH2_CHANNEL *channel, Session session)
 cdef class Channel:
     cdef c_ssh2.LIBSSH2_CHANNEL *_channel
     cdef Session _session
+
+
+cdef int _channel_call(c_ssh2.LIBSSH2_CHANNEL *channel, int step) nogil
+cdef int _channel_finish(Channel channel) except -1
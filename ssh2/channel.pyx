@@ -19,7 +19,7 @@ from libc.stdlib cimport malloc, free
 from .exceptions import ChannelError
 
 from .session cimport Session
-from .utils cimport to_bytes, handle_error_codes
+from .utils cimport to_bytes, handle_error_codes, wait_session
 from . cimport c_ssh2
 from . cimport sftp
 from . cimport error_codes
@@ -31,6 +31,32 @@ cdef object PyChannel(c_ssh2.LIBSSH2_CHANNEL *channel, Session session):
     return _channel
 
 
+cdef int _channel_call(c_ssh2.LIBSSH2_CHANNEL *channel, int step) nogil:
+    if step == 0:
+        return c_ssh2.libssh2_channel_send_eof(channel)
+    elif step == 1:
+        return c_ssh2.libssh2_channel_wait_eof(channel)
+    elif step == 2:
+        return c_ssh2.libssh2_channel_close(channel)
+    return c_ssh2.libssh2_channel_wait_closed(channel)
+
+
+cdef int _channel_finish(Channel channel) except -1:
+    """Send EOF on channel and wait for remote end to acknowledge it and
+    close, waiting on socket in non-blocking mode."""
+    cdef int step
+    cdef int rc
+    for step in range(4):
+        while True:
+            with nogil:
+                rc = _channel_call(channel._channel, step)
+            if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                break
+            wait_session(channel._session)
+        handle_error_codes(rc)
+    return 0
+
+
 cdef class Channel:
 
     def __cinit__(self, Session session):
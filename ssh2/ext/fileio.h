@@ -0,0 +1,76 @@
+/*
+This file is part of ssh2-python.
+Copyright (C) 2017-2020 Panos Kittenis
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation, version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+
+/* Portable local file descriptor I/O used by native transfer loops.
+   All functions may be called without the GIL. */
+
+#ifndef SSH2_EXT_FILEIO_H
+#define SSH2_EXT_FILEIO_H
+
+#include <errno.h>
+#include <stddef.h>
+
+#ifdef _WIN32
+#include <io.h>
+typedef long long ssh2_off_t;
+#define _ssh2_read(fd, buf, n) _read(fd, buf, (unsigned int)(n))
+#define _ssh2_write(fd, buf, n) _write(fd, buf, (unsigned int)(n))
+#define _ssh2_lseek(fd, off) _lseeki64(fd, off, SEEK_SET)
+#else
+#include <sys/types.h>
+#include <unistd.h>
+typedef long long ssh2_off_t;
+#define _ssh2_read(fd, buf, n) read(fd, buf, n)
+#define _ssh2_write(fd, buf, n) write(fd, buf, n)
+#define _ssh2_lseek(fd, off) lseek(fd, (off_t)(off), SEEK_SET)
+#endif
+
+/* Read up to n bytes from fd, retrying on EINTR.
+   Returns bytes read, 0 on EOF or -1 with errno set. */
+static inline long long fd_read(int fd, char *buf, size_t n) {
+    long long rc;
+    do {
+        rc = _ssh2_read(fd, buf, n);
+    } while (rc < 0 && errno == EINTR);
+    return rc;
+}
+
+/* Write all n bytes to fd, retrying on EINTR and short writes.
+   Returns 0 on success or -1 with errno set. */
+static inline int fd_write_all(int fd, const char *buf, size_t n) {
+    long long rc;
+    while (n > 0) {
+        rc = _ssh2_write(fd, buf, n);
+        if (rc < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            return -1;
+        }
+        buf += rc;
+        n -= (size_t)rc;
+    }
+    return 0;
+}
+
+/* Seek fd to absolute offset. Returns 0 on success or -1 with errno set. */
+static inline int fd_seek(int fd, ssh2_off_t offset) {
+    return _ssh2_lseek(fd, offset) < 0 ? -1 : 0;
+}
+
+#endif /* SSH2_EXT_FILEIO_H */
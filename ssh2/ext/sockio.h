@@ -0,0 +1,216 @@
+/*
+This file is part of ssh2-python.
+Copyright (C) 2017-2020 Panos Kittenis
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation, version 2.1.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+
+/* Portable non-blocking socket I/O used by native forwarding relays.
+   All functions may be called without the GIL. */
+
+#ifndef SSH2_EXT_SOCKIO_H
+#define SSH2_EXT_SOCKIO_H
+
+#include <stddef.h>
+#include <string.h>
+
+#ifdef _WIN32
+#include <winsock2.h>
+#include <ws2tcpip.h>
+typedef SOCKET ssh2_socket_t;
+#define SSH2_INVALID_SOCKET INVALID_SOCKET
+#define _ssh2_poll WSAPoll
+#define _ssh2_sock_close closesocket
+#define _ssh2_sock_errno WSAGetLastError()
+#define _SSH2_SHUT_WR SD_SEND
+#else
+#include <errno.h>
+#include <fcntl.h>
+#include <poll.h>
+#include <unistd.h>
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <sys/socket.h>
+typedef int ssh2_socket_t;
+#define SSH2_INVALID_SOCKET (-1)
+#define _ssh2_poll poll
+#define _ssh2_sock_close close
+#define _ssh2_sock_errno errno
+#define _SSH2_SHUT_WR SHUT_WR
+#endif
+
+#define SSH2_POLLIN POLLIN
+#define SSH2_POLLOUT POLLOUT
+#define SSH2_POLLERR (POLLERR | POLLHUP)
+
+typedef struct pollfd ssh2_pollfd;
+
+/* Whether last socket call failed only because it would block. */
+static inline int sock_would_block(void) {
+    int err = _ssh2_sock_errno;
+#ifdef _WIN32
+    return err == WSAEWOULDBLOCK || err == WSAEINPROGRESS;
+#else
+    return err == EAGAIN || err == EWOULDBLOCK || err == EINTR ||
+        err == EINPROGRESS;
+#endif
+}
+
+static inline int sock_set_nonblocking(ssh2_socket_t sock) {
+#ifdef _WIN32
+    u_long mode = 1;
+    return ioctlsocket(sock, FIONBIO, &mode) == 0 ? 0 : -1;
+#else
+    int flags = fcntl(sock, F_GETFL, 0);
+    if (flags < 0) {
+        return -1;
+    }
+    return fcntl(sock, F_SETFL, flags | O_NONBLOCK) < 0 ? -1 : 0;
+#endif
+}
+
+/* Accept connection on listening socket, writing peer's numeric host and
+   port. Returns SSH2_INVALID_SOCKET on errors or no pending connection. */
+static inline ssh2_socket_t sock_accept(ssh2_socket_t sock, char *host,
+                                        size_t host_len, int *port) {
+    struct sockaddr_storage addr;
+    socklen_t addr_len = sizeof(addr);
+    ssh2_socket_t conn = accept(sock, (struct sockaddr *)&addr, &addr_len);
+    host[0] = '\0';
+    *port = 0;
+    if (conn == SSH2_INVALID_SOCKET) {
+        return conn;
+    }
+    if (addr.ss_family == AF_INET) {
+        struct sockaddr_in *in4 = (struct sockaddr_in *)&addr;
+        inet_ntop(AF_INET, &in4->sin_addr, host, (socklen_t)host_len);
+        *port = ntohs(in4->sin_port);
+    } else if (addr.ss_family == AF_INET6) {
+        struct sockaddr_in6 *in6 = (struct sockaddr_in6 *)&addr;
+        inet_ntop(AF_INET6, &in6->sin6_addr, host, (socklen_t)host_len);
+        *port = ntohs(in6->sin6_port);
+    }
+    if (sock_set_nonblocking(conn) != 0) {
+        _ssh2_sock_close(conn);
+        return SSH2_INVALID_SOCKET;
+    }
+    return conn;
+}
+
+/* Start non-blocking connection to numeric IPv4 or IPv6 host and port.
+   Returns SSH2_INVALID_SOCKET on errors. Use sock_connected to check for
+   completion. */
+static inline ssh2_socket_t sock_connect(const char *host, int port) {
+    struct sockaddr_storage addr;
+    socklen_t addr_len;
+    ssh2_socket_t sock;
+    memset(&addr, 0, sizeof(addr));
+    if (inet_pton(AF_INET, host,
+                  &((struct sockaddr_in *)&addr)->sin_addr) == 1) {
+        struct sockaddr_in *in4 = (struct sockaddr_in *)&addr;
+        in4->sin_family = AF_INET;
+        in4->sin_port = htons((unsigned short)port);
+        addr_len = sizeof(struct sockaddr_in);
+    } else if (inet_pton(AF_INET6, host,
+                         &((struct sockaddr_in6 *)&addr)->sin6_addr) == 1) {
+        struct sockaddr_in6 *in6 = (struct sockaddr_in6 *)&addr;
+        in6->sin6_family = AF_INET6;
+        in6->sin6_port = htons((unsigned short)port);
+        addr_len = sizeof(struct sockaddr_in6);
+    } else {
+        return SSH2_INVALID_SOCKET;
+    }
+    sock = socket(addr.ss_family, SOCK_STREAM, 0);
+    if (sock == SSH2_INVALID_SOCKET) {
+        return sock;
+    }
+    if (sock_set_nonblocking(sock) != 0 ||
+        (connect(sock, (struct sockaddr *)&addr, addr_len) != 0 &&
+         !sock_would_block())) {
+        _ssh2_sock_close(sock);
+        return SSH2_INVALID_SOCKET;
+    }
+    return sock;
+}
+
+/* Whether connection started by sock_connect has completed. Returns 1 when
+   connected, 0 while still in progress and -1 if connecting failed. */
+static inline int sock_connected(ssh2_socket_t sock) {
+    ssh2_pollfd fd;
+    int err = 0;
+    socklen_t err_len = sizeof(err);
+    int rc;
+    fd.fd = sock;
+    fd.events = POLLOUT;
+    fd.revents = 0;
+    rc = _ssh2_poll(&fd, 1, 0);
+    if (rc < 0) {
+        return -1;
+    }
+    if (rc == 0) {
+        return 0;
+    }
+    if (getsockopt(sock, SOL_SOCKET, SO_ERROR, (char *)&err, &err_len) != 0 ||
+        err != 0) {
+        return -1;
+    }
+    return 1;
+}
+
+/* Receive up to n bytes. Returns bytes received, 0 on end of file, -1 on
+   errors and -2 if it would block. */
+static inline long long sock_recv(ssh2_socket_t sock, char *buf, size_t n) {
+    long long rc = recv(sock, buf, (int)n, 0);
+    if (rc < 0) {
+        return sock_would_block() ? -2 : -1;
+    }
+    return rc;
+}
+
+/* Send up to n bytes. Returns bytes sent, -1 on errors and -2 if it would
+   block. */
+static inline long long sock_send(ssh2_socket_t sock, const char *buf,
+                                  size_t n) {
+#ifdef MSG_NOSIGNAL
+    long long rc = send(sock, buf, (int)n, MSG_NOSIGNAL);
+#else
+    long long rc = send(sock, buf, (int)n, 0);
+#endif
+    if (rc < 0) {
+        return sock_would_block() ? -2 : -1;
+    }
+    return rc;
+}
+
+/* Write numeric host of IPv4 or, if ipv6 is set, IPv6 address in network
+   byte order. Returns 0 on success and -1 on errors. */
+static inline int sock_ntop(int ipv6, const void *addr, char *host,
+                            size_t host_len) {
+    return inet_ntop(ipv6 ? AF_INET6 : AF_INET, (void *)addr, host,
+                     (socklen_t)host_len) == NULL ? -1 : 0;
+}
+
+static inline int sock_shutdown_wr(ssh2_socket_t sock) {
+    return shutdown(sock, _SSH2_SHUT_WR);
+}
+
+static inline int sock_close(ssh2_socket_t sock) {
+    return _ssh2_sock_close(sock);
+}
+
+static inline int sock_poll(ssh2_pollfd *fds, size_t n, int timeout) {
+    return _ssh2_poll(fds, (unsigned long)n, timeout);
+}
+
+#endif /* SSH2_EXT_SOCKIO_H */
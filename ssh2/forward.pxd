@@ -0,0 +1,155 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+from cpython.pythread cimport PyThread_type_lock
+
+from .session cimport Session
+
+from . cimport c_ssh2
+
+
+cdef extern from "ext/sockio.h" nogil:
+    ctypedef int ssh2_socket_t
+    ssh2_socket_t SSH2_INVALID_SOCKET
+    short SSH2_POLLIN
+    short SSH2_POLLOUT
+    short SSH2_POLLERR
+    ctypedef struct ssh2_pollfd:
+        ssh2_socket_t fd
+        short events
+        short revents
+    int sock_set_nonblocking(ssh2_socket_t sock)
+    ssh2_socket_t sock_accept(ssh2_socket_t sock, char *host,
+                              size_t host_len, int *port)
+    ssh2_socket_t sock_connect(const char *host, int port)
+    int sock_connected(ssh2_socket_t sock)
+    long long sock_recv(ssh2_socket_t sock, char *buf, size_t n)
+    long long sock_send(ssh2_socket_t sock, const char *buf, size_t n)
+    int sock_shutdown_wr(ssh2_socket_t sock)
+    int sock_close(ssh2_socket_t sock)
+    int sock_poll(ssh2_pollfd *fds, size_t n, int timeout)
+    int sock_ntop(int ipv6, const void *addr, char *host, size_t host_len)
+
+
+cdef enum _conn_state:
+    _CONN_OPENING
+    _CONN_CONNECTING
+    _CONN_RELAY
+    _CONN_CLOSING
+    _CONN_SOCKS_GREETING
+    _CONN_SOCKS_REQUEST
+    _CONN_SOCKS_REJECT
+
+
+cdef struct _relay_conn:
+    _conn_state state
+    ssh2_socket_t sock
+    c_ssh2.LIBSSH2_CHANNEL *channel
+    char *to_channel
+    size_t to_channel_len
+    size_t to_channel_pos
+    char *to_socket
+    size_t to_socket_len
+    size_t to_socket_pos
+    bint socket_eof
+    bint channel_eof
+    bint eof_sent
+    bint socket_shut
+    bint close_sent
+    char host[64]
+    int port
+    char target[256]
+    int target_port
+    _relay_conn *next
+
+
+cdef class Forward:
+    cdef Session _session
+    cdef object _thread
+    cdef bint _stopping
+    cdef bint _blocking
+    cdef bint _poll_session
+    cdef size_t _buf_size
+    cdef _relay_conn **_conns
+    cdef size_t _num_conns
+    cdef size_t _max_conns
+    cdef ssh2_pollfd *_pollfds
+    cdef _relay_conn *_opening
+    cdef readonly unsigned long long bytes_sent
+    cdef readonly unsigned long long bytes_received
+    cdef readonly unsigned long long connections
+    cdef readonly unsigned long long failed_connections
+    cdef readonly int last_error
+
+    cdef _start(self)
+    cdef _relay_conn *_alloc_conn(self, ssh2_socket_t sock) noexcept nogil
+    cdef int _append_conn(self, _relay_conn *conn) noexcept nogil
+    cdef _relay_conn *_add_conn(self, ssh2_socket_t sock) noexcept nogil
+    cdef void _free_conn(self, _relay_conn *conn) noexcept nogil
+    cdef int _step_conn(self, _relay_conn *conn) noexcept nogil
+    cdef size_t _poll_set(self, int *timeout) noexcept nogil
+    cdef int _run_loop(self) noexcept nogil
+    cdef void _close_all(self) noexcept nogil
+    cdef ssh2_socket_t _listen_fd(self) noexcept nogil
+    cdef int _accept(self) noexcept nogil
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil
+
+
+cdef class _ListenForward(Forward):
+    cdef object _listen_sock
+    cdef ssh2_socket_t _listen
+
+    cdef _listen_on(self, sock)
+
+
+cdef class LocalForward(_ListenForward):
+    cdef bytes _remote_host
+    cdef const char *_c_remote_host
+    cdef readonly int remote_port
+    cdef readonly object bind_address
+    cdef readonly int bind_port
+
+
+cdef class RemoteForward(Forward):
+    cdef c_ssh2.LIBSSH2_LISTENER *_listener
+    cdef bytes _local_host
+    cdef const char *_c_local_host
+    cdef readonly int local_port
+    cdef readonly object remote_host
+    cdef readonly int remote_port
+
+
+cdef class StreamLocalForward(_ListenForward):
+    cdef bytes _remote_path
+    cdef const char *_c_remote_path
+    cdef readonly object local_path
+
+
+cdef class TunnelForward(Forward):
+    cdef PyThread_type_lock _lock
+    cdef _relay_conn *_pending
+    cdef object _wake_r
+    cdef object _wake_w
+    cdef ssh2_socket_t _wake
+
+
+cdef class DynamicForward(_ListenForward):
+    cdef readonly object bind_address
+    cdef readonly int bind_port
+    cdef readonly size_t max_channels
+    cdef readonly tuple pool
+
+    cdef int _socks_step(self, _relay_conn *conn) noexcept nogil
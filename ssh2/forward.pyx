@@ -0,0 +1,1077 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Native port forwarding relays.
+
+Each forward runs its accept and relay loop in a background thread with the
+GIL released, multiplexing all tunnelled connections over the session's
+socket with ``poll``. Data is only read from one side of a connection when
+the other side can take it - local sockets are not read while the channel's
+send window is exhausted or previously read data is still queued, and
+channels are not read while data is still waiting to be written to their
+local socket - so a slow peer on either side throttles its own connection
+only."""
+
+import os
+import socket
+import threading
+
+from cpython.pythread cimport PyThread_allocate_lock, \
+    PyThread_acquire_lock, PyThread_release_lock, PyThread_free_lock, \
+    WAIT_LOCK
+from libc.stdlib cimport calloc, malloc, realloc, free
+from libc.string cimport memcpy, memmove, memset, strncpy
+
+from .exceptions import ChannelError
+
+from .session cimport Session
+from .utils cimport to_bytes, handle_error_codes, wait_session
+
+from . cimport c_ssh2
+from . cimport error_codes
+
+
+cdef enum:
+    # Milliseconds to wait for socket activity before checking for stop
+    # requests
+    _POLL_TIMEOUT = 100
+
+
+cdef enum:
+    # Longest SOCKS5 client message - a CONNECT request with a 255 byte
+    # domain name
+    _SOCKS_MAX_MESSAGE = 262
+    _SOCKS_VERSION = 5
+    _SOCKS_CMD_CONNECT = 1
+    _SOCKS_ATYP_IPV4 = 1
+    _SOCKS_ATYP_DOMAIN = 3
+    _SOCKS_ATYP_IPV6 = 4
+    _SOCKS_AUTH_NONE = 0
+    _SOCKS_AUTH_UNACCEPTABLE = 0xff
+    _SOCKS_REP_SUCCESS = 0
+    _SOCKS_REP_FAILURE = 1
+    _SOCKS_REP_CMD_UNSUPPORTED = 7
+    _SOCKS_REP_ATYP_UNSUPPORTED = 8
+
+
+cdef enum _step_result:
+    _STEP_IDLE
+    _STEP_PROGRESS
+    _STEP_DONE
+    _STEP_FATAL
+
+
+cdef inline bint _is_fatal(int rc) noexcept nogil:
+    return rc == error_codes._LIBSSH2_ERROR_SOCKET_SEND \
+        or rc == error_codes._LIBSSH2_ERROR_SOCKET_RECV \
+        or rc == error_codes._LIBSSH2_ERROR_SOCKET_DISCONNECT
+
+
+cdef inline void _socks_reply(_relay_conn *conn,
+                              unsigned char rep) noexcept nogil:
+    """Queue SOCKS5 reply to a request. The bound address is not known to
+    the client side of a tunnel and is sent as all zeros."""
+    memset(conn.to_socket, 0, 10)
+    conn.to_socket[0] = _SOCKS_VERSION
+    conn.to_socket[1] = rep
+    conn.to_socket[3] = _SOCKS_ATYP_IPV4
+    conn.to_socket_len = 10
+    conn.to_socket_pos = 0
+
+
+cdef inline void _consume(_relay_conn *conn, size_t size) noexcept nogil:
+    """Remove parsed message from start of data read from local socket."""
+    memmove(conn.to_channel, conn.to_channel + size,
+            conn.to_channel_len - size)
+    conn.to_channel_len -= size
+
+
+cdef class Forward:
+    """Base class for native forwards.
+
+    Forwards are created by ``ssh2.session.Session`` forwarding functions and
+    are started on creation. The session is used in non-blocking mode by
+    the forward's thread until the forward is stopped and must not be used
+    by other threads in the meantime.
+
+    Counters are updated live by the forwarding thread:
+
+    * ``bytes_sent`` - bytes written to channels from local sockets.
+    * ``bytes_received`` - bytes read from channels.
+    * ``connections`` - number of connections accepted.
+    * ``failed_connections`` - connections for which a channel could not be
+      opened.
+    * ``last_error`` - last libssh2 error code seen, if any.
+    """
+
+    def __cinit__(self, Session session, *args, **kwargs):
+        self._session = session
+        self._thread = None
+        self._stopping = False
+        self._blocking = True
+        self._poll_session = False
+        self._buf_size = c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT
+        self._conns = NULL
+        self._num_conns = 0
+        self._max_conns = 0
+        self._opening = NULL
+        self._pollfds = <ssh2_pollfd *>malloc(sizeof(ssh2_pollfd) * 2)
+        if self._pollfds is NULL:
+            raise MemoryError
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.connections = 0
+        self.failed_connections = 0
+        self.last_error = 0
+
+    def __dealloc__(self):
+        cdef size_t i
+        for i in range(self._num_conns):
+            self._free_conn(self._conns[i])
+        free(self._conns)
+        free(self._pollfds)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def running(self):
+        """Whether the forwarding thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def active_connections(self):
+        """Number of currently open tunnelled connections."""
+        return self._num_conns
+
+    def stop(self):
+        """Stop forwarding and wait for the forwarding thread to exit.
+
+        Open tunnelled connections are closed and the session's blocking
+        mode restored. Calling on a stopped forward has no effect."""
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    cdef _start(self):
+        self._blocking = self._session.get_blocking()
+        self._session.set_blocking(False)
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        with nogil:
+            self._run_loop()
+            self._close_all()
+        self._session.set_blocking(self._blocking)
+
+    cdef _relay_conn *_alloc_conn(self, ssh2_socket_t sock) noexcept nogil:
+        """Allocate connection for socket in opening state. Does not use
+        forward's state so may be called from any thread."""
+        cdef _relay_conn *conn = <_relay_conn *>calloc(1, sizeof(_relay_conn))
+        if conn is NULL:
+            return NULL
+        conn.to_channel = <char *>malloc(sizeof(char) * self._buf_size)
+        conn.to_socket = <char *>malloc(sizeof(char) * self._buf_size)
+        if conn.to_channel is NULL or conn.to_socket is NULL:
+            free(conn.to_channel)
+            free(conn.to_socket)
+            free(conn)
+            return NULL
+        conn.sock = sock
+        conn.state = _CONN_OPENING
+        return conn
+
+    cdef int _append_conn(self, _relay_conn *conn) noexcept nogil:
+        cdef size_t max_conns
+        cdef _relay_conn **conns
+        cdef ssh2_pollfd *pollfds
+        if self._num_conns == self._max_conns:
+            max_conns = self._max_conns * 2 if self._max_conns else 16
+            conns = <_relay_conn **>realloc(
+                self._conns, sizeof(_relay_conn *) * max_conns)
+            if conns is NULL:
+                return -1
+            self._conns = conns
+            pollfds = <ssh2_pollfd *>realloc(
+                self._pollfds, sizeof(ssh2_pollfd) * (max_conns + 2))
+            if pollfds is NULL:
+                return -1
+            self._pollfds = pollfds
+            self._max_conns = max_conns
+        self._conns[self._num_conns] = conn
+        self._num_conns += 1
+        return 0
+
+    cdef _relay_conn *_add_conn(self, ssh2_socket_t sock) noexcept nogil:
+        """Allocate and add connection for socket. Socket is not closed on
+        failure."""
+        cdef _relay_conn *conn = self._alloc_conn(sock)
+        if conn is NULL:
+            return NULL
+        if self._append_conn(conn) != 0:
+            conn.sock = SSH2_INVALID_SOCKET
+            self._free_conn(conn)
+            return NULL
+        return conn
+
+    cdef void _free_conn(self, _relay_conn *conn) noexcept nogil:
+        if conn.sock != SSH2_INVALID_SOCKET:
+            sock_close(conn.sock)
+        free(conn.to_channel)
+        free(conn.to_socket)
+        free(conn)
+
+    cdef int _step_conn(self, _relay_conn *conn) noexcept nogil:
+        """Move as much data as possible for one connection without
+        blocking."""
+        cdef int result = _STEP_IDLE
+        cdef int rc = 0
+        cdef ssize_t n
+        cdef long long sent
+        if conn.state == _CONN_OPENING:
+            # Channel open state is kept per session by libssh2 - open one
+            # channel at a time
+            if self._opening is not NULL and self._opening != conn:
+                return _STEP_IDLE
+            self._opening = conn
+            rc = self._open_channel(conn)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return _STEP_IDLE
+            self._opening = NULL
+            if rc != 0:
+                self.failed_connections += 1
+                self.last_error = rc
+                if _is_fatal(rc):
+                    return _STEP_FATAL
+                conn.state = _CONN_CLOSING
+            else:
+                conn.state = _CONN_RELAY
+            result = _STEP_PROGRESS
+        elif conn.state == _CONN_CONNECTING:
+            rc = sock_connected(conn.sock)
+            if rc == 0:
+                return _STEP_IDLE
+            if rc < 0:
+                self.failed_connections += 1
+                conn.state = _CONN_CLOSING
+            else:
+                conn.state = _CONN_RELAY
+            rc = 0
+            result = _STEP_PROGRESS
+        if conn.state == _CONN_RELAY:
+            # Local socket to channel
+            if conn.to_channel_pos == conn.to_channel_len \
+                    and not conn.socket_eof \
+                    and c_ssh2.libssh2_channel_window_write(conn.channel) > 0:
+                sent = sock_recv(conn.sock, conn.to_channel, self._buf_size)
+                if sent > 0:
+                    conn.to_channel_len = sent
+                    conn.to_channel_pos = 0
+                    result = _STEP_PROGRESS
+                elif sent == 0:
+                    conn.socket_eof = True
+                    result = _STEP_PROGRESS
+                elif sent == -1:
+                    conn.state = _CONN_CLOSING
+            if conn.state == _CONN_RELAY \
+                    and conn.to_channel_pos < conn.to_channel_len:
+                n = c_ssh2.libssh2_channel_write_ex(
+                    conn.channel, 0, conn.to_channel + conn.to_channel_pos,
+                    conn.to_channel_len - conn.to_channel_pos)
+                if n > 0:
+                    conn.to_channel_pos += n
+                    self.bytes_sent += n
+                    result = _STEP_PROGRESS
+                elif n != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    rc = <int>n
+            if conn.state == _CONN_RELAY and rc == 0 and conn.socket_eof \
+                    and not conn.eof_sent \
+                    and conn.to_channel_pos == conn.to_channel_len:
+                rc = c_ssh2.libssh2_channel_send_eof(conn.channel)
+                if rc == 0:
+                    conn.eof_sent = True
+                    result = _STEP_PROGRESS
+                elif rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    rc = 0
+            # Channel to local socket
+            if conn.state == _CONN_RELAY and rc == 0 \
+                    and conn.to_socket_pos == conn.to_socket_len \
+                    and not conn.channel_eof:
+                n = c_ssh2.libssh2_channel_read_ex(
+                    conn.channel, 0, conn.to_socket, self._buf_size)
+                if n > 0:
+                    conn.to_socket_len = n
+                    conn.to_socket_pos = 0
+                    self.bytes_received += n
+                    result = _STEP_PROGRESS
+                elif n == 0 or n == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    if c_ssh2.libssh2_channel_eof(conn.channel):
+                        conn.channel_eof = True
+                        result = _STEP_PROGRESS
+                else:
+                    rc = <int>n
+            if conn.state == _CONN_RELAY \
+                    and conn.to_socket_pos < conn.to_socket_len:
+                sent = sock_send(conn.sock, conn.to_socket + conn.to_socket_pos,
+                                 conn.to_socket_len - conn.to_socket_pos)
+                if sent > 0:
+                    conn.to_socket_pos += sent
+                    result = _STEP_PROGRESS
+                elif sent == -1:
+                    conn.state = _CONN_CLOSING
+            if conn.state == _CONN_RELAY and conn.channel_eof \
+                    and not conn.socket_shut \
+                    and conn.to_socket_pos == conn.to_socket_len:
+                sock_shutdown_wr(conn.sock)
+                conn.socket_shut = True
+                result = _STEP_PROGRESS
+            if rc != 0:
+                # Errors after remote end of file are the channel having
+                # been closed under us and are not reported
+                if not conn.channel_eof:
+                    self.last_error = rc
+                if _is_fatal(rc):
+                    return _STEP_FATAL
+                conn.state = _CONN_CLOSING
+            if conn.state == _CONN_RELAY and conn.eof_sent \
+                    and conn.socket_shut:
+                conn.state = _CONN_CLOSING
+            if conn.state == _CONN_CLOSING:
+                result = _STEP_PROGRESS
+        if conn.state == _CONN_CLOSING:
+            if conn.channel is not NULL:
+                if not conn.close_sent:
+                    rc = c_ssh2.libssh2_channel_close(conn.channel)
+                    if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                        return result
+                    conn.close_sent = True
+                rc = c_ssh2.libssh2_channel_free(conn.channel)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    return result
+                conn.channel = NULL
+            return _STEP_DONE
+        return result
+
+    cdef size_t _poll_set(self, int *timeout) noexcept nogil:
+        """Fill poll set with the events each connection is waiting on.
+
+        The session's socket is only polled for reading when some connection
+        will read from it, leaving data destined for connections whose local
+        socket is not keeping up in the kernel's buffers."""
+        cdef size_t i
+        cdef size_t nfds = 1
+        cdef short events
+        cdef bint session_in = self._poll_session
+        cdef _relay_conn *conn
+        cdef ssh2_socket_t listen_fd = self._listen_fd()
+        cdef int directions = c_ssh2.libssh2_session_block_directions(
+            self._session._session)
+        self._pollfds[0].fd = self._session._sock
+        self._pollfds[0].events = 0
+        self._pollfds[0].revents = 0
+        if directions & c_ssh2.LIBSSH2_SESSION_BLOCK_OUTBOUND:
+            self._pollfds[0].events |= SSH2_POLLOUT
+        if listen_fd != SSH2_INVALID_SOCKET:
+            self._pollfds[nfds].fd = listen_fd
+            self._pollfds[nfds].events = SSH2_POLLIN
+            self._pollfds[nfds].revents = 0
+            nfds += 1
+        for i in range(self._num_conns):
+            conn = self._conns[i]
+            events = 0
+            if conn.state == _CONN_CONNECTING:
+                events = SSH2_POLLOUT
+            elif conn.state == _CONN_SOCKS_GREETING \
+                    or conn.state == _CONN_SOCKS_REQUEST \
+                    or conn.state == _CONN_SOCKS_REJECT:
+                # Negotiating with local client - send reply before reading
+                # any more
+                if conn.to_socket_pos < conn.to_socket_len:
+                    events = SSH2_POLLOUT
+                else:
+                    events = SSH2_POLLIN
+            elif conn.state != _CONN_RELAY:
+                session_in = True
+            else:
+                if conn.to_channel_pos < conn.to_channel_len:
+                    session_in = True
+                elif not conn.socket_eof:
+                    if c_ssh2.libssh2_channel_window_write(conn.channel) > 0:
+                        events |= SSH2_POLLIN
+                    else:
+                        # Waiting on window adjust from server
+                        session_in = True
+                if conn.to_socket_pos < conn.to_socket_len:
+                    events |= SSH2_POLLOUT
+                elif not conn.channel_eof:
+                    session_in = True
+                    # Data already read from the socket by another channel's
+                    # call does not make the socket readable again
+                    if c_ssh2.libssh2_poll_channel_read(conn.channel, 0) \
+                            or c_ssh2.libssh2_channel_eof(conn.channel):
+                        timeout[0] = 0
+            if events:
+                self._pollfds[nfds].fd = conn.sock
+                self._pollfds[nfds].events = events
+                self._pollfds[nfds].revents = 0
+                nfds += 1
+        if session_in:
+            self._pollfds[0].events |= SSH2_POLLIN
+        return nfds
+
+    cdef int _run_loop(self) noexcept nogil:
+        cdef size_t i
+        cdef size_t nfds
+        cdef int rc
+        cdef int timeout
+        cdef bint progressed
+        cdef _relay_conn *conn
+        while not self._stopping:
+            rc = self._accept()
+            if rc < 0:
+                return -1
+            progressed = rc > 0
+            i = 0
+            while i < self._num_conns:
+                conn = self._conns[i]
+                rc = self._step_conn(conn)
+                if rc == _STEP_FATAL:
+                    return -1
+                elif rc == _STEP_DONE:
+                    self._free_conn(conn)
+                    self._num_conns -= 1
+                    self._conns[i] = self._conns[self._num_conns]
+                    progressed = True
+                    continue
+                elif rc == _STEP_PROGRESS:
+                    progressed = True
+                i += 1
+            if progressed:
+                continue
+            timeout = _POLL_TIMEOUT
+            nfds = self._poll_set(&timeout)
+            if sock_poll(self._pollfds, nfds, timeout) > 0 \
+                    and self._pollfds[0].revents & SSH2_POLLERR:
+                self.last_error = \
+                    error_codes._LIBSSH2_ERROR_SOCKET_DISCONNECT
+                return -1
+        return 0
+
+    cdef void _close_all(self) noexcept nogil:
+        """Close all connections in blocking mode, completing any channel
+        open in progress so that the session is left usable."""
+        cdef size_t i
+        cdef _relay_conn *conn
+        c_ssh2.libssh2_session_set_blocking(self._session._session, 1)
+        for i in range(self._num_conns):
+            conn = self._conns[i]
+            if conn == self._opening:
+                self._opening = NULL
+                self._open_channel(conn)
+            if conn.channel is not NULL:
+                c_ssh2.libssh2_channel_close(conn.channel)
+                c_ssh2.libssh2_channel_free(conn.channel)
+                conn.channel = NULL
+            self._free_conn(conn)
+        self._num_conns = 0
+
+    cdef ssh2_socket_t _listen_fd(self) noexcept nogil:
+        """Local socket to poll for new connections, if any."""
+        return SSH2_INVALID_SOCKET
+
+    cdef int _accept(self) noexcept nogil:
+        """Accept pending connections. Returns number accepted or ``-1`` on
+        session errors."""
+        return 0
+
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil:
+        """Open channel for connection. Returns ``0`` on success or libssh2
+        error code."""
+        return error_codes._LIBSSH2_ERROR_BAD_USE
+
+
+cdef class _ListenForward(Forward):
+    """Base class for forwards accepting connections on a local listening
+    socket."""
+
+    cdef _listen_on(self, sock):
+        sock.listen(socket.SOMAXCONN)
+        sock.setblocking(False)
+        self._listen_sock = sock
+        self._listen = sock.fileno()
+
+    def stop(self):
+        """Stop forwarding and close listening socket."""
+        Forward.stop(self)
+        if self._listen_sock is not None:
+            self._listen_sock.close()
+            self._listen_sock = None
+            self._listen = SSH2_INVALID_SOCKET
+
+    cdef ssh2_socket_t _listen_fd(self) noexcept nogil:
+        return self._listen
+
+    cdef int _accept(self) noexcept nogil:
+        cdef ssh2_socket_t sock
+        cdef _relay_conn *conn
+        cdef char host[64]
+        cdef int port
+        cdef int accepted = 0
+        while True:
+            sock = sock_accept(self._listen, host, sizeof(host), &port)
+            if sock == SSH2_INVALID_SOCKET:
+                break
+            conn = self._add_conn(sock)
+            if conn is NULL:
+                sock_close(sock)
+                break
+            strncpy(conn.host, host, sizeof(conn.host) - 1)
+            conn.port = port
+            self.connections += 1
+            accepted += 1
+        return accepted
+
+
+cdef class LocalForward(_ListenForward):
+    """Local port forward - connections accepted on a local listening socket
+    are tunnelled to a host and port reachable by the SSH server."""
+
+    def __init__(self, Session session, bind_address, int bind_port,
+                 remote_host, int remote_port,
+                 size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        self._remote_host = to_bytes(remote_host)
+        self._c_remote_host = self._remote_host
+        self.remote_port = remote_port
+        self._buf_size = buffer_size
+        family, socktype, proto, _, address = socket.getaddrinfo(
+            bind_address, bind_port, 0, socket.SOCK_STREAM, 0,
+            socket.AI_PASSIVE)[0]
+        sock = socket.socket(family, socktype, proto)
+        try:
+            if os.name != 'nt':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(address)
+            self._listen_on(sock)
+        except Exception:
+            sock.close()
+            raise
+        self.bind_address, self.bind_port = sock.getsockname()[:2]
+
+    @property
+    def remote_host(self):
+        return self._remote_host.decode('utf-8')
+
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil:
+        conn.channel = c_ssh2.libssh2_channel_direct_tcpip_ex(
+            self._session._session, self._c_remote_host, self.remote_port,
+            conn.host, conn.port)
+        if conn.channel is NULL:
+            return c_ssh2.libssh2_session_last_errno(self._session._session)
+        return 0
+
+
+cdef class RemoteForward(Forward):
+    """Remote port forward - connections made to a port the SSH server
+    listens on are tunnelled to a host and port reachable locally."""
+
+    def __init__(self, Session session, int remote_port, local_host not None,
+                 int local_port, remote_host=None, int queue_maxsize=16,
+                 size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        cdef bytes b_remote_host = None if remote_host is None \
+            else to_bytes(remote_host)
+        cdef const char *_remote_host = NULL
+        cdef c_ssh2.LIBSSH2_LISTENER *listener
+        cdef int bound_port = 0
+        cdef int rc
+        # Connections are made natively so need a numeric address
+        self._local_host = to_bytes(socket.getaddrinfo(
+            local_host, local_port, 0, socket.SOCK_STREAM)[0][4][0])
+        self._c_local_host = self._local_host
+        self.local_port = local_port
+        self.remote_host = remote_host
+        self._buf_size = buffer_size
+        # Channels are accepted from the session
+        self._poll_session = True
+        if b_remote_host is not None:
+            _remote_host = b_remote_host
+        while True:
+            with nogil:
+                listener = c_ssh2.libssh2_channel_forward_listen_ex(
+                    session._session, _remote_host, remote_port,
+                    &bound_port, queue_maxsize)
+            if listener is not NULL:
+                break
+            rc = c_ssh2.libssh2_session_last_errno(session._session)
+            if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                handle_error_codes(rc)
+                raise ChannelError(rc)
+            wait_session(session)
+        self._listener = listener
+        self.remote_port = bound_port if bound_port else remote_port
+
+    @property
+    def local_host(self):
+        return self._local_host.decode('utf-8')
+
+    def stop(self):
+        """Stop forwarding and stop listening on the remote host."""
+        cdef int rc
+        Forward.stop(self)
+        if self._listener is NULL:
+            return
+        with nogil:
+            rc = c_ssh2.libssh2_channel_forward_cancel(self._listener)
+        while rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            wait_session(self._session)
+            with nogil:
+                rc = c_ssh2.libssh2_channel_forward_cancel(self._listener)
+        self._listener = NULL
+        handle_error_codes(rc)
+
+    cdef int _accept(self) noexcept nogil:
+        cdef c_ssh2.LIBSSH2_CHANNEL *channel
+        cdef ssh2_socket_t sock
+        cdef _relay_conn *conn
+        cdef int rc
+        cdef int accepted = 0
+        while True:
+            channel = c_ssh2.libssh2_channel_forward_accept(self._listener)
+            if channel is NULL:
+                rc = c_ssh2.libssh2_session_last_errno(self._session._session)
+                if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    self.last_error = rc
+                    if _is_fatal(rc):
+                        return -1
+                break
+            sock = sock_connect(self._c_local_host, self.local_port)
+            conn = self._add_conn(sock)
+            if conn is NULL:
+                if sock != SSH2_INVALID_SOCKET:
+                    sock_close(sock)
+                c_ssh2.libssh2_channel_free(channel)
+                break
+            conn.channel = channel
+            self.connections += 1
+            accepted += 1
+            if sock == SSH2_INVALID_SOCKET:
+                self.failed_connections += 1
+                conn.state = _CONN_CLOSING
+            else:
+                conn.state = _CONN_CONNECTING
+        return accepted
+
+
+cdef class StreamLocalForward(_ListenForward):
+    """Unix domain socket forward - connections accepted on a local unix
+    socket are tunnelled to a unix socket on the SSH server via
+    ``direct-streamlocal`` channels."""
+
+    def __init__(self, Session session, local_path not None,
+                 remote_path not None,
+                 size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        self._remote_path = to_bytes(remote_path)
+        self._c_remote_path = self._remote_path
+        self._buf_size = buffer_size
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(local_path)
+        except Exception:
+            sock.close()
+            raise
+        self.local_path = local_path
+        try:
+            self._listen_on(sock)
+        except Exception:
+            sock.close()
+            os.unlink(local_path)
+            raise
+
+    @property
+    def remote_path(self):
+        return self._remote_path.decode('utf-8')
+
+    def stop(self):
+        """Stop forwarding and remove local socket."""
+        cdef bint listening = self._listen_sock is not None
+        _ListenForward.stop(self)
+        if listening:
+            try:
+                os.unlink(self.local_path)
+            except OSError:
+                pass
+
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil:
+        conn.channel = c_ssh2.libssh2_channel_direct_streamlocal_ex(
+            self._session._session, self._c_remote_path, conn.host,
+            conn.port)
+        if conn.channel is NULL:
+            return c_ssh2.libssh2_session_last_errno(self._session._session)
+        return 0
+
+
+cdef class TunnelForward(Forward):
+    """Tunnels to hosts and ports reachable by the SSH server, each relayed
+    to one end of a local socket pair whose other end is returned by
+    :py:func:`open` - for example to run another session over, as done by
+    ``ssh2.session.Session.handshake_via``.
+
+    Created on first use by ``ssh2.session.Session.open_tunnel`` and
+    available as the session's ``tunnels`` attribute."""
+
+    def __cinit__(self, Session session, *args, **kwargs):
+        self._pending = NULL
+        self._lock = PyThread_allocate_lock()
+        if self._lock is NULL:
+            raise MemoryError
+
+    def __init__(self, Session session,
+                 size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        self._buf_size = buffer_size
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._wake = self._wake_r.fileno()
+
+    def __dealloc__(self):
+        cdef _relay_conn *conn
+        while self._pending is not NULL:
+            conn = self._pending
+            self._pending = conn.next
+            self._free_conn(conn)
+        if self._lock is not NULL:
+            PyThread_free_lock(self._lock)
+
+    def open(self, host not None, int port):
+        """Open tunnel to host and port.
+
+        :param host: Host to connect to from the SSH server.
+        :type host: str
+        :param port: Port to connect to from the SSH server.
+        :type port: int
+
+        :returns: Local end of tunnel in blocking mode. Closing it closes
+          the tunnel.
+        :rtype: :py:class:`socket.socket`"""
+        cdef bytes b_host = to_bytes(host)
+        cdef _relay_conn *conn
+        cdef bint stopped
+        if <size_t>len(b_host) >= sizeof(conn.target):
+            raise ValueError("Host name too long")
+        local, remote = socket.socketpair()
+        try:
+            remote.setblocking(False)
+        except Exception:
+            local.close()
+            remote.close()
+            raise
+        conn = self._alloc_conn(remote.fileno())
+        if conn is NULL:
+            local.close()
+            remote.close()
+            raise MemoryError
+        remote.detach()
+        strncpy(conn.target, b_host, sizeof(conn.target) - 1)
+        conn.target_port = port
+        with nogil:
+            PyThread_acquire_lock(self._lock, WAIT_LOCK)
+            stopped = self._stopping
+            if not stopped:
+                conn.next = self._pending
+                self._pending = conn
+            PyThread_release_lock(self._lock)
+        if stopped:
+            self._free_conn(conn)
+            local.close()
+            raise ValueError("Tunnel forwarding has been stopped")
+        try:
+            self._wake_w.send(b'\0')
+        except BlockingIOError:
+            # Already woken up
+            pass
+        return local
+
+    def stop(self):
+        """Stop forwarding, closing all tunnels."""
+        Forward.stop(self)
+        if self._wake_r is not None:
+            self._wake_r.close()
+            self._wake_w.close()
+            self._wake_r = self._wake_w = None
+            self._wake = SSH2_INVALID_SOCKET
+
+    cdef ssh2_socket_t _listen_fd(self) noexcept nogil:
+        return self._wake
+
+    cdef int _accept(self) noexcept nogil:
+        cdef char buf[64]
+        cdef _relay_conn *conn
+        cdef _relay_conn *pending
+        cdef int accepted = 0
+        while sock_recv(self._wake, buf, sizeof(buf)) > 0:
+            pass
+        PyThread_acquire_lock(self._lock, WAIT_LOCK)
+        pending = self._pending
+        self._pending = NULL
+        PyThread_release_lock(self._lock)
+        while pending is not NULL:
+            conn = pending
+            pending = conn.next
+            conn.next = NULL
+            if self._append_conn(conn) != 0:
+                self._free_conn(conn)
+                continue
+            self.connections += 1
+            accepted += 1
+        return accepted
+
+    cdef void _close_all(self) noexcept nogil:
+        cdef _relay_conn *conn
+        PyThread_acquire_lock(self._lock, WAIT_LOCK)
+        # No more tunnels can be added once the thread exits
+        self._stopping = True
+        while self._pending is not NULL:
+            conn = self._pending
+            self._pending = conn.next
+            self._free_conn(conn)
+        PyThread_release_lock(self._lock)
+        Forward._close_all(self)
+
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil:
+        conn.channel = c_ssh2.libssh2_channel_direct_tcpip_ex(
+            self._session._session, conn.target, conn.target_port,
+            b"127.0.0.1", 22)
+        if conn.channel is NULL:
+            return c_ssh2.libssh2_session_last_errno(self._session._session)
+        return 0
+
+
+cdef class DynamicForward(_ListenForward):
+    """Dynamic port forward - a SOCKS5 proxy on a local listening socket.
+    Each ``CONNECT`` request is tunnelled to its destination via a
+    ``direct-tcpip`` channel opened as soon as the request is received, with
+    any data the client sends ahead of the reply buffered until the channel
+    is open. Only the no authentication method is offered.
+
+    With ``max_channels`` set, no more connections than that are accepted
+    while as many are open on the session. Excess connections are accepted
+    by the forwards of the sessions in ``pool``, if any - each relaying its
+    own session's connections in its own thread - or wait in the listening
+    socket's backlog until a connection closes."""
+
+    def __init__(self, Session session, bind_address, int bind_port,
+                 size_t max_channels=0, pool=(),
+                 size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        cdef DynamicForward forward
+        cdef Session pool_session
+        cdef list forwards = []
+        if buffer_size < _SOCKS_MAX_MESSAGE:
+            raise ValueError("Buffer size must be at least %s bytes" % (
+                _SOCKS_MAX_MESSAGE,))
+        self._buf_size = buffer_size
+        self.max_channels = max_channels
+        for pool_session in pool:
+            forward = DynamicForward.__new__(DynamicForward, pool_session)
+            forward._buf_size = buffer_size
+            forward.max_channels = max_channels
+            forward.pool = ()
+            forwards.append(forward)
+        self.pool = tuple(forwards)
+        family, socktype, proto, _, address = socket.getaddrinfo(
+            bind_address, bind_port, 0, socket.SOCK_STREAM, 0,
+            socket.AI_PASSIVE)[0]
+        sock = socket.socket(family, socktype, proto)
+        try:
+            if os.name != 'nt':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(address)
+            self._listen_on(sock)
+        except Exception:
+            sock.close()
+            raise
+        self.bind_address, self.bind_port = sock.getsockname()[:2]
+        # Pooled forwards accept from the same socket, which is closed by
+        # this forward only
+        for forward in self.pool:
+            forward._listen = self._listen
+            forward.bind_address = self.bind_address
+            forward.bind_port = self.bind_port
+
+    cdef _start(self):
+        cdef DynamicForward forward
+        for forward in self.pool:
+            forward._start()
+        _ListenForward._start(self)
+
+    def stop(self):
+        """Stop forwarding on this and all pooled sessions and close
+        listening socket."""
+        cdef DynamicForward forward
+        for forward in self.pool:
+            forward.stop()
+        _ListenForward.stop(self)
+
+    cdef ssh2_socket_t _listen_fd(self) noexcept nogil:
+        if self.max_channels and self._num_conns >= self.max_channels:
+            return SSH2_INVALID_SOCKET
+        return self._listen
+
+    cdef int _accept(self) noexcept nogil:
+        cdef ssh2_socket_t sock
+        cdef _relay_conn *conn
+        cdef char host[64]
+        cdef int port
+        cdef int accepted = 0
+        while not self.max_channels or self._num_conns < self.max_channels:
+            sock = sock_accept(self._listen, host, sizeof(host), &port)
+            if sock == SSH2_INVALID_SOCKET:
+                break
+            conn = self._add_conn(sock)
+            if conn is NULL:
+                sock_close(sock)
+                break
+            strncpy(conn.host, host, sizeof(conn.host) - 1)
+            conn.port = port
+            conn.state = _CONN_SOCKS_GREETING
+            self.connections += 1
+            accepted += 1
+        return accepted
+
+    cdef int _step_conn(self, _relay_conn *conn) noexcept nogil:
+        cdef unsigned long long failed = self.failed_connections
+        cdef bint opening = conn.state == _CONN_OPENING
+        cdef int result
+        if conn.state == _CONN_SOCKS_GREETING \
+                or conn.state == _CONN_SOCKS_REQUEST \
+                or conn.state == _CONN_SOCKS_REJECT:
+            return self._socks_step(conn)
+        result = Forward._step_conn(self, conn)
+        if opening and result == _STEP_DONE \
+                and self.failed_connections != failed:
+            # Replace queued success reply and let client know
+            _socks_reply(conn, _SOCKS_REP_FAILURE)
+            conn.state = _CONN_SOCKS_REJECT
+            return _STEP_PROGRESS
+        return result
+
+    cdef int _socks_step(self, _relay_conn *conn) noexcept nogil:
+        """Read SOCKS5 greeting and request from local client and queue
+        replies. Received data is accumulated in the connection's
+        ``to_channel`` buffer, where anything following the request is left
+        to be written to the channel once open."""
+        cdef int result = _STEP_IDLE
+        cdef unsigned char *buf = <unsigned char *>conn.to_channel
+        cdef unsigned char method
+        cdef long long n
+        cdef size_t size
+        cdef size_t i
+        if conn.to_socket_pos < conn.to_socket_len:
+            n = sock_send(conn.sock, conn.to_socket + conn.to_socket_pos,
+                          conn.to_socket_len - conn.to_socket_pos)
+            if n == -1:
+                return _STEP_DONE
+            elif n > 0:
+                conn.to_socket_pos += n
+                result = _STEP_PROGRESS
+            if conn.to_socket_pos < conn.to_socket_len:
+                return result
+        if conn.state == _CONN_SOCKS_REJECT:
+            conn.state = _CONN_CLOSING
+            return _STEP_DONE
+        if conn.to_channel_len == self._buf_size:
+            # Message longer than any valid one
+            return _STEP_DONE
+        n = sock_recv(conn.sock, conn.to_channel + conn.to_channel_len,
+                      self._buf_size - conn.to_channel_len)
+        if n == 0 or n == -1:
+            return _STEP_DONE
+        elif n > 0:
+            conn.to_channel_len += n
+            result = _STEP_PROGRESS
+        if conn.state == _CONN_SOCKS_GREETING:
+            # VER NMETHODS METHODS
+            if conn.to_channel_len < 2:
+                return result
+            if buf[0] != _SOCKS_VERSION:
+                return _STEP_DONE
+            size = 2 + buf[1]
+            if conn.to_channel_len < size:
+                return result
+            method = _SOCKS_AUTH_UNACCEPTABLE
+            for i in range(2, size):
+                if buf[i] == _SOCKS_AUTH_NONE:
+                    method = _SOCKS_AUTH_NONE
+                    break
+            _consume(conn, size)
+            conn.to_socket[0] = _SOCKS_VERSION
+            conn.to_socket[1] = method
+            conn.to_socket_len = 2
+            conn.to_socket_pos = 0
+            if method == _SOCKS_AUTH_UNACCEPTABLE:
+                conn.state = _CONN_SOCKS_REJECT
+            else:
+                conn.state = _CONN_SOCKS_REQUEST
+            # Request is parsed after reply is sent
+            return _STEP_PROGRESS
+        # VER CMD RSV ATYP DST.ADDR DST.PORT
+        if conn.to_channel_len < 5:
+            return result
+        if buf[0] != _SOCKS_VERSION:
+            return _STEP_DONE
+        if buf[3] == _SOCKS_ATYP_IPV4:
+            size = 10
+        elif buf[3] == _SOCKS_ATYP_IPV6:
+            size = 22
+        elif buf[3] == _SOCKS_ATYP_DOMAIN:
+            size = 7 + buf[4]
+        else:
+            _socks_reply(conn, _SOCKS_REP_ATYP_UNSUPPORTED)
+            conn.state = _CONN_SOCKS_REJECT
+            return _STEP_PROGRESS
+        if conn.to_channel_len < size:
+            return result
+        if buf[1] != _SOCKS_CMD_CONNECT:
+            _socks_reply(conn, _SOCKS_REP_CMD_UNSUPPORTED)
+            conn.state = _CONN_SOCKS_REJECT
+            return _STEP_PROGRESS
+        if buf[3] == _SOCKS_ATYP_DOMAIN:
+            memcpy(conn.target, buf + 5, buf[4])
+            conn.target[buf[4]] = 0
+        elif sock_ntop(buf[3] == _SOCKS_ATYP_IPV6, buf + 4, conn.target,
+                       sizeof(conn.target)) != 0:
+            _socks_reply(conn, _SOCKS_REP_FAILURE)
+            conn.state = _CONN_SOCKS_REJECT
+            return _STEP_PROGRESS
+        conn.target_port = (buf[size - 2] << 8) | buf[size - 1]
+        _consume(conn, size)
+        conn.to_channel_pos = 0
+        # Sent by relay once channel is open, before any channel data
+        _socks_reply(conn, _SOCKS_REP_SUCCESS)
+        conn.state = _CONN_OPENING
+        return _STEP_PROGRESS
+
+    cdef int _open_channel(self, _relay_conn *conn) noexcept nogil:
+        conn.channel = c_ssh2.libssh2_channel_direct_tcpip_ex(
+            self._session._session, conn.target, conn.target_port,
+            conn.host, conn.port)
+        if conn.channel is NULL:
+            return c_ssh2.libssh2_session_last_errno(self._session._session)
+        return 0
@@ -21,6 +21,14 @@ cdef class Session:
     cdef int _sock
     cdef readonly object sock
     cdef readonly object _kbd_callback
+    cdef readonly object tunnels
+    cdef readonly object transport
+
+
+cdef int _scp_write(Session session, c_ssh2.LIBSSH2_CHANNEL *channel,
+                    bytes data) except -1
+cdef int _scp_read_ack(Session session,
+                       c_ssh2.LIBSSH2_CHANNEL *channel) except -1
 
 
 cdef class MethodType:
@@ -14,21 +14,29 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
+import os
+from stat import S_ISDIR, S_ISREG
+
 from cpython cimport PyObject_AsFileDescriptor
+from cpython.exc cimport PyErr_SetFromErrno
 from libc.stdlib cimport calloc, malloc, free
 from libc.string cimport memcpy
 from libc.time cimport time_t
 from cython.operator cimport dereference as c_dereference
 
 from .agent cimport PyAgent, agent_auth, agent_init, init_connect_agent
-from .channel cimport PyChannel
+from .channel cimport Channel, PyChannel, _channel_call, _channel_finish
 from .exceptions import SessionHostKeyError, KnownHostError, \
-    PublicKeyInitError, ChannelError
+    PublicKeyInitError, ChannelError, SCPProtocolError
+from .forward cimport LocalForward, RemoteForward, StreamLocalForward, \
+    TunnelForward, DynamicForward
 from .listener cimport PyListener
-from .sftp cimport PySFTP
+from .sftp cimport PySFTP, SFTPPool, _local_fd
 from .publickey cimport PyPublicKeySystem
-from .utils cimport to_bytes, to_str, to_str_len, handle_error_codes
+from .utils cimport to_bytes, to_str, to_str_len, handle_error_codes, \
+    wait_session, fd_read, fd_write_all
 from .statinfo cimport StatInfo
+from .transport cimport Transport, _transport_send, _transport_recv
 from .knownhost cimport PyKnownHost
 from .fileinfo cimport FileInfo
 
@@ -116,6 +124,573 @@ cdef void kbd_callback(const char *name, int name_len,
         responses[i].length = cur_buf_len
 
 
+cdef long long _fd_to_channel(Session session,
+                              c_ssh2.LIBSSH2_CHANNEL *channel, int fd,
+                              long long length, char *buf,
+                              size_t buf_size) except -1:
+    """Copy up to ``length`` bytes from ``fd`` to channel.
+
+    Returns bytes copied, less than ``length`` only on end of file."""
+    cdef long long total = 0
+    cdef long long n
+    cdef size_t written
+    cdef ssize_t rc
+    cdef size_t want
+    with nogil:
+        while total < length:
+            want = buf_size if <unsigned long long>(length - total) > buf_size \
+                else <size_t>(length - total)
+            n = fd_read(fd, buf, want)
+            if n < 0:
+                with gil:
+                    PyErr_SetFromErrno(OSError)
+            elif n == 0:
+                break
+            written = 0
+            while written < <size_t>n:
+                rc = c_ssh2.libssh2_channel_write_ex(
+                    channel, 0, buf + written, n - written)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    with gil:
+                        wait_session(session)
+                    continue
+                elif rc < 0:
+                    with gil:
+                        return handle_error_codes(rc)
+                written += rc
+            total += n
+    return total
+
+
+cdef long long _channel_to_fd(Session session,
+                              c_ssh2.LIBSSH2_CHANNEL *channel, int fd,
+                              long long length, char *buf,
+                              size_t buf_size) except -1:
+    """Copy up to ``length`` bytes from channel to ``fd``.
+
+    Returns bytes copied, less than ``length`` only on end of file."""
+    cdef long long total = 0
+    cdef ssize_t rc
+    cdef size_t want
+    with nogil:
+        while total < length:
+            want = buf_size if <unsigned long long>(length - total) > buf_size \
+                else <size_t>(length - total)
+            rc = c_ssh2.libssh2_channel_read_ex(channel, 0, buf, want)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                with gil:
+                    wait_session(session)
+                continue
+            elif rc < 0:
+                with gil:
+                    return handle_error_codes(rc)
+            elif rc == 0:
+                break
+            if fd_write_all(fd, buf, rc) != 0:
+                with gil:
+                    PyErr_SetFromErrno(OSError)
+            total += rc
+    return total
+
+
+cdef int _scp_write(Session session, c_ssh2.LIBSSH2_CHANNEL *channel,
+                    bytes data) except -1:
+    """Write SCP protocol message."""
+    cdef const char *_data = data
+    cdef size_t data_len = len(data)
+    cdef size_t written = 0
+    cdef ssize_t rc
+    while written < data_len:
+        with nogil:
+            rc = c_ssh2.libssh2_channel_write_ex(
+                channel, 0, _data + written, data_len - written)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            wait_session(session)
+            continue
+        handle_error_codes(rc)
+        written += rc
+    return 0
+
+
+cdef bytes _scp_read_line(Session session, c_ssh2.LIBSSH2_CHANNEL *channel):
+    """Read SCP protocol message from remote end.
+
+    Returns an empty bytes object on end of file, ``b'\0'`` for
+    acknowledgements or the message line without its new line. Raises
+    remote end's error message, if any."""
+    cdef bytearray line = bytearray()
+    cdef unsigned char c
+    cdef ssize_t rc
+    while True:
+        with nogil:
+            rc = c_ssh2.libssh2_channel_read_ex(channel, 0, <char *>&c, 1)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            wait_session(session)
+            continue
+        handle_error_codes(rc)
+        if rc == 0:
+            break
+        if c == 0 and len(line) == 0:
+            return b"\0"
+        if c == b'\n':
+            break
+        line.append(c)
+    if line[:1] in (b"\1", b"\2"):
+        raise SCPProtocolError("Remote SCP error - %s" % (
+            line[1:].decode('utf-8', 'replace'),))
+    return bytes(line)
+
+
+cdef int _scp_read_ack(Session session,
+                       c_ssh2.LIBSSH2_CHANNEL *channel) except -1:
+    """Read SCP acknowledgement from remote end, raising its error message
+    if it is not a NUL byte. End of file is taken as success."""
+    cdef bytes line = _scp_read_line(session, channel)
+    if line != b"\0" and line != b"":
+        raise SCPProtocolError("Unexpected SCP response - %r" % (line,))
+    return 0
+
+
+cdef Channel _scp_exec(Session session, bytes command):
+    """Open session channel and execute SCP command on it, waiting on socket
+    in non-blocking mode. Waits for remote SCP command's initial
+    acknowledgement when uploading."""
+    cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+    cdef Channel channel
+    cdef const char *_command = command
+    cdef unsigned int command_len = len(command)
+    cdef int rc
+    while True:
+        with nogil:
+            _channel = c_ssh2.libssh2_channel_open_session(session._session)
+        if _channel is not NULL:
+            break
+        rc = c_ssh2.libssh2_session_last_errno(session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise ChannelError(rc)
+        wait_session(session)
+    channel = PyChannel(_channel, session)
+    while True:
+        with nogil:
+            rc = c_ssh2.libssh2_channel_process_startup(
+                _channel, "exec", 4, _command, command_len)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            break
+        wait_session(session)
+    handle_error_codes(rc)
+    return channel
+
+
+cdef bytes _scp_name(bytes name):
+    """Check file name received from remote end is a single path component.
+    """
+    if not name or name == b"." or name == b".." or b"/" in name:
+        raise SCPProtocolError("Invalid file name %r received" % (name,))
+    return name
+
+
+cdef enum _scp_state:
+    _SCP_OPEN
+    _SCP_EXEC
+    _SCP_SEND
+    _SCP_ACK
+    _SCP_HEADER
+    _SCP_DATA
+    _SCP_FINISH
+    _SCP_DONE
+
+
+cdef bytes _shell_quote(bytes arg):
+    return b"'" + arg.replace(b"'", b"'\\''") + b"'"
+
+
+cdef class _SCPTransfer:
+    """Single file SCP transfer advanced one non-blocking step at a time, so
+    that many can be in flight on one session.
+
+    Runs the SCP protocol over its own exec channel rather than libssh2's
+    SCP functions, which keep their state per session and so can only
+    start one SCP channel at a time, waiting on the remote SCP command to
+    respond."""
+    cdef Session session
+    cdef bint upload
+    cdef object local
+    cdef bytes remote
+    cdef bint preserve_times
+    cdef readonly Py_ssize_t index
+    cdef long long size
+    cdef long long transferred
+    cdef int mode
+    cdef object mtime
+    cdef object atime
+    cdef int state
+    cdef int next_state
+    cdef int finish_step
+    cdef bint data_done
+    cdef list headers
+    cdef bytes out
+    cdef Py_ssize_t out_pos
+    cdef bytearray line
+    cdef int fd
+    cdef bint owned
+    cdef Channel channel
+    cdef char *buf
+    cdef size_t buf_size
+    cdef size_t buf_len
+    cdef size_t buf_pos
+
+    def __cinit__(self, Session session, bint upload, local, remote_path,
+                  Py_ssize_t index, bint preserve_times):
+        self.session = session
+        self.upload = upload
+        self.local = local
+        self.remote = to_bytes(remote_path)
+        self.index = index
+        self.preserve_times = preserve_times
+        self.fd = -1
+        self.state = _SCP_OPEN
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    cdef int _start(self, size_t buf_size) except -1:
+        self.buf = <char *>malloc(sizeof(char) * buf_size)
+        if self.buf is NULL:
+            raise MemoryError
+        self.buf_size = buf_size
+        return 0
+
+    cdef int _close(self) except -1:
+        """Free buffer and close owned local file."""
+        free(self.buf)
+        self.buf = NULL
+        if self.owned and self.fd >= 0:
+            os.close(self.fd)
+        self.fd = -1
+        return 0
+
+    cdef bint _open(self) except -1:
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef int rc
+        if self.upload and self.fd < 0:
+            self.fd, self.owned = _local_fd(self.local, os.O_RDONLY)
+            local_stat = os.fstat(self.fd)
+            self.size = max(
+                local_stat.st_size - os.lseek(self.fd, 0, os.SEEK_CUR), 0)
+            self.mode = local_stat.st_mode & 0o777
+            self.headers = []
+            if self.preserve_times:
+                self.headers.append(b"T%d 0 %d 0\n" % (
+                    local_stat.st_mtime, local_stat.st_atime))
+            self.headers.append(b"C%04o %d %s\n" % (
+                self.mode, self.size,
+                self.remote.rstrip(b'/').rpartition(b'/')[2]))
+        with nogil:
+            _channel = c_ssh2.libssh2_channel_open_session(
+                self.session._session)
+        if _channel is NULL:
+            rc = c_ssh2.libssh2_session_last_errno(self.session._session)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return False
+            return handle_error_codes(rc)
+        self.channel = PyChannel(_channel, self.session)
+        self.out = b"scp -%s%s %s" % (
+            b"p" if self.preserve_times else b"",
+            b"t" if self.upload else b"f", _shell_quote(self.remote))
+        self.state = _SCP_EXEC
+        return True
+
+    cdef bint _exec(self) except -1:
+        cdef const char *_command = self.out
+        cdef unsigned int command_len = len(self.out)
+        cdef int rc
+        with nogil:
+            rc = c_ssh2.libssh2_channel_process_startup(
+                self.channel._channel, "exec", 4, _command, command_len)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            return False
+        handle_error_codes(rc)
+        if self.upload:
+            self.state = _SCP_ACK
+        else:
+            self.out = b"\0"
+            self.out_pos = 0
+            self.state = _SCP_SEND
+            self.next_state = _SCP_HEADER
+        return True
+
+    cdef bint _send(self) except -1:
+        """Write pending protocol message, then move to next state."""
+        cdef const char *_out = self.out
+        cdef Py_ssize_t out_len = len(self.out)
+        cdef ssize_t rc
+        cdef bint progressed = False
+        while self.out_pos < out_len:
+            with nogil:
+                rc = c_ssh2.libssh2_channel_write_ex(
+                    self.channel._channel, 0, _out + self.out_pos,
+                    out_len - self.out_pos)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return progressed
+            handle_error_codes(rc)
+            self.out_pos += rc
+            progressed = True
+        self.state = self.next_state
+        return True
+
+    cdef object _recv_line(self):
+        """Read protocol message from remote end.
+
+        Returns ``None`` if more data is needed, an empty bytes object on
+        end of file, ``b'\\0'`` for acknowledgements or the message line
+        without its new line."""
+        cdef unsigned char c
+        cdef ssize_t rc
+        if self.line is None:
+            self.line = bytearray()
+        while True:
+            with nogil:
+                rc = c_ssh2.libssh2_channel_read_ex(
+                    self.channel._channel, 0, <char *>&c, 1)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return None
+            handle_error_codes(rc)
+            if rc == 0:
+                break
+            if c == 0 and len(self.line) == 0:
+                self.line = None
+                return b"\0"
+            if c == b'\n':
+                break
+            self.line.append(c)
+        line = bytes(self.line)
+        self.line = None
+        if line[:1] in (b"\1", b"\2"):
+            raise SCPProtocolError("Remote SCP error - %s" % (
+                line[1:].decode('utf-8', 'replace'),))
+        return line
+
+    cdef bint _ack(self) except -1:
+        line = self._recv_line()
+        if line is None:
+            return False
+        if line != b"\0" and not (line == b"" and self.data_done):
+            raise SCPProtocolError(
+                "Unexpected SCP response for %s - %r" % (self.remote, line))
+        if not self.upload:
+            self.out = b"\0"
+            self.out_pos = 0
+            self.state = _SCP_SEND
+            self.next_state = _SCP_FINISH
+        elif self.headers:
+            self.out = self.headers.pop(0)
+            self.out_pos = 0
+            self.state = _SCP_SEND
+            self.next_state = _SCP_ACK
+        elif not self.data_done:
+            self.state = _SCP_DATA
+        else:
+            self.state = _SCP_FINISH
+        return True
+
+    cdef bint _header(self) except -1:
+        line = self._recv_line()
+        if line is None:
+            return False
+        if line[:1] == b"T":
+            fields = line[1:].split()
+            self.mtime = int(fields[0])
+            self.atime = int(fields[2])
+            self.next_state = _SCP_HEADER
+        elif line[:1] == b"C":
+            fields = line[1:].split(None, 2)
+            self.mode = int(fields[0], 8) & 0o777
+            self.size = int(fields[1])
+            self.fd, self.owned = _local_fd(
+                self.local, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            self.next_state = _SCP_DATA
+        else:
+            raise SCPProtocolError(
+                "Unexpected SCP message for %s - %r" % (self.remote, line))
+        self.out = b"\0"
+        self.out_pos = 0
+        self.state = _SCP_SEND
+        return True
+
+    cdef bint _data(self) except -1:
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel = self.channel._channel
+        cdef long long remaining
+        cdef long long n = 0
+        cdef ssize_t rc = 0
+        cdef bint progressed = False
+        with nogil:
+            while self.transferred < self.size:
+                remaining = self.size - self.transferred
+                if self.upload:
+                    if self.buf_pos == self.buf_len:
+                        n = fd_read(
+                            self.fd, self.buf,
+                            self.buf_size if
+                            <unsigned long long>remaining > self.buf_size
+                            else <size_t>remaining)
+                        if n <= 0:
+                            break
+                        self.buf_len = n
+                        self.buf_pos = 0
+                    rc = c_ssh2.libssh2_channel_write_ex(
+                        _channel, 0, self.buf + self.buf_pos,
+                        self.buf_len - self.buf_pos)
+                    if rc < 0:
+                        break
+                    self.buf_pos += rc
+                else:
+                    rc = c_ssh2.libssh2_channel_read_ex(
+                        _channel, 0, self.buf,
+                        self.buf_size if
+                        <unsigned long long>remaining > self.buf_size
+                        else <size_t>remaining)
+                    if rc <= 0:
+                        break
+                    if fd_write_all(self.fd, self.buf, rc) != 0:
+                        n = -1
+                        break
+                self.transferred += rc
+                progressed = True
+        if n < 0:
+            PyErr_SetFromErrno(OSError)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            return progressed
+        handle_error_codes(rc)
+        if self.transferred < self.size:
+            raise SCPProtocolError("%s file %s ended after %s of %s bytes" % (
+                "Local" if self.upload else "Remote",
+                self.local if self.upload else self.remote,
+                self.transferred, self.size))
+        self.data_done = True
+        if self.upload:
+            self.out = b"\0"
+            self.out_pos = 0
+            self.state = _SCP_SEND
+            self.next_state = _SCP_ACK
+        else:
+            self.state = _SCP_ACK
+        return True
+
+    cdef bint _finish(self) except -1:
+        cdef int rc
+        cdef bint progressed = False
+        while self.finish_step < 4:
+            with nogil:
+                rc = _channel_call(self.channel._channel, self.finish_step)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return progressed
+            handle_error_codes(rc)
+            self.finish_step += 1
+            progressed = True
+        if not self.upload and self.owned:
+            self._close()
+            os.chmod(self.local, self.mode)
+            if self.mtime is not None:
+                os.utime(self.local, (self.atime, self.mtime))
+        self.state = _SCP_DONE
+        return True
+
+    cdef bint _step(self) except -1:
+        """Advance transfer as far as possible without blocking.
+
+        Returns whether any progress was made."""
+        if self.state == _SCP_OPEN:
+            return self._open()
+        elif self.state == _SCP_EXEC:
+            return self._exec()
+        elif self.state == _SCP_SEND:
+            return self._send()
+        elif self.state == _SCP_ACK:
+            return self._ack()
+        elif self.state == _SCP_HEADER:
+            return self._header()
+        elif self.state == _SCP_DATA:
+            return self._data()
+        elif self.state == _SCP_FINISH:
+            return self._finish()
+        return False
+
+
+cdef list _scp_many(Session session, list transfers, list order,
+                    int concurrency, size_t chunk_size):
+    """Run transfers in ``order`` with up to ``concurrency`` in flight, with
+    session in non-blocking mode.
+
+    Only one channel is opened at a time, as libssh2 keeps channel open
+    state per session. Opening the next channel overlaps with the exec
+    request of the last opened one. Exec replies are matched to channels by
+    local channel id, but a channel waiting on its reply fails if it reads
+    another channel's reply first, so only one exec request is in flight at
+    a time.
+
+    Returns results in order of transfers - number of bytes transferred, or
+    exception raised by a failed transfer."""
+    cdef list results = [None] * len(transfers)
+    cdef list slots = [None] * min(concurrency, len(transfers))
+    cdef _SCPTransfer transfer
+    cdef _SCPTransfer opening = None
+    cdef _SCPTransfer executing = None
+    cdef Py_ssize_t next_item = 0
+    cdef Py_ssize_t i
+    cdef bint progressed
+    cdef bint blocking = session.get_blocking()
+    session.set_blocking(False)
+    try:
+        while True:
+            progressed = False
+            for i in range(len(slots)):
+                transfer = slots[i]
+                if transfer is None:
+                    if next_item >= len(order) or opening is not None:
+                        continue
+                    transfer = transfers[order[next_item]]
+                    next_item += 1
+                    slots[i] = transfer
+                if transfer.state == _SCP_OPEN:
+                    if opening is not None and opening is not transfer:
+                        continue
+                    opening = transfer
+                elif transfer.state == _SCP_EXEC:
+                    if executing is not None and executing is not transfer:
+                        continue
+                    executing = transfer
+                try:
+                    if transfer.buf is NULL:
+                        transfer._start(chunk_size)
+                    if transfer._step():
+                        progressed = True
+                except Exception as ex:
+                    results[transfer.index] = ex
+                    transfer.state = _SCP_DONE
+                    progressed = True
+                if opening is transfer and transfer.state != _SCP_OPEN:
+                    opening = None
+                if executing is transfer and transfer.state != _SCP_EXEC:
+                    executing = None
+                if transfer.state == _SCP_DONE:
+                    if results[transfer.index] is None:
+                        results[transfer.index] = transfer.transferred
+                    transfer._close()
+                    transfer.channel = None
+                    slots[i] = None
+            if next_item >= len(order) and all(
+                    _transfer is None for _transfer in slots):
+                break
+            if not progressed:
+                wait_session(session)
+    finally:
+        session.set_blocking(blocking)
+        for transfer in transfers:
+            transfer._close()
+    return results
+
+
 cdef class Session:
 
     """LibSSH2 Session class providing session functions"""
@@ -152,6 +727,44 @@ cdef class Session:
         self.sock = sock
         return handle_error_codes(rc)
 
+    def set_transport(self, Transport transport not None):
+        """Send and receive session data with ``transport`` instead of the
+        socket passed to :py:func:`handshake`.
+
+        Must be called before :py:func:`handshake`, which should then be
+        passed the transport itself - its ``fileno`` is waited on when a
+        blocking call would block.
+
+        :param transport: Transport to use.
+        :type transport: :py:class:`ssh2.transport.Transport`"""
+        self.transport = transport
+        with nogil:
+            c_ssh2.libssh2_session_callback_set(
+                self._session, c_ssh2.LIBSSH2_CALLBACK_SEND,
+                <void *>_transport_send)
+            c_ssh2.libssh2_session_callback_set(
+                self._session, c_ssh2.LIBSSH2_CALLBACK_RECV,
+                <void *>_transport_recv)
+
+    def handshake_via(self, Session parent not None, host not None,
+                      int port):
+        """Perform SSH handshake with a host reachable by another session's
+        SSH server, like ``ProxyJump``, over a tunnel opened with
+        :py:func:`open_tunnel` on the parent session.
+
+        The tunnel is relayed natively by the parent session's forwarding
+        thread, so multiple hops need no extra processes or Python threads.
+        The parent session may not be used for anything else while tunnels
+        are open.
+
+        :param parent: Authenticated session to tunnel through.
+        :type parent: :py:class:`ssh2.session.Session`
+        :param host: Host to connect to from the parent's SSH server.
+        :type host: str
+        :param port: SSH port to connect to.
+        :type port: int"""
+        return self.handshake(parent.open_tunnel(host, port))
+
     def set_blocking(self, bint blocking):
         """Set session blocking mode on/off.
 
@@ -610,6 +1223,208 @@ cdef class Session:
                 self._session)), 0)
         return (PyListener(listener, self), bound_port)
 
+    def forward_local(self, bind_address, int bind_port, remote_host not None,
+                      int remote_port,
+                      size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        """Forward connections made to a local address and port to a host and
+        port reachable by the SSH server, via ``direct-tcpip`` channels.
+
+        Connections are accepted and relayed by a native background thread
+        with the GIL released. Any number of connections may be open at
+        once. Each is read from only when its peer can take more data, so a
+        slow end throttles its own connection without affecting others.
+
+        The session is switched to non-blocking mode and is owned by the
+        forwarding thread until the forward is stopped. It must not be used
+        for anything else while forwarding.
+
+        :param bind_address: Local address to listen on. ``None`` listens
+          on all addresses.
+        :type bind_address: str
+        :param bind_port: Local port to listen on. ``0`` picks a free port,
+          available as ``bind_port`` on the returned forward.
+        :type bind_port: int
+        :param remote_host: Host to connect to from the SSH server.
+        :type remote_host: str
+        :param remote_port: Port to connect to from the SSH server.
+        :type remote_port: int
+        :param buffer_size: Size of each direction's buffer per connection.
+        :type buffer_size: int
+
+        :returns: Running forward. Use ``stop`` or a ``with`` block to stop
+          forwarding.
+        :rtype: :py:class:`ssh2.forward.LocalForward`"""
+        cdef LocalForward forward
+        if buffer_size == 0:
+            raise ValueError("Buffer size must be greater than zero")
+        if not self.sock:
+            raise ValueError("Session is not connected")
+        forward = LocalForward(
+            self, bind_address, bind_port, remote_host, remote_port,
+            buffer_size)
+        forward._start()
+        return forward
+
+    def forward_remote(self, int remote_port, local_host not None,
+                       int local_port, remote_host=None,
+                       int queue_maxsize=16,
+                       size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        """Forward connections made to a port on the remote host to a local
+        host and port, via ``forward_listen_ex`` channels.
+
+        Channels are accepted, connected to the local host and relayed by a
+        native background thread with the GIL released, with the same
+        buffering and throttling per connection as
+        :py:func:`forward_local`. The session is owned by the forwarding
+        thread until the forward is stopped.
+
+        :param remote_port: Port to listen on on the remote host. ``0`` lets
+          the server pick a port, available as ``remote_port`` on the
+          returned forward.
+        :type remote_port: int
+        :param local_host: Local host to connect forwarded connections to.
+        :type local_host: str
+        :param local_port: Local port to connect forwarded connections to.
+        :type local_port: int
+        :param remote_host: Address to listen on on the remote host. All
+          addresses when ``None``.
+        :type remote_host: str
+        :param queue_maxsize: Maximum number of forwarded connections to
+          queue before the server rejects further attempts.
+        :type queue_maxsize: int
+        :param buffer_size: Size of each direction's buffer per connection.
+        :type buffer_size: int
+
+        :returns: Running forward. Use ``stop`` or a ``with`` block to stop
+          forwarding and listening on the remote host.
+        :rtype: :py:class:`ssh2.forward.RemoteForward`"""
+        cdef RemoteForward forward
+        if buffer_size == 0:
+            raise ValueError("Buffer size must be greater than zero")
+        if not self.sock:
+            raise ValueError("Session is not connected")
+        forward = RemoteForward(
+            self, remote_port, local_host, local_port, remote_host,
+            queue_maxsize, buffer_size)
+        forward._start()
+        return forward
+
+    def forward_streamlocal(self, local_socket_path not None,
+                            remote_socket_path not None,
+                            size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        """Forward connections made to a local unix domain socket to a unix
+        domain socket on the remote host, via ``direct_streamlocal_ex``
+        channels.
+
+        Connections are accepted and relayed by a native background thread
+        with the GIL released, with the same buffering and throttling per
+        connection as :py:func:`forward_local`. The session is owned by the
+        forwarding thread until the forward is stopped.
+
+        :param local_socket_path: Path of local unix socket to create and
+          listen on. Must not already exist. Removed when the forward is
+          stopped.
+        :type local_socket_path: str
+        :param remote_socket_path: Path of unix socket on the remote host to
+          connect to.
+        :type remote_socket_path: str
+        :param buffer_size: Size of each direction's buffer per connection.
+        :type buffer_size: int
+
+        :returns: Running forward. Use ``stop`` or a ``with`` block to stop
+          forwarding.
+        :rtype: :py:class:`ssh2.forward.StreamLocalForward`"""
+        cdef StreamLocalForward forward
+        if buffer_size == 0:
+            raise ValueError("Buffer size must be greater than zero")
+        if not self.sock:
+            raise ValueError("Session is not connected")
+        forward = StreamLocalForward(
+            self, local_socket_path, remote_socket_path, buffer_size)
+        forward._start()
+        return forward
+
+    def forward_dynamic(self, bind_address, int bind_port,
+                        size_t max_channels=0, pool=(),
+                        size_t buffer_size=c_ssh2.LIBSSH2_CHANNEL_PACKET_DEFAULT):
+        """Run a SOCKS5 proxy on a local address and port, tunnelling each
+        ``CONNECT`` request to its destination via a ``direct-tcpip``
+        channel - dynamic port forwarding like ``ssh -D``.
+
+        The SOCKS negotiation and relaying are done by a native background
+        thread with the GIL released, with the same buffering and throttling
+        per connection as :py:func:`forward_local`. The session is owned by
+        the forwarding thread until the forward is stopped.
+
+        Channels are opened one at a time per session, each taking a round
+        trip to the server. Additional authenticated sessions in ``pool``,
+        to the same or other servers, each get their own forwarding thread
+        accepting from the same listening socket and take connections over
+        ``max_channels`` - use them for many concurrent, short lived
+        connections.
+
+        :param bind_address: Local address to listen on. ``None`` listens
+          on all addresses.
+        :type bind_address: str
+        :param bind_port: Local port to listen on. ``0`` picks a free port,
+          available as ``bind_port`` on the returned forward.
+        :type bind_port: int
+        :param max_channels: Maximum number of connections open at once per
+          session. Further connections wait to be accepted until one closes.
+          ``0`` for no limit.
+        :type max_channels: int
+        :param pool: Additional sessions to tunnel connections over. Owned by
+          their forwarding threads until the forward is stopped.
+        :type pool: list(:py:class:`ssh2.session.Session`)
+        :param buffer_size: Size of each direction's buffer per connection.
+          Must fit the longest SOCKS request of 262 bytes.
+        :type buffer_size: int
+
+        :returns: Running forward. Use ``stop`` or a ``with`` block to stop
+          forwarding on all sessions. Forwards of pooled sessions and their
+          counters are available as its ``pool``.
+        :rtype: :py:class:`ssh2.forward.DynamicForward`"""
+        cdef DynamicForward forward
+        cdef Session session
+        pool = list(pool)
+        if not self.sock:
+            raise ValueError("Session is not connected")
+        for session in pool:
+            if session is self or pool.count(session) > 1:
+                raise ValueError("Sessions in pool must be distinct")
+            if not session.sock:
+                raise ValueError("Session in pool is not connected")
+        forward = DynamicForward(
+            self, bind_address, bind_port, max_channels, pool, buffer_size)
+        forward._start()
+        return forward
+
+    def open_tunnel(self, host not None, int port):
+        """Open tunnel to a host and port reachable by the SSH server via a
+        ``direct_tcpip`` channel, relayed natively to a local socket.
+
+        The first call starts a :py:class:`ssh2.forward.TunnelForward`,
+        available as ``tunnels``, that relays all tunnels opened on this
+        session in a background thread with the GIL released. The session
+        is owned by that thread until ``tunnels.stop()`` is called, which
+        closes all open tunnels.
+
+        :param host: Host to connect to from the SSH server.
+        :type host: str
+        :param port: Port to connect to from the SSH server.
+        :type port: int
+
+        :returns: Local end of tunnel. Closing it closes the tunnel.
+        :rtype: :py:class:`socket.socket`"""
+        cdef TunnelForward forward
+        if not self.sock:
+            raise ValueError("Session is not connected")
+        if self.tunnels is None or not self.tunnels.running:
+            forward = TunnelForward(self)
+            forward._start()
+            self.tunnels = forward
+        return self.tunnels.open(host, port)
+
     def sftp_init(self):
         """Initialise SFTP channel.
 
@@ -623,6 +1438,16 @@ cdef class Session:
                 self._session))
         return PySFTP(_sftp, self)
 
+    def sftp_pool(self, int size=4):
+        """Open pool of ``size`` SFTP channels on this session for running
+        many SFTP metadata operations at once.
+
+        :param size: Number of SFTP channels.
+        :type size: int
+
+        :rtype: :py:class:`ssh2.sftp.SFTPPool`"""
+        return SFTPPool(self, size)
+
     def last_error(self, size_t msg_size=1024):
         """Retrieve last error message from libssh2, if any.
         Returns empty string on no error message.
@@ -707,6 +1532,515 @@ cdef class Session:
                 self._session))
         return PyChannel(channel, self)
 
+    def scp_put_file(self, local not None, remote_path not None, mode=None,
+                     bint preserve_times=True,
+                     size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Upload local file to remote file via SCP.
+
+        Local file is read and written to the SCP channel in a native loop
+        with the GIL released, using one reusable buffer of ``chunk_size``
+        bytes. The channel is closed once the upload completes.
+
+        Works whether session is in blocking or non-blocking mode.
+
+        :param local: Local file path, file object or file descriptor to
+          read from. File objects and descriptors are read from their current
+          offset to end of file and are not closed.
+        :type local: str or file or int
+        :param remote_path: Remote file to upload to.
+        :type remote_path: str
+        :param mode: Permissions mode of remote file. Defaults to local
+          file's permissions.
+        :type mode: int
+        :param preserve_times: Send local file's modification and access
+          times with it.
+        :type preserve_times: bool
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+
+        :returns: Number of bytes uploaded.
+        :rtype: int
+
+        :raises: :py:class:`ssh2.exceptions.SCPProtocolError` on errors
+          opening remote file or local file ending early, ``OSError`` on
+          local file errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        cdef bytes b_remote_path = to_bytes(remote_path)
+        cdef char *_remote_path = b_remote_path
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef Channel channel
+        cdef c_ssh2.libssh2_int64_t size
+        cdef int _mode
+        cdef time_t mtime = 0
+        cdef time_t atime = 0
+        cdef int rc
+        cdef long long sent
+        cdef char *buf
+        fd, owned = _local_fd(local, os.O_RDONLY)
+        try:
+            local_stat = os.fstat(fd)
+            size = max(local_stat.st_size - os.lseek(fd, 0, os.SEEK_CUR), 0)
+            _mode = local_stat.st_mode & 0o777 if mode is None else mode
+            if preserve_times:
+                mtime = int(local_stat.st_mtime)
+                atime = int(local_stat.st_atime)
+            while True:
+                with nogil:
+                    _channel = c_ssh2.libssh2_scp_send64(
+                        self._session, _remote_path, _mode, size, mtime,
+                        atime)
+                if _channel is not NULL:
+                    break
+                rc = c_ssh2.libssh2_session_last_errno(self._session)
+                if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    handle_error_codes(rc)
+                    raise SCPProtocolError(
+                        "Error sending %s via SCP" % (b_remote_path,))
+                wait_session(self)
+            channel = PyChannel(_channel, self)
+            buf = <char *>malloc(sizeof(char) * chunk_size)
+            if buf is NULL:
+                raise MemoryError
+            try:
+                sent = _fd_to_channel(self, _channel, fd, size, buf,
+                                      chunk_size)
+            finally:
+                free(buf)
+            if sent != size:
+                raise SCPProtocolError(
+                    "Local file %s ended after %s of %s bytes" % (
+                        local, sent, size))
+            _scp_write(self, _channel, b"\0")
+            _scp_read_ack(self, _channel)
+            _channel_finish(channel)
+            return sent
+        finally:
+            if owned:
+                os.close(fd)
+
+    def scp_get_file(self, remote_path not None, local not None,
+                     bint preserve_times=True,
+                     size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Download remote file to local file via SCP.
+
+        SCP channel is read and written to local file in a native loop with
+        the GIL released, using one reusable buffer of ``chunk_size`` bytes.
+        The channel is closed once the download completes.
+
+        Works whether session is in blocking or non-blocking mode.
+
+        :param remote_path: Remote file to download.
+        :type remote_path: str
+        :param local: Local file path, file object or file descriptor to
+          write to. Local files given by path are created or truncated and
+          have the remote file's permissions set. File objects and
+          descriptors are written at their current offset and are not closed.
+        :type local: str or file or int
+        :param preserve_times: Set modification and access times of local
+          file given by path to the remote file's.
+        :type preserve_times: bool
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+
+        :returns: Number of bytes downloaded.
+        :rtype: int
+
+        :raises: :py:class:`ssh2.exceptions.SCPProtocolError` on errors
+          opening remote file or remote file ending early, ``OSError`` on
+          local file errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        cdef FileInfo fileinfo = FileInfo()
+        cdef bytes b_remote_path = to_bytes(remote_path)
+        cdef char *_remote_path = b_remote_path
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef Channel channel
+        cdef c_ssh2.libssh2_int64_t size
+        cdef int rc
+        cdef long long received
+        cdef char *buf
+        while True:
+            with nogil:
+                _channel = c_ssh2.libssh2_scp_recv2(
+                    self._session, _remote_path, fileinfo._stat)
+            if _channel is not NULL:
+                break
+            rc = c_ssh2.libssh2_session_last_errno(self._session)
+            if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                handle_error_codes(rc)
+                raise SCPProtocolError(
+                    "Error receiving %s via SCP" % (b_remote_path,))
+            wait_session(self)
+        channel = PyChannel(_channel, self)
+        size = fileinfo._stat.st_size
+        fd, owned = _local_fd(local, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            buf = <char *>malloc(sizeof(char) * chunk_size)
+            if buf is NULL:
+                raise MemoryError
+            try:
+                received = _channel_to_fd(self, _channel, fd, size, buf,
+                                          chunk_size)
+            finally:
+                free(buf)
+        finally:
+            if owned:
+                os.close(fd)
+        if received != size:
+            raise SCPProtocolError(
+                "Remote file %s ended after %s of %s bytes" % (
+                    b_remote_path, received, size))
+        _scp_read_ack(self, _channel)
+        _scp_write(self, _channel, b"\0")
+        _channel_finish(channel)
+        if owned:
+            os.chmod(local, fileinfo._stat.st_mode & 0o777)
+            if preserve_times:
+                os.utime(local, (fileinfo._stat.st_atime,
+                                 fileinfo._stat.st_mtime))
+        return received
+
+    def scp_put_many(self, pairs not None, int concurrency=4,
+                     bint preserve_times=True,
+                     size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Upload many local files via SCP, with up to ``concurrency`` SCP
+        channels in flight on this session at once.
+
+        Each file needs its own SCP channel, so uploading many small files one
+        at a time is bound by channel open round trips. Channels are instead
+        kept in flight with the session in non-blocking mode and files
+        scheduled largest first. Memory used is ``concurrency * chunk_size``.
+
+        Works whether session is in blocking or non-blocking mode - its mode
+        is restored once all uploads complete.
+
+        :param pairs: ``(local, remote_path)`` tuples, with local being a
+          file path, file object or file descriptor as for
+          :py:func:`scp_put_file`.
+        :type pairs: iter(tuple(str or file or int, str))
+        :param concurrency: Max number of SCP channels in flight.
+        :type concurrency: int
+        :param preserve_times: Send local files' modification and access
+          times with them.
+        :type preserve_times: bool
+        :param chunk_size: Size of each channel's read buffer.
+        :type chunk_size: int
+
+        :returns: Result of each upload in order of ``pairs`` - number of
+          bytes uploaded, or exception raised by a failed upload.
+        :rtype: list(int or Exception)"""
+        cdef list transfers = []
+        cdef list sizes = []
+        cdef Py_ssize_t i
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least one")
+        for i, (local, remote_path) in enumerate(pairs):
+            transfers.append(_SCPTransfer(
+                self, True, local, remote_path, i, preserve_times))
+            try:
+                if isinstance(local, int):
+                    sizes.append(os.fstat(local).st_size)
+                elif hasattr(local, 'fileno'):
+                    sizes.append(os.fstat(local.fileno()).st_size)
+                else:
+                    sizes.append(os.stat(local).st_size)
+            except OSError:
+                sizes.append(0)
+        return _scp_many(
+            self, transfers,
+            sorted(range(len(transfers)), key=sizes.__getitem__,
+                   reverse=True),
+            concurrency, chunk_size)
+
+    def scp_get_many(self, pairs not None, int concurrency=4,
+                     bint preserve_times=True,
+                     size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Download many remote files via SCP, with up to ``concurrency`` SCP
+        channels in flight on this session at once.
+
+        As for :py:func:`scp_put_many`, except that files are scheduled in
+        order of ``pairs`` as remote file sizes are not known before each
+        download starts.
+
+        :param pairs: ``(remote_path, local)`` tuples, with local being a
+          file path, file object or file descriptor as for
+          :py:func:`scp_get_file`.
+        :type pairs: iter(tuple(str, str or file or int))
+        :param concurrency: Max number of SCP channels in flight.
+        :type concurrency: int
+        :param preserve_times: Set modification and access times of local
+          files given by path to the remote files'.
+        :type preserve_times: bool
+        :param chunk_size: Size of each channel's read buffer.
+        :type chunk_size: int
+
+        :returns: Result of each download in order of ``pairs`` - number of
+          bytes downloaded, or exception raised by a failed download.
+        :rtype: list(int or Exception)"""
+        cdef list transfers = []
+        cdef Py_ssize_t i
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least one")
+        for i, (remote_path, local) in enumerate(pairs):
+            transfers.append(_SCPTransfer(
+                self, False, local, remote_path, i, preserve_times))
+        return _scp_many(self, transfers, list(range(len(transfers))),
+                         concurrency, chunk_size)
+
+    def scp_put_dir(self, local_dir not None, remote_dir not None,
+                    bint preserve_times=True,
+                    size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Upload local directory tree via SCP, like ``scp -r``, over a single
+        SCP channel.
+
+        Directories and files are sent as SCP directory, file and end of
+        directory records to one remote ``scp -rt`` command, so the whole
+        tree costs one channel rather than one channel per file plus
+        directory creation over SFTP. Symbolic links are followed, except
+        links to a directory containing them, and special files skipped.
+
+        Contents of ``local_dir`` are copied into ``remote_dir``, which is
+        created if it does not exist.
+
+        Works whether session is in blocking or non-blocking mode.
+
+        :param local_dir: Local directory to upload.
+        :type local_dir: str
+        :param remote_dir: Remote directory to upload to.
+        :type remote_dir: str
+        :param preserve_times: Send modification and access times of files
+          and directories with them.
+        :type preserve_times: bool
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+
+        :returns: Number of bytes of file data uploaded.
+        :rtype: int
+
+        :raises: :py:class:`ssh2.exceptions.SCPProtocolError` on remote SCP
+          errors or local files ending early, ``OSError`` on local file
+          errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        cdef bytes b_remote_dir = to_bytes(remote_dir).rstrip(b"/")
+        cdef Channel channel
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef list stack
+        cdef long long total = 0
+        cdef long long size
+        cdef long long sent
+        cdef char *buf
+        parent, _, name = b_remote_dir.rpartition(b"/")
+        if not name:
+            raise ValueError("Remote directory cannot be root directory")
+        if not parent:
+            parent = b"/" if b_remote_dir.startswith(b"/") else b"."
+        local_stat = os.stat(local_dir)
+        if not S_ISDIR(local_stat.st_mode):
+            raise NotADirectoryError(local_dir)
+        buf = <char *>malloc(sizeof(char) * chunk_size)
+        if buf is NULL:
+            raise MemoryError
+        try:
+            channel = _scp_exec(self, b"scp -r%st %s" % (
+                b"p" if preserve_times else b"", _shell_quote(parent)))
+            _channel = channel._channel
+            _scp_read_ack(self, _channel)
+
+            def send_header(record, entry_stat):
+                if preserve_times:
+                    _scp_write(self, _channel, b"T%d 0 %d 0\n" % (
+                        entry_stat.st_mtime, entry_stat.st_atime))
+                    _scp_read_ack(self, _channel)
+                _scp_write(self, _channel, record)
+                _scp_read_ack(self, _channel)
+
+            send_header(b"D%04o 0 %s\n" % (
+                local_stat.st_mode & 0o777, name), local_stat)
+            stack = [(iter(sorted(os.scandir(local_dir),
+                                  key=lambda _entry: _entry.name)),
+                      (local_stat.st_dev, local_stat.st_ino))]
+            # Directories being sent, for symbolic link loops
+            ancestors = {stack[0][1]}
+            while stack:
+                entries, dir_id = stack[len(stack) - 1]
+                entry = next(entries, None)
+                if entry is None:
+                    stack.pop()
+                    ancestors.discard(dir_id)
+                    _scp_write(self, _channel, b"E\n")
+                    _scp_read_ack(self, _channel)
+                    continue
+                entry_stat = entry.stat()
+                entry_name = os.fsencode(entry.name)
+                if S_ISDIR(entry_stat.st_mode):
+                    dir_id = (entry_stat.st_dev, entry_stat.st_ino)
+                    if dir_id in ancestors:
+                        continue
+                    send_header(b"D%04o 0 %s\n" % (
+                        entry_stat.st_mode & 0o777, entry_name), entry_stat)
+                    ancestors.add(dir_id)
+                    stack.append((iter(sorted(
+                        os.scandir(entry.path),
+                        key=lambda _entry: _entry.name)), dir_id))
+                    continue
+                elif not S_ISREG(entry_stat.st_mode):
+                    continue
+                fd, _ = _local_fd(entry.path, os.O_RDONLY)
+                try:
+                    size = os.fstat(fd).st_size
+                    send_header(b"C%04o %d %s\n" % (
+                        entry_stat.st_mode & 0o777, size, entry_name),
+                                entry_stat)
+                    sent = _fd_to_channel(self, _channel, fd, size, buf,
+                                          chunk_size)
+                finally:
+                    os.close(fd)
+                if sent != size:
+                    raise SCPProtocolError(
+                        "Local file %s ended after %s of %s bytes" % (
+                            entry.path, sent, size))
+                _scp_write(self, _channel, b"\0")
+                _scp_read_ack(self, _channel)
+                total += sent
+            _channel_finish(channel)
+        finally:
+            free(buf)
+        return total
+
+    def scp_get_dir(self, remote_dir not None, local_dir not None,
+                    bint preserve_times=True,
+                    size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+        """Download remote directory tree via SCP, like ``scp -r``, over a
+        single SCP channel.
+
+        Directories and files are received as SCP directory, file and end of
+        directory records from one remote ``scp -rf`` command and written to
+        local files with the GIL released.
+
+        Contents of ``remote_dir`` are copied into ``local_dir``, which is
+        created if it does not exist. Local files and directories have the
+        remote ones' permissions set.
+
+        Works whether session is in blocking or non-blocking mode.
+
+        :param remote_dir: Remote directory to download.
+        :type remote_dir: str
+        :param local_dir: Local directory to download to.
+        :type local_dir: str or path-like
+        :param preserve_times: Set modification and access times of local
+          files and directories to the remote ones'.
+        :type preserve_times: bool
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+
+        :returns: Number of bytes of file data downloaded.
+        :rtype: int
+
+        :raises: :py:class:`ssh2.exceptions.SCPProtocolError` on remote SCP
+          errors, including remote files that cannot be read, remote path
+          not being a directory or invalid records, ``OSError`` on local file
+          errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        local_dir = os.fspath(local_dir)
+        cdef bytes b_remote_dir = to_bytes(remote_dir)
+        cdef Channel channel
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef list stack = []
+        cdef bytes line
+        cdef long long total = 0
+        cdef long long size
+        cdef long long received
+        cdef char *buf
+        times = None
+        buf = <char *>malloc(sizeof(char) * chunk_size)
+        if buf is NULL:
+            raise MemoryError
+        try:
+            channel = _scp_exec(self, b"scp -r%sf %s" % (
+                b"p" if preserve_times else b"", _shell_quote(b_remote_dir)))
+            _channel = channel._channel
+            _scp_write(self, _channel, b"\0")
+            while True:
+                line = _scp_read_line(self, _channel)
+                if not line:
+                    raise SCPProtocolError(
+                        "Remote end closed channel before end of directory")
+                record = line[:1]
+                if record == b"T":
+                    fields = line[1:].split()
+                    times = (int(fields[2]), int(fields[0]))
+                    _scp_write(self, _channel, b"\0")
+                    continue
+                elif record == b"E":
+                    if not stack:
+                        raise SCPProtocolError(
+                            "Unexpected end of directory record")
+                    path, mode, dir_times = stack.pop()
+                    os.chmod(path, mode)
+                    if dir_times is not None:
+                        os.utime(path, dir_times)
+                    _scp_write(self, _channel, b"\0")
+                    if not stack:
+                        break
+                    continue
+                elif record != b"C" and record != b"D":
+                    raise SCPProtocolError(
+                        "Unexpected SCP record %r" % (line,))
+                fields = line[1:].split(None, 2)
+                if len(fields) != 3:
+                    raise SCPProtocolError(
+                        "Unexpected SCP record %r" % (line,))
+                mode = int(fields[0], 8) & 0o777
+                size = int(fields[1])
+                name = _scp_name(fields[2])
+                if not stack:
+                    if record == b"C":
+                        raise SCPProtocolError(
+                            "Remote path %s is not a directory" % (
+                                b_remote_dir,))
+                    path = local_dir
+                else:
+                    parent = stack[len(stack) - 1][0]
+                    path = os.path.join(
+                        parent, os.fsdecode(name) if isinstance(parent, str)
+                        else name)
+                if record == b"D":
+                    if not os.path.isdir(path):
+                        os.mkdir(path)
+                    stack.append((path, mode, times))
+                    times = None
+                    _scp_write(self, _channel, b"\0")
+                    continue
+                fd, _ = _local_fd(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+                try:
+                    _scp_write(self, _channel, b"\0")
+                    received = _channel_to_fd(self, _channel, fd, size, buf,
+                                              chunk_size)
+                finally:
+                    os.close(fd)
+                if received != size:
+                    raise SCPProtocolError(
+                        "Remote file %s ended after %s of %s bytes" % (
+                            name, received, size))
+                _scp_read_ack(self, _channel)
+                _scp_write(self, _channel, b"\0")
+                os.chmod(path, mode)
+                if times is not None:
+                    os.utime(path, times)
+                    times = None
+                total += received
+            _channel_finish(channel)
+        finally:
+            free(buf)
+        return total
+
     def publickey_init(self):
         """Initialise public key subsystem for managing remote server
         public keys"""
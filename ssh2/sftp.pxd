@@ -21,8 +21,42 @@ from . cimport c_sftp
 
 
 cdef object PySFTP(c_sftp.LIBSSH2_SFTP *sftp, Session session)
+cdef object _local_fd(local, int flags)
+
+
+cdef enum:
+    _ATTR_CACHE_STAT
+    _ATTR_CACHE_LSTAT
+    _ATTR_CACHE_REALPATH
+    _ATTR_CACHE_READLINK
+
+
+cdef class SFTPAttributeCache:
+    cdef object _entries
+    cdef readonly size_t max_entries
+    cdef readonly double ttl
+    cdef readonly unsigned long long hits
+    cdef readonly unsigned long long misses
+
+    cdef object _get(self, int kind, bytes path)
+    cdef int _put(self, int kind, bytes path, object value) except -1
+    cdef int _put_entry(self, bytes dirpath, bytes name, object attrs) except -1
+    cdef int _invalidate(self, bytes path, bint recursive=*) except -1
+    cdef int _invalidate_realpaths(self) except -1
 
 
 cdef class SFTP:
     cdef c_sftp.LIBSSH2_SFTP *_sftp
     cdef Session _session
+    cdef readonly SFTPAttributeCache attr_cache
+    cdef object _ext
+
+    cdef int _invalidate_rename(self, bytes source, bytes dest) except -1
+    cdef object _extension_channel(self)
+
+
+cdef class SFTPPool:
+    cdef Session _session
+    cdef readonly tuple channels
+
+    cdef list _run(self, list items, object call, bint return_exceptions)
@@ -87,15 +87,38 @@ ___________________
 :var LIBSSH2_SFTP_ST_NOSUID: No suid
 """
 
-from libc.stdlib cimport malloc, free
+import io
+import os
+import re
+import struct
+import warnings
+import zlib
+from fnmatch import translate as _fnmatch_translate
+from collections import OrderedDict
+from mmap import mmap as _mmap, ACCESS_WRITE
+from time import monotonic
+
+from cpython.array cimport array, clone
+from cpython.buffer cimport PyBUF_READ, PyBUF_SIMPLE, PyBUF_WRITABLE, \
+    PyObject_GetBuffer, PyBuffer_Release
+from cpython.exc cimport PyErr_SetFromErrno
+from cpython.memoryview cimport PyMemoryView_FromMemory
+from libc.limits cimport LLONG_MAX
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memcpy, memset
+
+from .exceptions import SFTPError, SFTPHandleError, SFTPProtocolError
 
 from .session cimport Session
 from .channel cimport Channel, PyChannel
-from .utils cimport to_bytes, to_str_len, handle_error_codes
-from .sftp_handle cimport SFTPHandle, PySFTPHandle, SFTPAttributes, SFTPStatVFS
+from .utils cimport to_bytes, to_str_len, handle_error_codes, wait_session, \
+    new_hash, fd_read, fd_write_all, fd_seek
+from .sftp_handle cimport SFTPHandle, PySFTPHandle, SFTPAttributes, \
+    SFTPStatVFS, SFTPDirListing
 
 from . cimport c_ssh2
 from . cimport c_sftp
+from . cimport error_codes
 
 
 # File types
@@ -161,12 +184,1595 @@ LIBSSH2_SFTP_ST_RDONLY = c_sftp.LIBSSH2_SFTP_ST_RDONLY
 LIBSSH2_SFTP_ST_NOSUID = c_sftp.LIBSSH2_SFTP_ST_NOSUID
 
 
+# Size of byte ranges recorded in resumable transfer journals
+TRANSFER_JOURNAL_RANGE_SIZE = 8388608
+TRANSFER_JOURNAL_SUFFIX = '.ssh2-journal'
+_JOURNAL_MAGIC = 'ssh2-journal'
+_JOURNAL_VERSION = 1
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+# Default buffer size of file objects from SFTP.open_file
+SFTP_FILE_BUFFER_SIZE = 1048576
+# Largest buffer realpath and readlink grow their buffer to
+_MAX_LINK_BUFFER = 1048576
+
+
+# SFTP protocol version 3 packet types used by extension requests
+cdef enum:
+    _FXP_INIT = 1
+    _FXP_VERSION = 2
+    _FXP_OPEN = 3
+    _FXP_CLOSE = 4
+    _FXP_STATUS = 101
+    _FXP_HANDLE = 102
+    _FXP_EXTENDED = 200
+    _FXP_EXTENDED_REPLY = 201
+
+_U32 = struct.Struct('>I')
+_U64 = struct.Struct('>Q')
+# Largest SFTP packet accepted from server, as OpenSSH's SFTP_MAX_MSG_LENGTH
+_SFTP_MAX_PACKET_LENGTH = 262144
+
+_GLOB_MAGIC = re.compile('[*?[]')
+_GLOB_MAGIC_BYTES = re.compile(b'[*?[]')
+
+
 cdef object PySFTP(c_sftp.LIBSSH2_SFTP *sftp, Session session):
     cdef SFTP _sftp = SFTP.__new__(SFTP, session)
     _sftp._sftp = sftp
     return _sftp
 
 
+cdef class _CRC32:
+
+    cdef readonly unsigned long value
+
+    def __cinit__(self):
+        self.value = 0
+
+    def __call__(self, data):
+        self.value = zlib.crc32(data, self.value)
+
+
+cdef class TransferJournal:
+    """On-disk journal of completed byte ranges of a resumable transfer.
+
+    The journal is a small text file. Its first line identifies the transfer
+    source by size and modification time, followed by one line per
+    completed range of ``<offset> <length> <crc32>``, where ``crc32`` is
+    ``-`` when range checksums are not being recorded. Range lines of
+    uploads end with the destination file's modification time once the
+    range was written, which :py:attr:`dest_mtime` is loaded from.
+
+    :param path: Path of journal file.
+    :type path: str
+    :param size: Size of transfer source.
+    :type size: int
+    :param mtime: Modification time of transfer source.
+    :type mtime: int
+    :param range_size: Size of journalled byte ranges.
+    :type range_size: int"""
+
+    cdef readonly object path
+    cdef readonly c_ssh2.libssh2_uint64_t size
+    cdef readonly unsigned long mtime
+    cdef readonly c_ssh2.libssh2_uint64_t range_size
+    cdef readonly dict ranges
+    cdef readonly object dest_mtime
+    cdef object _fh
+
+    def __cinit__(self, path not None, c_ssh2.libssh2_uint64_t size,
+                  unsigned long mtime,
+                  c_ssh2.libssh2_uint64_t range_size=TRANSFER_JOURNAL_RANGE_SIZE):
+        if range_size == 0:
+            raise ValueError("Journal range size must be greater than zero")
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.range_size = range_size
+        self.ranges = {}
+        self.dest_mtime = None
+        self._fh = None
+
+    def __dealloc__(self):
+        if self._fh is not None:
+            self._fh.close()
+
+    def _header(self):
+        return "%s %s %s %s %s\n" % (
+            _JOURNAL_MAGIC, _JOURNAL_VERSION, self.size, self.mtime,
+            self.range_size)
+
+    def load(self):
+        """Load completed ranges from an existing journal file.
+
+        Ranges are only loaded if the journal was written for a source of the
+        same size and modification time with the same range size.
+
+        :returns: ``True`` if ranges were loaded, ``False`` if journal is
+          missing or is for a different source.
+        :rtype: bool"""
+        self.ranges = {}
+        self.dest_mtime = None
+        try:
+            with open(self.path, 'r') as fh:
+                lines = fh.read().splitlines()
+        except (IOError, OSError):
+            return False
+        if not lines or lines[0] + '\n' != self._header():
+            return False
+        for line in lines[1:]:
+            fields = line.split()
+            # Last line may be incomplete if previous transfer was interrupted
+            if len(fields) != 3 and len(fields) != 4:
+                continue
+            try:
+                offset, length = int(fields[0]), int(fields[1])
+                crc = None if fields[2] == '-' else int(fields[2], 16)
+                dest_mtime = int(fields[3]) if len(fields) == 4 else None
+            except ValueError:
+                continue
+            self.ranges[offset] = (length, crc)
+            self.dest_mtime = dest_mtime
+        return True
+
+    def verify(self, int fd):
+        """Drop completed ranges whose recorded checksum does not match the
+        contents of local file descriptor ``fd``.
+
+        Ranges recorded without a checksum are dropped as they cannot be
+        verified.
+
+        :returns: Number of ranges dropped.
+        :rtype: int"""
+        cdef int dropped = 0
+        for offset, (length, crc) in list(self.ranges.items()):
+            if crc is None or _fd_crc32(fd, offset, length) != crc:
+                del self.ranges[offset]
+                dropped += 1
+        return dropped
+
+    def truncate(self, c_ssh2.libssh2_uint64_t size):
+        """Drop completed ranges extending beyond ``size``."""
+        for offset, (length, _) in list(self.ranges.items()):
+            if offset + length > size:
+                del self.ranges[offset]
+
+    def missing(self):
+        """Get ranges not yet completed, in file offset order.
+
+        :rtype: list(tuple(int, int)) of ``(offset, length)``"""
+        cdef c_ssh2.libssh2_uint64_t offset = 0
+        cdef c_ssh2.libssh2_uint64_t length
+        cdef list missing = []
+        while offset < self.size:
+            length = min(self.range_size, self.size - offset)
+            completed = self.ranges.get(offset)
+            if completed is None or completed[0] != length:
+                missing.append((offset, length))
+            offset += length
+        return missing
+
+    def begin(self):
+        """Open journal for recording, rewriting it from currently loaded
+        ranges."""
+        self.close()
+        self._fh = open(self.path, 'w')
+        self._fh.write(self._header())
+        offsets = sorted(self.ranges)
+        for i, offset in enumerate(offsets):
+            self._write_range(
+                offset, *self.ranges[offset],
+                dest_mtime=self.dest_mtime if i == len(offsets) - 1 else None)
+        self._fh.flush()
+
+    def _write_range(self, offset, length, crc, dest_mtime=None):
+        self._fh.write("%s %s %s%s\n" % (
+            offset, length, '-' if crc is None else '%08x' % (crc,),
+            '' if dest_mtime is None else ' %s' % (dest_mtime,)))
+
+    def record(self, c_ssh2.libssh2_uint64_t offset,
+               c_ssh2.libssh2_uint64_t length, crc=None, dest_mtime=None):
+        """Record range as completed, with destination file's modification
+        time after writing it if given."""
+        self.ranges[offset] = (length, crc)
+        self.dest_mtime = dest_mtime
+        self._write_range(offset, length, crc, dest_mtime)
+        self._fh.flush()
+
+    def close(self):
+        """Close journal file, if open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def remove(self):
+        """Close and delete journal file."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+cdef unsigned long _fd_crc32(int fd, c_ssh2.libssh2_uint64_t offset,
+                             c_ssh2.libssh2_uint64_t length) except? 0:
+    cdef unsigned long crc = 0
+    cdef bytes data
+    os.lseek(fd, offset, os.SEEK_SET)
+    while length > 0:
+        data = os.read(fd, min(length, 1048576))
+        if not data:
+            break
+        crc = zlib.crc32(data, crc)
+        length -= len(data)
+    return crc
+
+
+cdef object _local_fd(local, int flags):
+    """Get file descriptor and whether it is owned by caller from path, file
+    object or file descriptor."""
+    if isinstance(local, int):
+        return local, False
+    elif hasattr(local, 'fileno'):
+        if hasattr(local, 'flush'):
+            local.flush()
+        return local.fileno(), False
+    return os.open(local, flags | _O_BINARY, 0o666), True
+
+
+cdef object _journal_path(local, journal_path):
+    if journal_path is not None:
+        return journal_path
+    if isinstance(local, int) or hasattr(local, 'fileno'):
+        raise ValueError(
+            "journal_path is required to resume transfers of file descriptors")
+    local = os.fspath(local)
+    return local + (TRANSFER_JOURNAL_SUFFIX if isinstance(local, str)
+                    else to_bytes(TRANSFER_JOURNAL_SUFFIX))
+
+
+cdef SFTPHandle _open_handle(SFTP sftp, bytes b_path, unsigned long flags,
+                             long mode, int open_type):
+    """Open handle, waiting on socket in non-blocking mode."""
+    cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
+    cdef SFTPHandle handle
+    cdef char *_path = b_path
+    cdef unsigned int path_len = len(b_path)
+    cdef int rc
+    while True:
+        with nogil:
+            _handle = c_sftp.libssh2_sftp_open_ex(
+                sftp._sftp, _path, path_len, flags, mode, open_type)
+        if _handle is not NULL:
+            if sftp.attr_cache is not None and flags & (
+                    c_sftp.LIBSSH2_FXF_CREAT | c_sftp.LIBSSH2_FXF_TRUNC):
+                sftp.attr_cache._invalidate(b_path)
+            handle = PySFTPHandle(_handle, sftp)
+            handle._path = b_path
+            return handle
+        rc = c_ssh2.libssh2_session_last_errno(sftp._session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise SFTPHandleError("Error opening handle for %s" % (b_path,))
+        wait_session(sftp._session)
+
+
+cdef int _close_handle(SFTPHandle handle) except -1:
+    """Close handle, waiting on socket in non-blocking mode."""
+    cdef int rc
+    if handle._closed:
+        return 0
+    while True:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_close_handle(handle._handle)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            break
+        wait_session(handle._sftp._session)
+    handle._closed = 1
+    return handle_error_codes(rc)
+
+
+cdef int _handle_fstat(SFTPHandle handle, SFTPAttributes attrs,
+                       int setstat) except -1:
+    """Get or set handle attributes, waiting on socket in non-blocking mode."""
+    cdef int rc
+    while True:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_fstat_ex(
+                handle._handle, attrs._attrs, setstat)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            return handle_error_codes(rc)
+        wait_session(handle._sftp._session)
+
+
+cdef long long _sftp_to_fd(SFTPHandle handle, int fd, long long length,
+                           char *buf, size_t buf_size, object sink) except -1:
+    """Copy up to ``length`` bytes from handle's current offset to ``fd``.
+
+    Returns bytes copied, less than ``length`` only on end of file."""
+    cdef Session session = handle._sftp._session
+    cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle = handle._handle
+    cdef long long total = 0
+    cdef ssize_t rc
+    cdef size_t want
+    cdef bint has_sink = sink is not None
+    cdef object view = PyMemoryView_FromMemory(
+        buf, buf_size, PyBUF_READ) if has_sink else None
+    with nogil:
+        while total < length:
+            want = buf_size if <unsigned long long>(length - total) > buf_size \
+                else <size_t>(length - total)
+            rc = c_sftp.libssh2_sftp_read(_handle, buf, want)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                with gil:
+                    wait_session(session)
+                continue
+            elif rc < 0:
+                with gil:
+                    return handle_error_codes(rc)
+            elif rc == 0:
+                break
+            if fd_write_all(fd, buf, rc) != 0:
+                with gil:
+                    PyErr_SetFromErrno(OSError)
+            if has_sink:
+                with gil:
+                    sink(view[:rc])
+            total += rc
+    return total
+
+
+cdef long long _sftp_to_mmap(SFTPHandle handle, int fd,
+                             size_t chunk_size, object sink) except -1:
+    """Resize ``fd`` to size of remote file, map it in memory and read remote
+    file directly into the mapping.
+
+    Returns bytes read. File is truncated to bytes read if remote file shrank
+    during download."""
+    cdef Session session = handle._sftp._session
+    cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle = handle._handle
+    cdef SFTPAttributes attrs = SFTPAttributes()
+    cdef Py_buffer view
+    cdef char *dest
+    cdef long long length
+    cdef long long total = 0
+    cdef ssize_t rc
+    cdef size_t want
+    cdef bint has_sink = sink is not None
+    _handle_fstat(handle, attrs, 0)
+    length = attrs.filesize
+    os.ftruncate(fd, length)
+    if length == 0:
+        return 0
+    mapped = _mmap(fd, length, access=ACCESS_WRITE)
+    try:
+        PyObject_GetBuffer(mapped, &view, PyBUF_WRITABLE)
+        dest = <char *>view.buf
+        try:
+            with nogil:
+                while total < length:
+                    want = chunk_size \
+                        if <unsigned long long>(length - total) > chunk_size \
+                        else <size_t>(length - total)
+                    rc = c_sftp.libssh2_sftp_read(_handle, dest + total, want)
+                    if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                        with gil:
+                            wait_session(session)
+                        continue
+                    elif rc < 0:
+                        with gil:
+                            handle_error_codes(rc)
+                    elif rc == 0:
+                        break
+                    if has_sink:
+                        with gil:
+                            sink(PyMemoryView_FromMemory(
+                                dest + total, rc, PyBUF_READ))
+                    total += rc
+        finally:
+            PyBuffer_Release(&view)
+    finally:
+        mapped.close()
+    if total < length:
+        os.ftruncate(fd, total)
+    return total
+
+
+cdef long long _fd_to_sftp(SFTPHandle handle, int fd, long long length,
+                           char *buf, size_t buf_size, object sink) except -1:
+    """Copy up to ``length`` bytes from ``fd`` to handle's current offset.
+
+    Returns bytes copied, less than ``length`` only on end of file."""
+    cdef Session session = handle._sftp._session
+    cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle = handle._handle
+    cdef long long total = 0
+    cdef long long n
+    cdef size_t written
+    cdef ssize_t rc
+    cdef size_t want
+    cdef bint has_sink = sink is not None
+    cdef object view = PyMemoryView_FromMemory(
+        buf, buf_size, PyBUF_READ) if has_sink else None
+    with nogil:
+        while total < length:
+            want = buf_size if <unsigned long long>(length - total) > buf_size \
+                else <size_t>(length - total)
+            n = fd_read(fd, buf, want)
+            if n < 0:
+                with gil:
+                    PyErr_SetFromErrno(OSError)
+            elif n == 0:
+                break
+            if has_sink:
+                with gil:
+                    sink(view[:n])
+            written = 0
+            while written < <size_t>n:
+                rc = c_sftp.libssh2_sftp_write(
+                    _handle, buf + written, n - written)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    with gil:
+                        wait_session(session)
+                    continue
+                elif rc < 0:
+                    with gil:
+                        return handle_error_codes(rc)
+                written += rc
+            total += n
+    return total
+
+
+cdef struct _dir_entries:
+    # Entry names, one after the other in a single buffer
+    char *names
+    size_t names_len
+    size_t names_size
+    # Offset of each entry's name in names, count + 1 long
+    size_t *name_offsets
+    c_sftp.LIBSSH2_SFTP_ATTRIBUTES *attrs
+    size_t count
+    size_t size
+
+
+cdef int _dir_entries_append(_dir_entries *entries, const char *name,
+                             size_t name_len,
+                             c_sftp.LIBSSH2_SFTP_ATTRIBUTES *attrs) nogil:
+    cdef size_t new_size
+    cdef char *names
+    cdef size_t *name_offsets
+    cdef c_sftp.LIBSSH2_SFTP_ATTRIBUTES *_attrs
+    if entries.count == entries.size:
+        new_size = entries.size * 2 if entries.size > 0 else 256
+        name_offsets = <size_t *>realloc(
+            entries.name_offsets, sizeof(size_t) * (new_size + 1))
+        if name_offsets is NULL:
+            return -1
+        entries.name_offsets = name_offsets
+        _attrs = <c_sftp.LIBSSH2_SFTP_ATTRIBUTES *>realloc(
+            entries.attrs,
+            sizeof(c_sftp.LIBSSH2_SFTP_ATTRIBUTES) * new_size)
+        if _attrs is NULL:
+            return -1
+        entries.attrs = _attrs
+        entries.size = new_size
+    if entries.names_len + name_len > entries.names_size:
+        new_size = entries.names_size * 2 if entries.names_size > 0 else 8192
+        while new_size < entries.names_len + name_len:
+            new_size *= 2
+        names = <char *>realloc(entries.names, new_size)
+        if names is NULL:
+            return -1
+        entries.names = names
+        entries.names_size = new_size
+    memcpy(entries.names + entries.names_len, name, name_len)
+    entries.name_offsets[entries.count] = entries.names_len
+    entries.names_len += name_len
+    entries.name_offsets[entries.count + 1] = entries.names_len
+    entries.attrs[entries.count] = attrs[0]
+    entries.count += 1
+    return 0
+
+
+cdef void _dir_entries_free(_dir_entries *entries) nogil:
+    free(entries.names)
+    free(entries.name_offsets)
+    free(entries.attrs)
+    memset(entries, 0, sizeof(_dir_entries))
+
+
+cdef int _readdir_entries(c_sftp.LIBSSH2_SFTP_HANDLE *handle,
+                          _dir_entries *entries, char *buf,
+                          size_t buffer_maxlen) nogil:
+    """Read directory entries, except ``.`` and ``..``, until end of
+    directory or error.
+
+    Returns 0 on end of directory, ``LIBSSH2_ERROR_EAGAIN`` if reading should
+    be resumed when the socket is ready, -1 on memory allocation failure or
+    other negative libssh2 error code."""
+    cdef int rc
+    cdef c_sftp.LIBSSH2_SFTP_ATTRIBUTES attrs
+    while True:
+        rc = c_sftp.libssh2_sftp_readdir(handle, buf, buffer_maxlen, &attrs)
+        if rc <= 0:
+            return rc
+        if buf[0] == b'.' and (rc == 1 or (rc == 2 and buf[1] == b'.')):
+            continue
+        if _dir_entries_append(entries, buf, rc, &attrs) != 0:
+            return -1
+
+
+cdef int _read_dir(SFTP sftp, bytes b_path, _dir_entries *entries,
+                   size_t buffer_maxlen) except -1:
+    """Open directory and read all of its entries, waiting on socket in
+    non-blocking mode."""
+    cdef SFTPHandle handle = _open_handle(
+        sftp, b_path, 0, 0, c_sftp.LIBSSH2_SFTP_OPENDIR)
+    cdef char *buf = <char *>malloc(sizeof(char) * buffer_maxlen)
+    cdef int rc
+    if buf is NULL:
+        _close_handle(handle)
+        raise MemoryError
+    try:
+        while True:
+            with nogil:
+                rc = _readdir_entries(
+                    handle._handle, entries, buf, buffer_maxlen)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                wait_session(sftp._session)
+                continue
+            elif rc == -1:
+                raise MemoryError
+            return handle_error_codes(rc)
+    finally:
+        free(buf)
+        _close_handle(handle)
+
+
+cdef array _UINT32_ARRAY = array('I')
+cdef array _UINT64_ARRAY = array('Q')
+
+
+cdef SFTPDirListing _dir_listing(_dir_entries *entries):
+    cdef SFTPDirListing listing = SFTPDirListing()
+    cdef size_t count = entries.count
+    cdef size_t i
+    cdef array name_offsets = clone(_UINT64_ARRAY, count + 1, False)
+    cdef array flags = clone(_UINT32_ARRAY, count, False)
+    cdef array filesizes = clone(_UINT64_ARRAY, count, False)
+    cdef array uids = clone(_UINT32_ARRAY, count, False)
+    cdef array gids = clone(_UINT32_ARRAY, count, False)
+    cdef array permissions = clone(_UINT32_ARRAY, count, False)
+    cdef array atimes = clone(_UINT32_ARRAY, count, False)
+    cdef array mtimes = clone(_UINT32_ARRAY, count, False)
+    cdef c_sftp.LIBSSH2_SFTP_ATTRIBUTES *attrs
+    with nogil:
+        name_offsets.data.as_ulonglongs[0] = 0
+        for i in range(count):
+            attrs = &entries.attrs[i]
+            name_offsets.data.as_ulonglongs[i + 1] = entries.name_offsets[i + 1]
+            flags.data.as_uints[i] = attrs.flags
+            filesizes.data.as_ulonglongs[i] = attrs.filesize
+            uids.data.as_uints[i] = attrs.uid
+            gids.data.as_uints[i] = attrs.gid
+            permissions.data.as_uints[i] = attrs.permissions
+            atimes.data.as_uints[i] = attrs.atime
+            mtimes.data.as_uints[i] = attrs.mtime
+    listing.names = entries.names[:entries.names_len] \
+        if entries.names_len > 0 else b''
+    listing.name_offsets = name_offsets
+    listing.flags = flags
+    listing.filesizes = filesizes
+    listing.uids = uids
+    listing.gids = gids
+    listing.permissions = permissions
+    listing.atimes = atimes
+    listing.mtimes = mtimes
+    return listing
+
+
+cdef SFTPAttributes _stat_wait(SFTP sftp, bytes b_path):
+    """Stat path, waiting on socket in non-blocking mode."""
+    cdef SFTPAttributes attrs = SFTPAttributes()
+    cdef char *_path = b_path
+    cdef int rc
+    while True:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_stat(sftp._sftp, _path, attrs._attrs)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            return attrs
+        wait_session(sftp._session)
+
+
+cdef object _resolve_path(SFTP sftp, bytes b_path, size_t max_len,
+                          bint readlink):
+    """Get real path or symlink target of path, retrying with a larger buffer
+    while it is too small."""
+    cdef char *_path = b_path
+    cdef char *_target = NULL
+    cdef char *_buf
+    cdef size_t buf_len = max_len if max_len > 0 else 256
+    cdef int rc
+    try:
+        while True:
+            _buf = <char *>realloc(_target, sizeof(char) * buf_len)
+            if _buf is NULL:
+                raise MemoryError
+            _target = _buf
+            with nogil:
+                if readlink:
+                    rc = c_sftp.libssh2_sftp_readlink(
+                        sftp._sftp, _path, _target, buf_len)
+                else:
+                    rc = c_sftp.libssh2_sftp_realpath(
+                        sftp._sftp, _path, _target, buf_len)
+            if rc == error_codes._LIBSSH2_ERROR_BUFFER_TOO_SMALL \
+               and buf_len < _MAX_LINK_BUFFER:
+                buf_len = buf_len * 2 if buf_len * 2 < _MAX_LINK_BUFFER \
+                    else _MAX_LINK_BUFFER
+                continue
+            elif rc < 0:
+                return handle_error_codes(rc)
+            return to_str_len(_target, rc)
+    finally:
+        free(_target)
+
+
+cdef SFTP _sftp_init_wait(Session session):
+    """Initialise new SFTP channel, waiting on socket in non-blocking
+    mode."""
+    cdef c_sftp.LIBSSH2_SFTP *_sftp
+    cdef int rc
+    while True:
+        with nogil:
+            _sftp = c_sftp.libssh2_sftp_init(session._session)
+        if _sftp is not NULL:
+            return PySFTP(_sftp, session)
+        rc = c_ssh2.libssh2_session_last_errno(session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise SFTPError("Error initialising SFTP channel")
+        wait_session(session)
+
+
+cdef int _sftp_shutdown_wait(SFTP sftp) except -1:
+    """Shut down SFTP channel, waiting on socket in non-blocking mode."""
+    cdef int rc
+    if sftp._sftp is NULL:
+        return 0
+    while True:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_shutdown(sftp._sftp)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            break
+        wait_session(sftp._session)
+    sftp._sftp = NULL
+    return handle_error_codes(rc)
+
+
+cdef class _DirReader:
+    """Reads one directory at a time on an SFTP channel without waiting on
+    the socket, so that several readers on separate channels can have
+    requests in flight at once."""
+
+    cdef SFTP sftp
+    cdef SFTPHandle handle
+    cdef _dir_entries entries
+    cdef char *buf
+    cdef size_t buffer_maxlen
+    cdef bytes b_path
+    cdef int read_rc
+    cdef bint read_done
+    cdef object error
+    cdef object node
+
+    def __cinit__(self, SFTP sftp, size_t buffer_maxlen):
+        self.sftp = sftp
+        self.handle = None
+        self.buffer_maxlen = buffer_maxlen
+        self.buf = <char *>malloc(sizeof(char) * buffer_maxlen)
+        if self.buf is NULL:
+            raise MemoryError
+        memset(&self.entries, 0, sizeof(_dir_entries))
+        self.node = None
+
+    def __dealloc__(self):
+        free(self.buf)
+        _dir_entries_free(&self.entries)
+
+    cdef void start(self, bytes b_path, object node):
+        _dir_entries_free(&self.entries)
+        self.b_path = b_path
+        self.node = node
+        self.handle = None
+        self.read_done = False
+        self.read_rc = 0
+        self.error = None
+
+    cdef bint step(self) except -1:
+        """Make progress on reading directory.
+
+        Returns ``True`` when directory has been read or reading has failed,
+        ``False`` when waiting on socket."""
+        cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
+        cdef char *_path = self.b_path
+        cdef unsigned int path_len = len(self.b_path)
+        cdef int rc
+        if self.handle is None:
+            with nogil:
+                _handle = c_sftp.libssh2_sftp_open_ex(
+                    self.sftp._sftp, _path, path_len, 0, 0,
+                    c_sftp.LIBSSH2_SFTP_OPENDIR)
+            if _handle is NULL:
+                rc = c_ssh2.libssh2_session_last_errno(
+                    self.sftp._session._session)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    return False
+                try:
+                    handle_error_codes(rc)
+                    raise SFTPHandleError(
+                        "Error opening directory %s" % (self.b_path,))
+                except Exception as ex:
+                    self.error = ex
+                return True
+            self.handle = PySFTPHandle(_handle, self.sftp)
+        if not self.read_done:
+            with nogil:
+                rc = _readdir_entries(
+                    self.handle._handle, &self.entries, self.buf,
+                    self.buffer_maxlen)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                return False
+            self.read_rc = rc
+            self.read_done = True
+        with nogil:
+            rc = c_sftp.libssh2_sftp_close_handle(self.handle._handle)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            return False
+        self.handle._closed = 1
+        return True
+
+    cdef int close(self) except -1:
+        """Close directory handle of an unfinished read and shut down SFTP
+        channel, waiting on socket in non-blocking mode."""
+        cdef SFTPHandle handle = self.handle
+        cdef int rc
+        self.handle = None
+        try:
+            if handle is not None and not handle._closed:
+                while True:
+                    with nogil:
+                        rc = c_sftp.libssh2_sftp_close_handle(handle._handle)
+                    if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                        break
+                    wait_session(self.sftp._session)
+        finally:
+            if handle is not None:
+                handle._closed = 1
+            _sftp_shutdown_wait(self.sftp)
+        return 0
+
+    cdef object result(self, bint decode):
+        """Get ``(entries, error)`` of directory read, with entries a list of
+        ``(name, permissions)`` tuples."""
+        cdef size_t i
+        cdef list entries
+        if self.error is not None:
+            return None, self.error
+        elif self.read_rc == -1:
+            return None, MemoryError()
+        elif self.read_rc < 0:
+            try:
+                handle_error_codes(self.read_rc)
+            except Exception as ex:
+                return None, ex
+        entries = [None] * self.entries.count
+        for i in range(self.entries.count):
+            name = self.entries.names[
+                self.entries.name_offsets[i]:self.entries.name_offsets[i + 1]]
+            entries[i] = (name.decode('utf-8', 'surrogateescape') if decode
+                          else name,
+                          self.entries.attrs[i].permissions)
+        _dir_entries_free(&self.entries)
+        return entries, None
+
+
+cdef object _walk_join(top, name):
+    cdef object sep = '/' if isinstance(top, str) else b'/'
+    return top + name if top.endswith(sep) else top + sep + name
+
+
+cdef SFTPAttributes _lstat_wait(SFTP sftp, bytes b_path):
+    """Lstat path, waiting on socket in non-blocking mode."""
+    cdef SFTPAttributes attrs = SFTPAttributes()
+    cdef char *_path = b_path
+    cdef int rc
+    while True:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_lstat(sftp._sftp, _path, attrs._attrs)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            return attrs
+        wait_session(sftp._session)
+
+
+cdef int _close_readers(list readers) except -1:
+    """Close directory readers' additional SFTP channels, all of them even
+    if closing one fails."""
+    cdef _DirReader reader
+    if not readers:
+        return 0
+    reader = readers.pop()
+    try:
+        reader.close()
+    finally:
+        _close_readers(readers)
+    return 0
+
+
+cdef object _glob_matcher(part, bint decode):
+    """Get match function of glob pattern component, or ``None`` if it has
+    no wildcards."""
+    if decode:
+        if _GLOB_MAGIC.search(part) is None:
+            return None
+        return re.compile(_fnmatch_translate(part)).match
+    if _GLOB_MAGIC_BYTES.search(part) is None:
+        return None
+    return re.compile(_fnmatch_translate(
+        part.decode('latin-1')).encode('latin-1')).match
+
+
+cdef object _glob_check(SFTP sftp, path, bint dir_only, sep):
+    """Get path if it exists, and is a directory with ``sep`` appended if
+    ``dir_only`` is set, otherwise ``None``."""
+    cdef SFTPAttributes attrs
+    try:
+        if not dir_only:
+            _lstat_wait(sftp, to_bytes(path))
+            return path
+        attrs = _stat_wait(sftp, to_bytes(path))
+    except SFTPError:
+        return None
+    if not c_sftp.LIBSSH2_SFTP_S_ISDIR(attrs._attrs.permissions):
+        return None
+    return path + sep
+
+
+cdef tuple _glob_literal(list parts, list matchers, path, Py_ssize_t index):
+    """Append pattern components without wildcards from ``index`` to path.
+
+    Returns path and index of next component with wildcards."""
+    while index < len(parts) and matchers[index] is None:
+        path = _walk_join(path, parts[index]) if path else parts[index]
+        index += 1
+    return path, index
+
+
+cdef Py_ssize_t _handle_readinto(SFTPHandle handle, object b) except -1:
+    """Read into writable buffer until full or end of file, waiting on socket
+    in non-blocking mode."""
+    cdef Py_buffer view
+    cdef Py_ssize_t total = 0
+    cdef ssize_t rc
+    cdef bytes data
+    PyObject_GetBuffer(b, &view, PyBUF_WRITABLE)
+    try:
+        if handle._read_cache is not None:
+            data = handle._cached_read(view.len)
+            total = len(data)
+            memcpy(view.buf, <char *>data, total)
+            return total
+        while total < view.len:
+            with nogil:
+                rc = c_sftp.libssh2_sftp_read(
+                    handle._handle, <char *>view.buf + total,
+                    view.len - total)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                wait_session(handle._sftp._session)
+                continue
+            elif rc < 0:
+                handle_error_codes(rc)
+            elif rc == 0:
+                break
+            total += rc
+        return total
+    finally:
+        PyBuffer_Release(&view)
+
+
+cdef Py_ssize_t _handle_write(SFTPHandle handle, object b) except -1:
+    """Write all of buffer, waiting on socket in non-blocking mode."""
+    cdef Py_buffer view
+    cdef Py_ssize_t total = 0
+    cdef ssize_t rc
+    cdef c_ssh2.libssh2_uint64_t offset = handle._offset
+    cdef bint cached = handle._read_cache is not None
+    PyObject_GetBuffer(b, &view, PyBUF_SIMPLE)
+    try:
+        # As SFTPHandle.write - seeking flushes pipelined writes
+        if cached and handle._reposition:
+            with nogil:
+                c_sftp.libssh2_sftp_seek64(handle._handle, offset)
+            handle._reposition = False
+        while total < view.len:
+            with nogil:
+                rc = c_sftp.libssh2_sftp_write(
+                    handle._handle, <char *>view.buf + total,
+                    view.len - total)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                wait_session(handle._sftp._session)
+                continue
+            elif rc < 0:
+                handle_error_codes(rc)
+            total += rc
+        if total > 0:
+            handle._invalidate_cache()
+            if cached:
+                handle._drop_blocks(offset, total)
+                handle._offset += total
+        return total
+    finally:
+        PyBuffer_Release(&view)
+
+
+class SFTPFileIO(io.RawIOBase):
+    """Raw, unbuffered, :py:mod:`io` file object of an SFTP file handle.
+
+    Normally created via :py:func:`ssh2.sftp.SFTP.open_file`, which wraps it
+    in a buffered reader, writer or text wrapper as requested.
+
+    Each read fills the whole of the buffer passed in unless end of file is
+    reached, and each write writes all of it, in native loops with the GIL
+    released - libssh2 pipelines large reads and writes as multiple SFTP
+    requests in flight. Works in both blocking and non-blocking mode.
+
+    Reads are served from the handle's block cache when enabled with
+    :py:func:`ssh2.sftp_handle.SFTPHandle.enable_read_cache`.
+
+    :param handle: Open file handle.
+    :type handle: :py:class:`ssh2.sftp_handle.SFTPHandle`
+    :param name: Path the handle was opened with.
+    :type name: str
+    :param mode: File mode, as for :py:func:`open`.
+    :type mode: str"""
+
+    def __init__(self, SFTPHandle handle not None, name, mode='rb'):
+        super(SFTPFileIO, self).__init__()
+        self._handle = handle
+        self._pos = 0
+        self.name = name
+        self.mode = mode
+        self._readable = 'r' in mode or '+' in mode
+        self._writable = 'r' not in mode or '+' in mode
+
+    @property
+    def handle(self):
+        """Underlying SFTP file handle."""
+        return self._handle
+
+    def readable(self):
+        self._checkClosed()
+        return self._readable
+
+    def writable(self):
+        self._checkClosed()
+        return self._writable
+
+    def seekable(self):
+        self._checkClosed()
+        return True
+
+    def readinto(self, b):
+        self._checkClosed()
+        if not self._readable:
+            raise io.UnsupportedOperation("File not open for reading")
+        cdef Py_ssize_t rc = _handle_readinto(self._handle, b)
+        self._pos += rc
+        return rc
+
+    def readall(self):
+        self._checkClosed()
+        cdef SFTPAttributes attrs = SFTPAttributes()
+        _handle_fstat(self._handle, attrs, 0)
+        size = attrs.filesize - self._pos
+        if size <= 0:
+            return super(SFTPFileIO, self).readall()
+        data = bytearray(size)
+        size = self.readinto(data)
+        del data[size:]
+        # File may have grown since stat
+        return bytes(data) + super(SFTPFileIO, self).readall()
+
+    def write(self, b):
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        cdef Py_ssize_t rc = _handle_write(self._handle, b)
+        self._pos += rc
+        return rc
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        cdef SFTPHandle handle = self._handle
+        cdef SFTPAttributes attrs
+        cdef c_ssh2.libssh2_uint64_t pos
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            new_pos = offset
+        elif whence == io.SEEK_CUR:
+            new_pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            attrs = SFTPAttributes()
+            _handle_fstat(handle, attrs, 0)
+            new_pos = attrs.filesize + offset
+        else:
+            raise ValueError("Invalid whence (%r)" % (whence,))
+        if new_pos < 0:
+            raise ValueError("Negative seek position %r" % (new_pos,))
+        pos = new_pos
+        if handle._read_cache is not None:
+            if handle._offset != pos:
+                handle._offset = pos
+                handle._reposition = True
+            self._pos = new_pos
+        # Seeking discards data read ahead by libssh2 - skip if not moving
+        elif new_pos != self._pos:
+            with nogil:
+                c_sftp.libssh2_sftp_seek64(handle._handle, pos)
+            self._pos = new_pos
+        return self._pos
+
+    def tell(self):
+        self._checkClosed()
+        return self._pos
+
+    def truncate(self, size=None):
+        cdef SFTPAttributes attrs = SFTPAttributes()
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        if size is None:
+            size = self._pos
+        attrs.flags = c_sftp.LIBSSH2_SFTP_ATTR_SIZE
+        attrs.filesize = size
+        _handle_fstat(self._handle, attrs, 1)
+        (<SFTPHandle>self._handle)._invalidate_cache()
+        if (<SFTPHandle>self._handle)._read_cache is not None:
+            (<SFTPHandle>self._handle)._read_cache.clear()
+        return size
+
+    def close(self):
+        if not self.closed:
+            try:
+                _close_handle(self._handle)
+            finally:
+                super(SFTPFileIO, self).close()
+
+
+def _fxp_packet_length(bytes header):
+    """Get length of SFTP packet from its four byte header, checking it has
+    a packet type and is within ``_SFTP_MAX_PACKET_LENGTH``.
+
+    :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on invalid
+      length."""
+    cdef unsigned int length = _U32.unpack(header)[0]
+    if length < 1 or length > _SFTP_MAX_PACKET_LENGTH:
+        raise SFTPProtocolError("Invalid SFTP packet length %s" % (length,))
+    return length
+
+
+cdef bytes _fxp_string(bytes value):
+    return _U32.pack(len(value)) + value
+
+
+cdef class SFTPLimits:
+    """Server limits as returned by the ``limits@openssh.com`` extension.
+
+    Zero means the server did not set a limit."""
+    cdef readonly unsigned long long max_packet_length
+    cdef readonly unsigned long long max_read_length
+    cdef readonly unsigned long long max_write_length
+    cdef readonly unsigned long long max_open_handles
+
+    def __repr__(self):
+        return "SFTPLimits(max_packet_length=%s, max_read_length=%s, " \
+            "max_write_length=%s, max_open_handles=%s)" % (
+                self.max_packet_length, self.max_read_length,
+                self.max_write_length, self.max_open_handles)
+
+
+cdef class _ExtensionChannel:
+    """Minimal SFTP protocol version 3 client on its own ``sftp`` subsystem
+    channel, for extension requests that libssh2 has no API for.
+
+    Extensions supported by the server are negotiated when the channel is
+    opened. Requests are made one at a time, waiting on socket in
+    non-blocking mode."""
+    cdef Session _session
+    cdef Channel _channel
+    cdef dict extensions
+    cdef unsigned int _request_id
+
+    def __cinit__(self, Session session):
+        self._session = session
+        self._request_id = 0
+        self.extensions = {}
+
+    cdef int _open(self) except -1:
+        cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+        cdef int rc
+        cdef unsigned int offset
+        cdef unsigned int name_len
+        cdef unsigned int data_len
+        while True:
+            with nogil:
+                _channel = c_ssh2.libssh2_channel_open_session(
+                    self._session._session)
+            if _channel is not NULL:
+                break
+            rc = c_ssh2.libssh2_session_last_errno(self._session._session)
+            if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                handle_error_codes(rc)
+                raise SFTPError("Error opening SFTP extension channel")
+            wait_session(self._session)
+        self._channel = PyChannel(_channel, self._session)
+        while True:
+            with nogil:
+                rc = c_ssh2.libssh2_channel_subsystem(_channel, b"sftp")
+            if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                break
+            wait_session(self._session)
+        handle_error_codes(rc)
+        self._write_all(_U32.pack(5) + bytes((_FXP_INIT,)) + _U32.pack(3))
+        ptype, body = self._read_packet()
+        if ptype != _FXP_VERSION:
+            raise SFTPProtocolError(
+                "Unexpected SFTP packet type %s, expected version" % (ptype,))
+        offset = 4
+        while offset < len(body):
+            name_len = _U32.unpack_from(body, offset)[0]
+            name = body[offset + 4:offset + 4 + name_len]
+            offset += 4 + name_len
+            data_len = _U32.unpack_from(body, offset)[0]
+            data = body[offset + 4:offset + 4 + data_len]
+            offset += 4 + data_len
+            self.extensions[name.decode('utf-8')] = data.decode(
+                'utf-8', 'replace')
+        return 0
+
+    cdef int _write_all(self, bytes data) except -1:
+        cdef const char *buf = data
+        cdef size_t size = len(data)
+        cdef size_t total = 0
+        cdef ssize_t rc
+        while total < size:
+            with nogil:
+                rc = c_ssh2.libssh2_channel_write_ex(
+                    self._channel._channel, 0, buf + total, size - total)
+            if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                wait_session(self._session)
+                continue
+            elif rc < 0:
+                handle_error_codes(rc)
+            total += rc
+        return 0
+
+    cdef bytes _read_exact(self, size_t size):
+        cdef char *buf = <char *>malloc(sizeof(char) * size)
+        cdef size_t total = 0
+        cdef ssize_t rc
+        if buf is NULL:
+            raise MemoryError
+        try:
+            while total < size:
+                with nogil:
+                    rc = c_ssh2.libssh2_channel_read_ex(
+                        self._channel._channel, 0, buf + total, size - total)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    wait_session(self._session)
+                    continue
+                elif rc < 0:
+                    handle_error_codes(rc)
+                elif rc == 0:
+                    raise SFTPProtocolError("SFTP extension channel closed")
+                total += rc
+            return buf[:size]
+        finally:
+            free(buf)
+
+    cdef tuple _read_packet(self):
+        cdef unsigned int length = _fxp_packet_length(self._read_exact(4))
+        cdef bytes data = self._read_exact(length)
+        return data[0], data[1:]
+
+    cdef tuple _request(self, int ptype, bytes payload):
+        """Send request and read its response.
+
+        Returns response packet type and data following request id. Channel
+        is closed on errors, its protocol state being unknown."""
+        self._request_id = (self._request_id + 1) & 0xFFFFFFFF
+        cdef unsigned int request_id = self._request_id
+        cdef bytes packet = bytes((ptype,)) + _U32.pack(request_id) + payload
+        if self._channel is None:
+            raise SFTPProtocolError("SFTP extension channel closed")
+        try:
+            self._write_all(_U32.pack(len(packet)) + packet)
+            rtype, body = self._read_packet()
+            if len(body) < 4 or _U32.unpack_from(body)[0] != request_id:
+                raise SFTPProtocolError("Unexpected SFTP response id")
+        except Exception:
+            self._close()
+            raise
+        return rtype, body[4:]
+
+    cdef int _close(self) except -1:
+        """Close channel without waiting on remote end, channel is freed
+        once no longer referenced."""
+        if self._channel is None:
+            return 0
+        with nogil:
+            c_ssh2.libssh2_channel_close(self._channel._channel)
+        self._channel = None
+        return 0
+
+    cdef int _check_status(self, int rtype, bytes body, what) except -1:
+        cdef unsigned int code
+        cdef unsigned int msg_len
+        if rtype != _FXP_STATUS:
+            raise SFTPProtocolError(
+                "Unexpected SFTP packet type %s in response to %s" % (
+                    rtype, what))
+        code = _U32.unpack_from(body)[0]
+        if code != 0:
+            msg_len = _U32.unpack_from(body, 4)[0] if len(body) >= 8 else 0
+            raise SFTPProtocolError(
+                "%s failed with SFTP status %s - %s" % (
+                    what, code,
+                    body[8:8 + msg_len].decode('utf-8', 'replace')))
+        return 0
+
+    cdef tuple _extended(self, str name, bytes payload):
+        if name not in self.extensions:
+            raise SFTPError("Server does not support %s extension" % (name,))
+        return self._request(
+            _FXP_EXTENDED, _fxp_string(name.encode('utf-8')) + payload)
+
+    cdef bytes _open_handle(self, bytes path, unsigned long flags, long mode):
+        cdef unsigned int handle_len
+        rtype, body = self._request(
+            _FXP_OPEN, _fxp_string(path) + _U32.pack(flags) +
+            _U32.pack(c_sftp.LIBSSH2_SFTP_ATTR_PERMISSIONS) + _U32.pack(mode))
+        if rtype != _FXP_HANDLE:
+            self._check_status(rtype, body, "Opening %s" % (path,))
+        handle_len = _U32.unpack_from(body)[0]
+        return body[4:4 + handle_len]
+
+    cdef int _close_handle(self, bytes handle) except -1:
+        rtype, body = self._request(_FXP_CLOSE, _fxp_string(handle))
+        return self._check_status(rtype, body, "Closing handle")
+
+
+cdef object _pool_stat(SFTP sftp, path):
+    return sftp.stat(path)
+
+
+cdef object _pool_lstat(SFTP sftp, path):
+    return sftp.lstat(path)
+
+
+cdef object _pool_unlink(SFTP sftp, path):
+    return sftp.unlink(path)
+
+
+cdef object _pool_setstat(SFTP sftp, item):
+    return sftp.setstat(item[0], item[1])
+
+
+cdef class SFTPPool:
+    """Pool of SFTP channels on one session for running many metadata
+    operations at once.
+
+    An SFTP channel has one request in flight at a time, so operations on
+    thousands of paths cost one round trip each. Batch methods of a pool
+    instead spread their paths over all of its channels with the session in
+    non-blocking mode, keeping one request in flight per channel, and
+    return results in the order of their input.
+
+    Created with :py:func:`ssh2.session.Session.sftp_pool`. Works whether
+    session is in blocking or non-blocking mode - its mode is restored once a
+    batch completes.
+
+    :param session: Session to open SFTP channels on.
+    :type session: :py:class:`ssh2.session.Session`
+    :param size: Number of SFTP channels.
+    :type size: int"""
+
+    def __cinit__(self, Session session not None, int size=4):
+        if size < 1:
+            raise ValueError("Pool size must be at least one")
+        self._session = session
+        self.channels = tuple(_sftp_init_wait(session) for _ in range(size))
+
+    def __len__(self):
+        return len(self.channels)
+
+    @property
+    def session(self):
+        """Originating session."""
+        return self._session
+
+    cdef list _run(self, list items, object call, bint return_exceptions):
+        """Run ``call(channel, item)`` for all items over pool channels.
+
+        Calls returning ``LIBSSH2_ERROR_EAGAIN`` are repeated on the same
+        channel once the socket is ready. On errors, no more items are
+        started, those in flight are completed and first error in input
+        order raised, unless ``return_exceptions`` is set in which case
+        exceptions are returned in place of results."""
+        cdef Py_ssize_t num_items = len(items)
+        cdef Py_ssize_t num_channels = min(len(self.channels), num_items)
+        cdef list results = [None] * num_items
+        cdef list active = [-1] * num_channels
+        cdef Py_ssize_t next_item = 0
+        cdef Py_ssize_t error_index = -1
+        cdef Py_ssize_t i
+        cdef Py_ssize_t index
+        cdef bint progressed
+        cdef bint blocking = self._session.get_blocking()
+        self._session.set_blocking(False)
+        try:
+            while True:
+                progressed = False
+                for i in range(num_channels):
+                    if active[i] < 0:
+                        if next_item >= num_items or (
+                                error_index >= 0 and not return_exceptions):
+                            continue
+                        active[i] = next_item
+                        next_item += 1
+                    index = active[i]
+                    try:
+                        rc = call(self.channels[i], items[index])
+                    except Exception as ex:
+                        rc = ex
+                        if error_index < 0 or index < error_index:
+                            error_index = index
+                    else:
+                        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                            continue
+                    results[index] = rc
+                    active[i] = -1
+                    progressed = True
+                if all(_index < 0 for _index in active) and (
+                        next_item >= num_items or (
+                            error_index >= 0 and not return_exceptions)):
+                    break
+                if not progressed:
+                    wait_session(self._session)
+        finally:
+            self._session.set_blocking(blocking)
+        if error_index >= 0 and not return_exceptions:
+            raise results[error_index]
+        return results
+
+    def stat_many(self, paths not None, bint return_exceptions=False):
+        """Stat all paths.
+
+        :param paths: Paths to stat.
+        :type paths: iter(str)
+        :param return_exceptions: Return exceptions of paths that failed in
+          place of their attributes rather than raising the first one.
+        :type return_exceptions: bool
+
+        :rtype: list(:py:class:`ssh2.sftp_handle.SFTPAttributes`)"""
+        return self._run(list(paths), _pool_stat, return_exceptions)
+
+    def lstat_many(self, paths not None, bint return_exceptions=False):
+        """Lstat all paths, not following symbolic links.
+
+        :param paths: Paths to lstat.
+        :type paths: iter(str)
+        :param return_exceptions: Return exceptions of paths that failed in
+          place of their attributes rather than raising the first one.
+        :type return_exceptions: bool
+
+        :rtype: list(:py:class:`ssh2.sftp_handle.SFTPAttributes`)"""
+        return self._run(list(paths), _pool_lstat, return_exceptions)
+
+    def unlink_many(self, paths not None, bint return_exceptions=False):
+        """Delete all paths.
+
+        :param paths: Paths to delete.
+        :type paths: iter(str)
+        :param return_exceptions: Return exceptions of paths that failed in
+          place of their return codes rather than raising the first one.
+        :type return_exceptions: bool
+
+        :rtype: list(int)"""
+        return self._run(list(paths), _pool_unlink, return_exceptions)
+
+    def setstat_many(self, items not None, bint return_exceptions=False):
+        """Set attributes of all paths.
+
+        :param items: ``(path, attributes)`` tuples.
+        :type items: iter(tuple(str,
+          :py:class:`ssh2.sftp_handle.SFTPAttributes`))
+        :param return_exceptions: Return exceptions of paths that failed in
+          place of their return codes rather than raising the first one.
+        :type return_exceptions: bool
+
+        :rtype: list(int)"""
+        # libssh2 clears attributes on successful setstat - copy them so
+        # that attributes shared by several items apply to all of them.
+        return self._run(
+            [(path, _copy_attrs(attrs)) for path, attrs in items],
+            _pool_setstat, return_exceptions)
+
+    def makedirs_many(self, paths not None, long mode=0o755):
+        """Create all directories and any missing parent directories, like
+        ``mkdir -p``. Existing directories are not an error.
+
+        Directories are created one depth at a time, all directories of a
+        depth at once, with directories that fail to be created checked to
+        already be directories.
+
+        :param paths: Directories to create.
+        :type paths: iter(str)
+        :param mode: Permissions of created directories.
+        :type mode: int
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on a path
+          that cannot be created and is not an existing directory.
+
+        :rtype: list(str) of directories created."""
+        cdef dict levels = {}
+        cdef list created = []
+        cdef list level
+        cdef list results
+        cdef list failed
+        cdef set seen = set()
+        cdef Py_ssize_t i
+        for path in paths:
+            b_path = to_bytes(path).rstrip(b'/')
+            parts = b_path.split(b'/')
+            for i in range(1, len(parts) + 1):
+                parent = b'/'.join(parts[:i])
+                if not parent or parent in seen:
+                    continue
+                seen.add(parent)
+                levels.setdefault(i, []).append(
+                    path[:len(parent)] if isinstance(path, bytes)
+                    else parent.decode('utf-8', 'surrogateescape'))
+        for i in sorted(levels):
+            level = levels[i]
+            results = self._run(
+                level, lambda sftp, _path: sftp.mkdir(_path, mode), True)
+            failed = [level[_i] for _i in range(len(level))
+                      if isinstance(results[_i], Exception)]
+            created.extend(level[_i] for _i in range(len(level))
+                           if not isinstance(results[_i], Exception))
+            if not failed:
+                continue
+            for _path, attrs in zip(failed, self.stat_many(
+                    failed, return_exceptions=True)):
+                if isinstance(attrs, Exception) or \
+                   not c_sftp.LIBSSH2_SFTP_S_ISDIR(attrs.permissions):
+                    raise results[level.index(_path)]
+        return created
+
+
+cdef SFTPAttributes _copy_attrs(SFTPAttributes attrs):
+    cdef SFTPAttributes _attrs = SFTPAttributes()
+    _attrs._attrs[0] = attrs._attrs[0]
+    return _attrs
+
+
+cdef class SFTPAttributeCache:
+    """Least recently used cache of SFTP path attributes, real paths and
+    symlink targets with expiry.
+
+    Enabled on an SFTP session with
+    :py:func:`ssh2.sftp.SFTP.enable_attr_cache`, after which
+    :py:func:`ssh2.sftp.SFTP.stat`, :py:func:`ssh2.sftp.SFTP.lstat`,
+    :py:func:`ssh2.sftp.SFTP.realpath` and :py:func:`ssh2.sftp.SFTP.readlink`
+    results are served from and stored in the cache, and directory listings
+    store attributes of their entries.
+
+    Entries of a path are invalidated by calls on the same SFTP session that
+    change it - ``unlink``, ``rename``, ``setstat``, ``mkdir``, ``rmdir``,
+    ``symlink`` and writes or attribute changes through an
+    :py:class:`ssh2.sftp_handle.SFTPHandle` of the path. Paths are cached as
+    given without normalisation, and changes made by other clients, or seen
+    through another path to the same file, are only picked up once entries
+    expire.
+
+    :param max_entries: Max number of cached entries, least recently used
+      entries are evicted first.
+    :type max_entries: int
+    :param ttl: Seconds after which entries expire. Zero for no expiry.
+    :type ttl: float"""
+
+    def __cinit__(self, size_t max_entries=1024, double ttl=5.0):
+        if max_entries == 0:
+            raise ValueError("Max entries must be greater than zero")
+        self._entries = OrderedDict()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    cdef object _get(self, int kind, bytes path):
+        key = (kind, path)
+        try:
+            expiry, value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        if self.ttl > 0 and monotonic() >= expiry:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    cdef int _put(self, int kind, bytes path, object value) except -1:
+        key = (kind, path)
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return 0
+
+    cdef int _put_entry(self, bytes dirpath, bytes name, object attrs) except -1:
+        cdef SFTPAttributes _attrs = attrs
+        if name == b'.' or name == b'..':
+            return 0
+        path = dirpath + name if dirpath.endswith(b'/') \
+            else dirpath + b'/' + name
+        self._put(_ATTR_CACHE_LSTAT, path, _copy_attrs(_attrs))
+        if not c_sftp.LIBSSH2_SFTP_S_ISLNK(_attrs._attrs.permissions):
+            self._put(_ATTR_CACHE_STAT, path, _copy_attrs(_attrs))
+        return 0
+
+    cdef int _invalidate(self, bytes path, bint recursive=False) except -1:
+        cdef bytes prefix
+        self._entries.pop((_ATTR_CACHE_STAT, path), None)
+        self._entries.pop((_ATTR_CACHE_LSTAT, path), None)
+        self._entries.pop((_ATTR_CACHE_READLINK, path), None)
+        if not recursive:
+            return 0
+        prefix = path if path.endswith(b'/') else path + b'/'
+        for key in [_key for _key in self._entries
+                    if _key[1].startswith(prefix)]:
+            del self._entries[key]
+        return 0
+
+    cdef int _invalidate_realpaths(self) except -1:
+        for key in [_key for _key in self._entries
+                    if _key[0] == _ATTR_CACHE_REALPATH]:
+            del self._entries[key]
+        return 0
+
+    def invalidate(self, path not None, bint recursive=False):
+        """Remove cached attributes of path.
+
+        :param path: Path to remove.
+        :type path: str
+        :param recursive: Also remove cached entries of all paths under
+          ``path``.
+        :type recursive: bool"""
+        self._invalidate(to_bytes(path), recursive)
+
+    def clear(self):
+        """Remove all cached entries."""
+        self._entries.clear()
+
+
 cdef class SFTP:
     """SFTP session.
 
@@ -176,6 +1782,8 @@ cdef class SFTP:
     def __cinit__(self, session):
         self._sftp = NULL
         self._session = session
+        self.attr_cache = None
+        self._ext = None
 
     def __dealloc__(self):
         if self._session is not None and self._session._session is not NULL and self._sftp is not NULL:
@@ -188,6 +1796,26 @@ cdef class SFTP:
         """Originating session."""
         return self._session
 
+    def enable_attr_cache(self, size_t max_entries=1024, double ttl=5.0):
+        """Enable caching of path attributes and real paths on this SFTP
+        session, replacing any existing cache.
+
+        See :py:class:`ssh2.sftp.SFTPAttributeCache` for what is cached and
+        when entries are invalidated.
+
+        :param max_entries: Max number of cached entries.
+        :type max_entries: int
+        :param ttl: Seconds after which entries expire. Zero for no expiry.
+        :type ttl: float
+
+        :rtype: :py:class:`ssh2.sftp.SFTPAttributeCache`"""
+        self.attr_cache = SFTPAttributeCache(max_entries=max_entries, ttl=ttl)
+        return self.attr_cache
+
+    def disable_attr_cache(self):
+        """Disable and remove attribute cache, if any."""
+        self.attr_cache = None
+
     def get_channel(self):
         """Get new channel from the SFTP session"""
         cdef c_ssh2.LIBSSH2_CHANNEL *_channel
@@ -211,7 +1839,11 @@ cdef class SFTP:
         if _handle is NULL:
             return handle_error_codes(c_ssh2.libssh2_session_last_errno(
                 self._session._session))
+        if self.attr_cache is not None and flags & (
+                c_sftp.LIBSSH2_FXF_CREAT | c_sftp.LIBSSH2_FXF_TRUNC):
+            self.attr_cache._invalidate(filename[:filename_len])
         handle = PySFTPHandle(_handle, self)
+        handle._path = filename[:filename_len]
         return handle
 
     def open(self, filename not None,
@@ -249,6 +1881,7 @@ cdef class SFTP:
           file.
         """  # noqa: W605
         cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
+        cdef SFTPHandle handle
         cdef bytes b_filename = to_bytes(filename)
         cdef char *_filename = b_filename
         with nogil:
@@ -257,7 +1890,12 @@ cdef class SFTP:
         if _handle is NULL:
             return handle_error_codes(c_ssh2.libssh2_session_last_errno(
                 self._session._session))
-        return PySFTPHandle(_handle, self)
+        if self.attr_cache is not None and flags & (
+                c_sftp.LIBSSH2_FXF_CREAT | c_sftp.LIBSSH2_FXF_TRUNC):
+            self.attr_cache._invalidate(b_filename)
+        handle = PySFTPHandle(_handle, self)
+        handle._path = b_filename
+        return handle
 
     def opendir(self, path not None):
         """Open handle to directory path.
@@ -271,6 +1909,7 @@ cdef class SFTP:
           directory.
         """
         cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
+        cdef SFTPHandle handle
         cdef bytes b_path = to_bytes(path)
         cdef char *_path = b_path
         with nogil:
@@ -278,7 +1917,109 @@ cdef class SFTP:
         if _handle is NULL:
             return handle_error_codes(c_ssh2.libssh2_session_last_errno(
                 self._session._session))
-        return PySFTPHandle(_handle, self)
+        handle = PySFTPHandle(_handle, self)
+        handle._path = b_path
+        return handle
+
+    def open_file(self, path not None, mode='r', int buffering=-1,
+                  encoding=None, errors=None, newline=None,
+                  long create_mode=0o644):
+        """Open remote file as a file object compatible with :py:func:`open`.
+
+        Binary modes return an :py:class:`io.BufferedReader`,
+        :py:class:`io.BufferedWriter` or :py:class:`io.BufferedRandom` with
+        ``buffering`` sized buffers, text modes an
+        :py:class:`io.TextIOWrapper` around one, and ``buffering=0`` the raw
+        :py:class:`ssh2.sftp.SFTPFileIO`. File objects support ``readinto``,
+        ``seek`` and ``tell`` and can be used with libraries expecting a
+        seekable file, like ``tarfile`` and ``zipfile``.
+
+        Reads fetch a whole buffer at a time, read ahead by libssh2 as
+        multiple requests in flight, and seeks within the buffer do not cause
+        a request. Writes are coalesced in the buffer and written as one
+        pipelined request sequence when it is full.
+
+        :param path: Path of file.
+        :type path: str
+        :param mode: File mode as for :py:func:`open` - one of ``r``,
+          ``w``, ``a`` or ``x`` plus optionally ``+``, ``b`` or ``t``.
+        :type mode: str
+        :param buffering: Buffer size in bytes. ``0`` for unbuffered binary
+          I/O, ``1`` for line buffered text I/O, negative for default of
+          ``SFTP_FILE_BUFFER_SIZE``. As with :py:func:`open`, ``1`` in binary
+          mode warns and uses the default.
+        :type buffering: int
+        :param encoding: Text mode encoding.
+        :type encoding: str
+        :param errors: Text mode encoding error handling.
+        :type errors: str
+        :param newline: Text mode newline handling.
+        :type newline: str
+        :param create_mode: Permissions of file if created.
+        :type create_mode: int
+
+        :rtype: :py:class:`io.IOBase`
+
+        :raises: :py:class:`ValueError` on invalid mode.
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          opening file."""
+        cdef unsigned long flags
+        cdef SFTPHandle handle
+        modes = set(mode)
+        if modes - set('rwaxbt+') or len(mode) > len(modes) or \
+           len(modes & set('rwax')) != 1 or ('b' in modes and 't' in modes):
+            raise ValueError("Invalid mode %r" % (mode,))
+        binary = 'b' in modes
+        if binary and (encoding is not None or errors is not None or
+                       newline is not None):
+            raise ValueError("Binary mode does not take encoding arguments")
+        if buffering == 0 and not binary:
+            raise ValueError("Cannot have unbuffered text I/O")
+        if buffering == 1 and binary:
+            warnings.warn(
+                "line buffering (buffering=1) isn't supported in binary "
+                "mode, the default buffer size will be used",
+                RuntimeWarning, 2)
+        if 'r' in modes:
+            flags = c_sftp.LIBSSH2_FXF_READ
+        elif 'w' in modes:
+            flags = c_sftp.LIBSSH2_FXF_WRITE | c_sftp.LIBSSH2_FXF_CREAT | \
+                c_sftp.LIBSSH2_FXF_TRUNC
+        elif 'a' in modes:
+            flags = c_sftp.LIBSSH2_FXF_WRITE | c_sftp.LIBSSH2_FXF_CREAT | \
+                c_sftp.LIBSSH2_FXF_APPEND
+        else:
+            flags = c_sftp.LIBSSH2_FXF_WRITE | c_sftp.LIBSSH2_FXF_CREAT | \
+                c_sftp.LIBSSH2_FXF_EXCL
+        if '+' in modes:
+            flags |= c_sftp.LIBSSH2_FXF_READ | c_sftp.LIBSSH2_FXF_WRITE
+        handle = _open_handle(self, to_bytes(path), flags, create_mode,
+                              c_sftp.LIBSSH2_SFTP_OPENFILE)
+        raw_mode = ''.join(_mode for _mode in 'rwax' if _mode in modes) + \
+            'b' + ('+' if '+' in modes else '')
+        raw = SFTPFileIO(handle, path, mode=raw_mode)
+        try:
+            if 'a' in modes:
+                raw.seek(0, io.SEEK_END)
+            if buffering == 0:
+                return raw
+            buffer_size = SFTP_FILE_BUFFER_SIZE if buffering < 0 or \
+                buffering == 1 else buffering
+            if '+' in modes:
+                buffered = io.BufferedRandom(raw, buffer_size)
+            elif 'r' in modes:
+                buffered = io.BufferedReader(raw, buffer_size)
+            else:
+                buffered = io.BufferedWriter(raw, buffer_size)
+            if binary:
+                return buffered
+            text = io.TextIOWrapper(buffered, encoding, errors, newline,
+                                    line_buffering=buffering == 1)
+            text.mode = mode
+            return text
+        except Exception:
+            raw.close()
+            raise
 
     def rename_ex(self, const char *source_filename,
                   unsigned int source_filename_len,
@@ -290,6 +2031,9 @@ cdef class SFTP:
             rc = c_sftp.libssh2_sftp_rename_ex(
                 self._sftp, source_filename, source_filename_len,
                 dest_filename, dest_filename_len, flags)
+        if self.attr_cache is not None:
+            self._invalidate_rename(source_filename[:source_filename_len],
+                                    dest_filename[:dest_filename_len])
         return handle_error_codes(rc)
 
     def rename(self, source_filename not None, dest_filename not None):
@@ -307,8 +2051,16 @@ cdef class SFTP:
         with nogil:
             rc = c_sftp.libssh2_sftp_rename(
                 self._sftp, _source_filename, _dest_filename)
+        if self.attr_cache is not None:
+            self._invalidate_rename(b_source_filename, b_dest_filename)
         return handle_error_codes(rc)
 
+    cdef int _invalidate_rename(self, bytes source, bytes dest) except -1:
+        self.attr_cache._invalidate(source, recursive=True)
+        self.attr_cache._invalidate(dest, recursive=True)
+        self.attr_cache._invalidate_realpaths()
+        return 0
+
     def unlink(self, filename not None):
         """Delete/unlink file.
 
@@ -319,6 +2071,9 @@ cdef class SFTP:
         cdef char *_filename = b_filename
         with nogil:
             rc = c_sftp.libssh2_sftp_unlink(self._sftp, _filename)
+        if self.attr_cache is not None:
+            self.attr_cache._invalidate(b_filename)
+            self.attr_cache._invalidate_realpaths()
         return handle_error_codes(rc)
 
     def statvfs(self, path):
@@ -351,6 +2106,8 @@ cdef class SFTP:
         cdef char *_path = b_path
         with nogil:
             rc = c_sftp.libssh2_sftp_mkdir(self._sftp, _path, mode)
+        if self.attr_cache is not None:
+            self.attr_cache._invalidate(b_path)
         return handle_error_codes(rc)
 
     def rmdir(self, path not None):
@@ -365,6 +2122,9 @@ cdef class SFTP:
         cdef char *_path = b_path
         with nogil:
             rc = c_sftp.libssh2_sftp_rmdir(self._sftp, _path)
+        if self.attr_cache is not None:
+            self.attr_cache._invalidate(b_path, recursive=True)
+            self.attr_cache._invalidate_realpaths()
         return handle_error_codes(rc)
 
     def stat(self, path not None):
@@ -378,22 +2138,40 @@ cdef class SFTP:
         cdef int rc
         cdef bytes b_path = to_bytes(path)
         cdef char *_path = b_path
-        cdef SFTPAttributes attrs = SFTPAttributes()
+        cdef SFTPAttributes attrs
+        if self.attr_cache is not None:
+            attrs = self.attr_cache._get(_ATTR_CACHE_STAT, b_path)
+            if attrs is not None:
+                return _copy_attrs(attrs)
+        attrs = SFTPAttributes()
         with nogil:
             rc = c_sftp.libssh2_sftp_stat(
                 self._sftp, _path, attrs._attrs)
-        return handle_error_codes(rc) if rc != 0 else attrs
+        if rc != 0:
+            return handle_error_codes(rc)
+        if self.attr_cache is not None:
+            self.attr_cache._put(_ATTR_CACHE_STAT, b_path, _copy_attrs(attrs))
+        return attrs
 
     def lstat(self, path not None):
         """Link stat a file."""
         cdef int rc
         cdef bytes b_path = to_bytes(path)
         cdef char *_path = b_path
-        cdef SFTPAttributes attrs = SFTPAttributes()
+        cdef SFTPAttributes attrs
+        if self.attr_cache is not None:
+            attrs = self.attr_cache._get(_ATTR_CACHE_LSTAT, b_path)
+            if attrs is not None:
+                return _copy_attrs(attrs)
+        attrs = SFTPAttributes()
         with nogil:
             rc = c_sftp.libssh2_sftp_lstat(
                 self._sftp, _path, attrs._attrs)
-        return handle_error_codes(rc) if rc != 0 else attrs
+        if rc != 0:
+            return handle_error_codes(rc)
+        if self.attr_cache is not None:
+            self.attr_cache._put(_ATTR_CACHE_LSTAT, b_path, _copy_attrs(attrs))
+        return attrs
 
     def setstat(self, path not None, SFTPAttributes attrs):
         """Set file attributes.
@@ -410,8 +2188,188 @@ cdef class SFTP:
         with nogil:
             rc = c_sftp.libssh2_sftp_setstat(
                 self._sftp, _path, attrs._attrs)
+        if self.attr_cache is not None:
+            self.attr_cache._invalidate(b_path)
+        return handle_error_codes(rc)
+
+    cdef object _extension_channel(self):
+        cdef _ExtensionChannel ext = self._ext
+        if ext is not None and ext._channel is not None:
+            return ext
+        # Not opened yet or closed after an error
+        self._ext = None
+        ext = _ExtensionChannel(self._session)
+        try:
+            ext._open()
+        except Exception:
+            ext._close()
+            raise
+        self._ext = ext
+        return ext
+
+    @property
+    def extensions(self):
+        """SFTP protocol extensions supported by server, as dictionary of
+        extension name to extension data, typically its version.
+
+        Negotiated on a separate SFTP channel opened on first use of any
+        extension function, which is then kept open for later requests.
+
+        :rtype: dict"""
+        cdef _ExtensionChannel ext = self._extension_channel()
+        return dict(ext.extensions)
+
+    def limits(self):
+        """Get server limits via ``limits@openssh.com`` extension.
+
+        Maximum read and write lengths are per SFTP request - libssh2
+        already splits reads and writes into requests within OpenSSH's
+        limits. Limits are useful for sizing ``chunk_size`` of transfers
+        and number of concurrently open handles.
+
+        :rtype: :py:class:`ssh2.sftp.SFTPLimits`
+
+        :raises: :py:class:`ssh2.exceptions.SFTPError` if extension is not
+          supported by server."""
+        cdef _ExtensionChannel ext = self._extension_channel()
+        cdef SFTPLimits limits = SFTPLimits.__new__(SFTPLimits)
+        rtype, body = ext._extended('limits@openssh.com', b'')
+        if rtype != _FXP_EXTENDED_REPLY:
+            ext._check_status(rtype, body, "limits@openssh.com")
+            raise SFTPProtocolError(
+                "Unexpected status reply to limits@openssh.com")
+        if len(body) < 32:
+            raise SFTPProtocolError("limits@openssh.com reply too short")
+        (limits.max_packet_length, limits.max_read_length,
+         limits.max_write_length, limits.max_open_handles) = struct.unpack_from(
+             '>QQQQ', body)
+        return limits
+
+    def posix_rename(self, source_filename not None, dest_filename not None):
+        """Rename file via ``posix-rename@openssh.com`` extension, atomically
+        replacing destination if it exists.
+
+        :param source_filename: Old name of file.
+        :type source_filename: str
+        :param dest_filename: New name of file.
+        :type dest_filename: str
+
+        :raises: :py:class:`ssh2.exceptions.SFTPError` if extension is not
+          supported by server.
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on rename
+          failure."""
+        cdef int rc
+        cdef bytes b_source_filename = to_bytes(source_filename)
+        cdef bytes b_dest_filename = to_bytes(dest_filename)
+        cdef const char *_source_filename = b_source_filename
+        cdef const char *_dest_filename = b_dest_filename
+        cdef size_t source_len = len(b_source_filename)
+        cdef size_t dest_len = len(b_dest_filename)
+        with nogil:
+            rc = c_sftp.libssh2_sftp_posix_rename_ex(
+                self._sftp, _source_filename, source_len,
+                _dest_filename, dest_len)
+        if rc == c_sftp.LIBSSH2_FX_OP_UNSUPPORTED:
+            raise SFTPError(
+                "Server does not support posix-rename@openssh.com extension")
+        if self.attr_cache is not None:
+            self._invalidate_rename(b_source_filename, b_dest_filename)
         return handle_error_codes(rc)
 
+    def hardlink(self, source_filename not None, dest_filename not None):
+        """Create hard link ``dest_filename`` of ``source_filename`` via
+        ``hardlink@openssh.com`` extension.
+
+        :param source_filename: Existing file.
+        :type source_filename: str
+        :param dest_filename: Path of new link.
+        :type dest_filename: str
+
+        :raises: :py:class:`ssh2.exceptions.SFTPError` if extension is not
+          supported by server.
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on failure
+          creating link."""
+        cdef bytes b_source_filename = to_bytes(source_filename)
+        cdef bytes b_dest_filename = to_bytes(dest_filename)
+        cdef _ExtensionChannel ext = self._extension_channel()
+        try:
+            rtype, body = ext._extended(
+                'hardlink@openssh.com',
+                _fxp_string(b_source_filename) + _fxp_string(b_dest_filename))
+            ext._check_status(rtype, body, "Linking %s" % (source_filename,))
+        finally:
+            if self.attr_cache is not None:
+                # Link count of source changes
+                self.attr_cache._invalidate(b_source_filename)
+                self.attr_cache._invalidate(b_dest_filename)
+                self.attr_cache._invalidate_realpaths()
+        return 0
+
+    def copy_data(self, source_filename not None, dest_filename not None,
+                  c_ssh2.libssh2_uint64_t source_offset=0,
+                  c_ssh2.libssh2_uint64_t length=0,
+                  c_ssh2.libssh2_uint64_t dest_offset=0, mode=None):
+        """Copy file data on the server via ``copy-data`` extension, without
+        data crossing the network.
+
+        Destination is created if it does not exist. It is truncated first
+        when writing at ``dest_offset`` zero, so that by default the whole of
+        source file is copied to destination.
+
+        :param source_filename: File to copy from.
+        :type source_filename: str
+        :param dest_filename: File to copy to.
+        :type dest_filename: str
+        :param source_offset: Offset in source file to start copying from.
+        :type source_offset: int
+        :param length: Number of bytes to copy. Zero copies until end of
+          source file.
+        :type length: int
+        :param dest_offset: Offset in destination file to write to.
+        :type dest_offset: int
+        :param mode: Permissions of created destination file. Defaults to
+          source file's.
+        :type mode: int
+
+        :raises: :py:class:`ssh2.exceptions.SFTPError` if extension is not
+          supported by server.
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          opening either file or copying."""
+        cdef bytes b_source_filename = to_bytes(source_filename)
+        cdef bytes b_dest_filename = to_bytes(dest_filename)
+        cdef _ExtensionChannel ext = self._extension_channel()
+        cdef unsigned long flags = c_sftp.LIBSSH2_FXF_WRITE | \
+            c_sftp.LIBSSH2_FXF_CREAT
+        cdef bytes src_handle = None
+        cdef bytes dst_handle = None
+        if 'copy-data' not in ext.extensions:
+            raise SFTPError("Server does not support copy-data extension")
+        if dest_offset == 0:
+            flags |= c_sftp.LIBSSH2_FXF_TRUNC
+        if mode is None:
+            mode = _stat_wait(self, b_source_filename).permissions & 0o7777
+        try:
+            src_handle = ext._open_handle(
+                b_source_filename, c_sftp.LIBSSH2_FXF_READ, 0)
+            dst_handle = ext._open_handle(b_dest_filename, flags, mode)
+            rtype, body = ext._extended(
+                'copy-data',
+                _fxp_string(src_handle) + _U64.pack(source_offset) +
+                _U64.pack(length) + _fxp_string(dst_handle) +
+                _U64.pack(dest_offset))
+            ext._check_status(rtype, body, "Copying %s" % (source_filename,))
+        finally:
+            # Handles of a channel closed on error are closed by server
+            try:
+                if dst_handle is not None and ext._channel is not None:
+                    ext._close_handle(dst_handle)
+            finally:
+                if src_handle is not None and ext._channel is not None:
+                    ext._close_handle(src_handle)
+                if self.attr_cache is not None:
+                    self.attr_cache._invalidate(b_dest_filename)
+        return 0
+
     def symlink(self, path not None, target not None):
         """Create symlink.
 
@@ -428,6 +2386,10 @@ cdef class SFTP:
         cdef char *_target = b_target
         with nogil:
             rc = c_sftp.libssh2_sftp_symlink(self._sftp, _path, _target)
+        if self.attr_cache is not None:
+            self.attr_cache._invalidate(b_path)
+            self.attr_cache._invalidate(b_target)
+            self.attr_cache._invalidate_realpaths()
         return handle_error_codes(rc)
 
     def realpath(self, path not None, size_t max_len=256):
@@ -435,29 +2397,48 @@ cdef class SFTP:
 
         :param: Path name to get real path for.
         :type param: str
-        :param max_len: Max size of returned real path.
+        :param max_len: Initial size of real path buffer. Buffer is grown and
+          the request retried if real path is longer.
         :type max_len: int
 
-        :raises: :py:class:`ssh2.exceptions.SFTPHandleError` on errors getting
-          real path.
-        :raises: :py:class:`ssh2.exceptions.SFTPBufferTooSmall` on max_len less
-          than real path length."""
-        cdef char *_target = <char *>malloc(sizeof(char)*max_len)
-        if _target is NULL:
-            raise MemoryError
-        cdef int rc
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          getting real path.
+
+        :rtype: str or ``LIBSSH2_ERROR_EAGAIN``"""
         cdef bytes b_path = to_bytes(path)
-        cdef char *_path = b_path
-        try:
-            with nogil:
-                rc = c_sftp.libssh2_sftp_realpath(
-                    self._sftp, _path, _target, max_len)
-                if rc < 0:
-                    with gil:
-                        return handle_error_codes(rc)
-            return to_str_len(_target, rc)
-        finally:
-            free(_target)
+        if self.attr_cache is not None:
+            real_path = self.attr_cache._get(_ATTR_CACHE_REALPATH, b_path)
+            if real_path is not None:
+                return real_path
+        real_path = _resolve_path(self, b_path, max_len, False)
+        if self.attr_cache is not None \
+           and real_path != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            self.attr_cache._put(_ATTR_CACHE_REALPATH, b_path, real_path)
+        return real_path
+
+    def readlink(self, path not None, size_t max_len=256):
+        """Get target of symbolic link.
+
+        :param: Path of symbolic link.
+        :type param: str
+        :param max_len: Initial size of target buffer. Buffer is grown and
+          the request retried if target is longer.
+        :type max_len: int
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          reading link, like path not being a symbolic link.
+
+        :rtype: str or ``LIBSSH2_ERROR_EAGAIN``"""
+        cdef bytes b_path = to_bytes(path)
+        if self.attr_cache is not None:
+            target = self.attr_cache._get(_ATTR_CACHE_READLINK, b_path)
+            if target is not None:
+                return target
+        target = _resolve_path(self, b_path, max_len, True)
+        if self.attr_cache is not None \
+           and target != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            self.attr_cache._put(_ATTR_CACHE_READLINK, b_path, target)
+        return target
 
     def last_error(self):
         """Get last error code from SFTP channel.
@@ -467,3 +2448,627 @@ cdef class SFTP:
         with nogil:
             rc = c_sftp.libssh2_sftp_last_error(self._sftp)
         return rc
+
+    def listdir_attr(self, path not None, size_t buffer_maxlen=1024):
+        """Get all entries of directory and their attributes.
+
+        Directory is read in a single native loop with the GIL released,
+        reusing one entry name buffer, and entries returned together once the
+        whole directory has been read. Entries ``.`` and ``..`` are not
+        included.
+
+        Works in both blocking and non-blocking mode - in non-blocking mode
+        the session socket is waited on as needed.
+
+        :param path: Path of directory.
+        :type path: str
+        :param buffer_maxlen: Max length of an entry name.
+        :type buffer_maxlen: int
+
+        :returns: List of entry name and attributes tuples.
+        :rtype: list(tuple(bytes, :py:class:`ssh2.sftp_handle.SFTPAttributes`))
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          opening or reading directory.
+        :raises: :py:class:`ssh2.exceptions.BufferTooSmallError` on an entry
+          name longer than ``buffer_maxlen``."""
+        cdef _dir_entries entries
+        cdef SFTPAttributes attrs
+        cdef list result
+        cdef size_t i
+        cdef bytes b_path = to_bytes(path)
+        memset(&entries, 0, sizeof(_dir_entries))
+        try:
+            _read_dir(self, b_path, &entries, buffer_maxlen)
+            result = [None] * entries.count
+            for i in range(entries.count):
+                attrs = SFTPAttributes()
+                attrs._attrs[0] = entries.attrs[i]
+                name = entries.names[
+                    entries.name_offsets[i]:entries.name_offsets[i + 1]]
+                result[i] = (name, attrs)
+                if self.attr_cache is not None:
+                    self.attr_cache._put_entry(b_path, name, attrs)
+            return result
+        finally:
+            _dir_entries_free(&entries)
+
+    def listdir_columns(self, path not None, size_t buffer_maxlen=1024):
+        """Get all entries of directory and their attributes as a columnar
+        listing.
+
+        Directory is read the same way as by :py:func:`listdir_attr`, with
+        entry names returned in one contiguous bytes object and attributes
+        in parallel arrays rather than one object per entry. Suitable for
+        very large directories.
+
+        :param path: Path of directory.
+        :type path: str
+        :param buffer_maxlen: Max length of an entry name.
+        :type buffer_maxlen: int
+
+        :rtype: :py:class:`ssh2.sftp_handle.SFTPDirListing`
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors
+          opening or reading directory.
+        :raises: :py:class:`ssh2.exceptions.BufferTooSmallError` on an entry
+          name longer than ``buffer_maxlen``."""
+        cdef _dir_entries entries
+        memset(&entries, 0, sizeof(_dir_entries))
+        try:
+            _read_dir(self, to_bytes(path), &entries, buffer_maxlen)
+            return _dir_listing(&entries)
+        finally:
+            _dir_entries_free(&entries)
+
+    def walk(self, top not None, bint topdown=True, bint followlinks=False,
+             int concurrency=1, onerror=None, size_t buffer_maxlen=1024):
+        """Recursively walk remote directory tree, yielding
+        ``(dirpath, dirnames, filenames)`` tuples like :py:func:`os.walk`.
+
+        As with :py:func:`os.walk`, with ``topdown`` enabled ``dirnames`` can
+        be modified in place to prune the directories walked into, with
+        ``topdown`` disabled a directory is yielded after all of its
+        sub-directories. Symbolic links to directories are included in
+        ``dirnames`` but only walked into if ``followlinks`` is enabled.
+        Directories that cannot be read are skipped, with the exception
+        passed to ``onerror`` if provided.
+
+        With ``concurrency`` greater than one, that many additional SFTP
+        channels are opened on the session and directories are read over
+        all of them at once with the session in non-blocking mode, so that a
+        tree is crawled in parallel rather than at one round trip per
+        directory. Directories are then yielded in the order their listings
+        complete rather than in depth first order. Blocking mode is restored
+        while a result is being yielded, so the session and this SFTP
+        instance can be used by the caller in between. Channels are closed
+        once the walk ends.
+
+        :param top: Directory to walk. Paths yielded are the same type as
+          ``top``, bytes or str. Names that are not valid UTF-8 are decoded
+          with ``surrogateescape``, like :py:func:`os.fsdecode`, and can be
+          passed back to other functions as is.
+        :type top: str or bytes
+        :param topdown: Yield directories before their sub-directories.
+        :type topdown: bool
+        :param followlinks: Walk into symbolic links to directories.
+        :type followlinks: bool
+        :param concurrency: Number of directories to read at once.
+        :type concurrency: int
+        :param onerror: Function to call with exception of directories that
+          cannot be read.
+        :type onerror: callable
+        :param buffer_maxlen: Max length of an entry name.
+        :type buffer_maxlen: int
+
+        :rtype: iter(tuple(str, list(str), list(str)))"""
+        cdef bint decode = not isinstance(top, bytes)
+        cdef bint blocking = self._session.get_blocking()
+        cdef bint concurrent = concurrency > 1
+        cdef list readers = []
+        cdef list idle
+        cdef list active = []
+        cdef list pending
+        cdef list done
+        cdef _DirReader reader
+        cdef bint progressed
+        # Node: [path, parent node, entry tuple, remaining sub-directories]
+        if concurrent:
+            for _ in range(concurrency):
+                readers.append(
+                    _DirReader(_sftp_init_wait(self._session), buffer_maxlen))
+        else:
+            readers.append(_DirReader(self, buffer_maxlen))
+        idle = list(readers)
+        pending = [[top, None, None, 0]]
+        try:
+            if concurrent:
+                self._session.set_blocking(False)
+            while pending or active:
+                while idle and pending:
+                    reader = idle.pop()
+                    node = pending.pop()
+                    reader.start(to_bytes(node[0]), node)
+                    active.append(reader)
+                progressed = False
+                done = []
+                for reader in active:
+                    if reader.step():
+                        done.append(reader)
+                        progressed = True
+                for reader in done:
+                    active.remove(reader)
+                    node = reader.node
+                    reader.node = None
+                    entries, error = reader.result(decode)
+                    # Reader is idle and its channel can be used to stat links
+                    dirnames = []
+                    filenames = []
+                    links = set()
+                    if error is None:
+                        for name, permissions in entries:
+                            if c_sftp.LIBSSH2_SFTP_S_ISLNK(permissions):
+                                links.add(name)
+                                try:
+                                    permissions = _stat_wait(
+                                        reader.sftp,
+                                        to_bytes(_walk_join(node[0], name))
+                                    ).permissions
+                                except Exception:
+                                    pass
+                            if c_sftp.LIBSSH2_SFTP_S_ISDIR(permissions):
+                                dirnames.append(name)
+                            else:
+                                filenames.append(name)
+                    idle.append(reader)
+                    if error is not None and onerror is not None:
+                        onerror(error)
+                    if error is None and topdown:
+                        if concurrent:
+                            self._session.set_blocking(blocking)
+                        yield node[0], dirnames, filenames
+                        if concurrent:
+                            self._session.set_blocking(False)
+                    if error is None:
+                        node[2] = (node[0], dirnames, filenames)
+                        for name in reversed(dirnames):
+                            if followlinks or name not in links:
+                                pending.append(
+                                    [_walk_join(node[0], name), node, None, 0])
+                                node[3] += 1
+                    if topdown:
+                        continue
+                    # Bottom up - yield directories whose sub-directories
+                    # have all been yielded, then check their parents.
+                    while node is not None and node[3] == 0:
+                        if node[2] is not None:
+                            if concurrent:
+                                self._session.set_blocking(blocking)
+                            yield node[2]
+                            if concurrent:
+                                self._session.set_blocking(False)
+                        node = node[1]
+                        if node is not None:
+                            node[3] -= 1
+                if not progressed and active:
+                    wait_session(self._session)
+        finally:
+            self._session.set_blocking(blocking)
+            if concurrent:
+                _close_readers(readers)
+
+    def glob(self, pattern not None, int concurrency=1,
+             size_t buffer_maxlen=1024):
+        """Get list of remote paths matching shell style ``pattern``, like
+        :py:func:`glob.glob`.
+
+        See :py:func:`iglob` for details.
+
+        :rtype: list(str)"""
+        return list(self.iglob(pattern, concurrency=concurrency,
+                               buffer_maxlen=buffer_maxlen))
+
+    def iglob(self, pattern not None, int concurrency=1,
+              size_t buffer_maxlen=1024):
+        """Iterate over remote paths matching shell style ``pattern``, like
+        :py:func:`glob.iglob`.
+
+        Wildcards ``*``, ``?`` and ``[...]`` are matched with
+        :py:mod:`fnmatch` rules per path component, case sensitively, and
+        names starting with ``.`` are only matched by components starting
+        with ``.``. Only directories whose path so far matches the pattern
+        are listed - components without wildcards are appended to the path
+        without listing, so ``logs/*/2026-10-*/app*.gz`` lists ``logs``, its
+        sub-directories and their matching sub-directories only. Directories
+        that cannot be read are skipped.
+
+        With ``concurrency`` greater than one, that many additional SFTP
+        channels are opened on the session and matching directories are
+        listed over all of them at once, as with :py:func:`walk`. Channels
+        are closed once iteration ends. Results are
+        then in the order listings complete. Blocking mode is restored while
+        a result is being yielded.
+
+        :param pattern: Pattern to match. Relative patterns are matched
+          against the SFTP session's working directory, normally the user's
+          home directory. Paths yielded are the same type as ``pattern``,
+          bytes or str.
+        :type pattern: str or bytes
+        :param concurrency: Number of directories to list at once.
+        :type concurrency: int
+        :param buffer_maxlen: Max length of an entry name.
+        :type buffer_maxlen: int
+
+        :rtype: iter(str)"""
+        cdef bint decode = not isinstance(pattern, bytes)
+        cdef bint blocking = self._session.get_blocking()
+        cdef bint concurrent = concurrency > 1
+        cdef object sep = '/' if decode else b'/'
+        cdef object dot = '.' if decode else b'.'
+        cdef list parts = [part for part in pattern.split(sep) if part]
+        # Trailing separator only matches directories, as with glob.glob
+        cdef bint dir_only = len(parts) > 0 and pattern.endswith(sep)
+        cdef list matchers = [_glob_matcher(part, decode) for part in parts]
+        cdef list readers = []
+        cdef list idle
+        cdef list active = []
+        cdef list pending = []
+        cdef list done
+        cdef list matches
+        cdef _DirReader reader
+        cdef bint progressed
+        cdef Py_ssize_t index
+        cdef Py_ssize_t next_index
+        root = sep if pattern.startswith(sep) else pattern[:0]
+        if concurrent:
+            for _ in range(concurrency):
+                readers.append(
+                    _DirReader(_sftp_init_wait(self._session), buffer_maxlen))
+        else:
+            readers.append(_DirReader(self, buffer_maxlen))
+        idle = list(readers)
+        try:
+            if concurrent:
+                self._session.set_blocking(False)
+            path, index = _glob_literal(parts, matchers, root, 0)
+            if index < len(parts):
+                pending.append((path, index))
+            elif path:
+                path = _glob_check(self, path, dir_only, sep)
+                if path is not None:
+                    self._session.set_blocking(blocking)
+                    yield path
+            while pending or active:
+                while idle and pending:
+                    reader = idle.pop()
+                    node = pending.pop()
+                    reader.start(to_bytes(node[0] or dot), node)
+                    active.append(reader)
+                progressed = False
+                done = []
+                for reader in active:
+                    if reader.step():
+                        done.append(reader)
+                        progressed = True
+                for reader in done:
+                    active.remove(reader)
+                    (path, index), reader.node = reader.node, None
+                    entries, error = reader.result(decode)
+                    idle.append(reader)
+                    if error is not None:
+                        continue
+                    match = matchers[index]
+                    hidden = parts[index].startswith(dot)
+                    last = index == len(parts) - 1
+                    matches = []
+                    for name, permissions in entries:
+                        if name.startswith(dot) and not hidden:
+                            continue
+                        if match(name) is None:
+                            continue
+                        name = _walk_join(path, name) if path else name
+                        if last and not dir_only:
+                            matches.append(name)
+                            continue
+                        if c_sftp.LIBSSH2_SFTP_S_ISLNK(permissions):
+                            try:
+                                permissions = _stat_wait(
+                                    self, to_bytes(name)).permissions
+                            except SFTPError:
+                                continue
+                        if not c_sftp.LIBSSH2_SFTP_S_ISDIR(permissions):
+                            continue
+                        if last:
+                            matches.append(name + sep)
+                            continue
+                        name, next_index = _glob_literal(
+                            parts, matchers, name, index + 1)
+                        if next_index < len(parts):
+                            pending.append((name, next_index))
+                            continue
+                        name = _glob_check(self, name, dir_only, sep)
+                        if name is not None:
+                            matches.append(name)
+                    if matches:
+                        if concurrent:
+                            self._session.set_blocking(blocking)
+                        for name in matches:
+                            yield name
+                        if concurrent:
+                            self._session.set_blocking(False)
+                if not progressed and active:
+                    wait_session(self._session)
+        finally:
+            self._session.set_blocking(blocking)
+            if concurrent:
+                _close_readers(readers)
+
+    def get_file(self, remote_path not None, local not None,
+                 size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+                 bint resume=False, bint checksums=False,
+                 journal_path=None,
+                 c_ssh2.libssh2_uint64_t journal_range_size=TRANSFER_JOURNAL_RANGE_SIZE,
+                 bint mmap=False, hash=None):
+        """Download remote file to local file.
+
+        Remote file is read and written to local file in a native loop with
+        the GIL released, using one reusable buffer of ``chunk_size`` bytes.
+
+        With ``mmap`` enabled, local file is instead resized to the size of
+        the remote file, memory mapped, and remote file data read directly
+        into the mapping, ``chunk_size`` bytes per read, without copying
+        through an intermediate buffer. Local file is always written from
+        its start in this mode and, if a file object or descriptor, must be
+        opened for reading and writing.
+
+        With ``resume`` enabled, completed byte ranges are recorded in a
+        journal file next to the local file. When a download is retried, the
+        remote file's size and modification time are checked via ``fstat``
+        against the journal and, if unchanged, only ranges missing from the
+        journal are downloaded. The journal is removed when the download
+        completes.
+
+        :param remote_path: Remote file to download.
+        :type remote_path: str
+        :param local: Local file path, file object or file descriptor to
+          write to. File objects and descriptors are written to from their
+          current offset when not resuming and are not closed.
+        :type local: str or file or int
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+        :param resume: Resume a previously interrupted download.
+        :type resume: bool
+        :param checksums: Record CRC32 checksum of each completed range in
+          the journal and verify local file contents against them on resume,
+          so that ranges changed locally between attempts are downloaded
+          again. Only used when resuming.
+        :type checksums: bool
+        :param journal_path: Path of journal file. Defaults to local file
+          path with ``ssh2.sftp.TRANSFER_JOURNAL_SUFFIX`` appended. Required
+          when resuming with a file object or descriptor.
+        :type journal_path: str
+        :param journal_range_size: Size of journalled byte ranges.
+        :type journal_range_size: int
+        :param mmap: Read directly into memory mapped local file. Cannot be
+          used with ``resume``.
+        :type mmap: bool
+        :param hash: :py:mod:`hashlib` algorithm name, like ``'sha256'``, or
+          hash object to feed downloaded data into as it is read. Cannot be
+          used with ``resume``.
+        :type hash: str or hash object
+
+        :returns: Number of bytes downloaded, or tuple of number of bytes
+          and digest of downloaded data if ``hash`` is given.
+        :rtype: int or (int, bytes)
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on SFTP
+          errors, ``OSError`` on local file errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        if mmap and resume:
+            raise ValueError("Memory mapped downloads cannot be resumed")
+        if hash is not None and resume:
+            raise ValueError("Hash cannot be computed on resumed transfers")
+        hash = new_hash(hash) if hash is not None else None
+        cdef object sink = hash.update if hash is not None else None
+        cdef bytes b_remote_path = to_bytes(remote_path)
+        # Journal checksums are verified against local file contents and
+        # memory mapping requires read access
+        cdef int open_flags = os.O_RDWR | os.O_CREAT if resume \
+            else os.O_RDWR | os.O_CREAT | os.O_TRUNC if mmap \
+            else os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        cdef TransferJournal journal = None
+        if resume:
+            journal_path = _journal_path(local, journal_path)
+        fd, owned = _local_fd(local, open_flags)
+        cdef SFTPHandle handle = None
+        cdef SFTPAttributes attrs
+        cdef long long total = 0
+        cdef long long copied
+        cdef _CRC32 crc
+        cdef char *buf = NULL
+        if not mmap:
+            buf = <char *>malloc(sizeof(char) * chunk_size)
+            if buf is NULL:
+                if owned:
+                    os.close(fd)
+                raise MemoryError
+        try:
+            handle = _open_handle(self, b_remote_path, c_sftp.LIBSSH2_FXF_READ,
+                                  0, c_sftp.LIBSSH2_SFTP_OPENFILE)
+            if mmap:
+                total = _sftp_to_mmap(handle, fd, chunk_size, sink)
+            elif not resume:
+                total = _sftp_to_fd(handle, fd, LLONG_MAX, buf, chunk_size,
+                                    sink)
+            if not resume:
+                return (total, hash.digest()) if hash is not None else total
+            attrs = SFTPAttributes()
+            _handle_fstat(handle, attrs, 0)
+            journal = TransferJournal(journal_path, attrs.filesize, attrs.mtime,
+                                      journal_range_size)
+            if journal.load() and checksums:
+                journal.verify(fd)
+            journal.begin()
+            for offset, length in journal.missing():
+                crc = _CRC32() if checksums else None
+                c_sftp.libssh2_sftp_seek64(handle._handle, offset)
+                if fd_seek(fd, offset) != 0:
+                    PyErr_SetFromErrno(OSError)
+                copied = _sftp_to_fd(handle, fd, length, buf, chunk_size, crc)
+                if copied != length:
+                    raise SFTPError(
+                        "Remote file %s changed size during download" % (
+                            remote_path,))
+                journal.record(offset, length,
+                               crc.value if crc is not None else None)
+                total += copied
+            os.ftruncate(fd, journal.size)
+            journal.remove()
+            return total
+        finally:
+            free(buf)
+            if journal is not None:
+                journal.close()
+            if handle is not None:
+                _close_handle(handle)
+            if owned:
+                os.close(fd)
+
+    def put_file(self, local not None, remote_path not None, mode=None,
+                 size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+                 bint resume=False, bint checksums=False,
+                 journal_path=None,
+                 c_ssh2.libssh2_uint64_t journal_range_size=TRANSFER_JOURNAL_RANGE_SIZE,
+                 hash=None):
+        """Upload local file to remote file.
+
+        Local file is read and written to remote file in a native loop with
+        the GIL released, using one reusable buffer of ``chunk_size`` bytes.
+
+        With ``resume`` enabled, completed byte ranges are recorded in a
+        journal file next to the local file, along with the remote file's
+        modification time after each range. When an upload is retried, the
+        local file's size and modification time are checked against the
+        journal and the remote file's size via ``fstat`` against completed
+        ranges. Only ranges missing from the journal or the remote file are
+        uploaded. If the remote file was modified since the last completed
+        range was written, including by an upload interrupted part way
+        through a range, the upload restarts from the beginning. The journal
+        is removed when the upload completes.
+
+        :param local: Local file path, file object or file descriptor to
+          read from. File objects and descriptors are read from their current
+          offset when not resuming and are not closed.
+        :type local: str or file or int
+        :param remote_path: Remote file to upload to.
+        :type remote_path: str
+        :param mode: Permissions mode of remote file. Defaults to local
+          file's permissions.
+        :type mode: int
+        :param chunk_size: Size of read buffer.
+        :type chunk_size: int
+        :param resume: Resume a previously interrupted upload.
+        :type resume: bool
+        :param checksums: Record CRC32 checksum of each completed range in
+          the journal and verify local file contents against them on resume,
+          so that ranges changed locally between attempts are uploaded again.
+          Only used when resuming.
+        :type checksums: bool
+        :param journal_path: Path of journal file. Defaults to local file
+          path with ``ssh2.sftp.TRANSFER_JOURNAL_SUFFIX`` appended. Required
+          when resuming with a file object or descriptor.
+        :type journal_path: str
+        :param journal_range_size: Size of journalled byte ranges.
+        :type journal_range_size: int
+        :param hash: :py:mod:`hashlib` algorithm name, like ``'sha256'``, or
+          hash object to feed uploaded data into as it is read. Cannot be
+          used with ``resume``.
+        :type hash: str or hash object
+
+        :returns: Number of bytes uploaded, or tuple of number of bytes and
+          digest of uploaded data if ``hash`` is given.
+        :rtype: int or (int, bytes)
+
+        :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on SFTP
+          errors, ``OSError`` on local file errors."""
+        if chunk_size == 0:
+            raise ValueError("Chunk size must be greater than zero")
+        if hash is not None and resume:
+            raise ValueError("Hash cannot be computed on resumed transfers")
+        hash = new_hash(hash) if hash is not None else None
+        cdef bytes b_remote_path = to_bytes(remote_path)
+        cdef unsigned long flags = c_sftp.LIBSSH2_FXF_WRITE | \
+            c_sftp.LIBSSH2_FXF_CREAT
+        if not resume:
+            flags |= c_sftp.LIBSSH2_FXF_TRUNC
+        cdef TransferJournal journal = None
+        if resume:
+            journal_path = _journal_path(local, journal_path)
+        fd, owned = _local_fd(local, os.O_RDONLY)
+        cdef SFTPHandle handle = None
+        cdef SFTPAttributes attrs
+        cdef long long total = 0
+        cdef long long copied
+        cdef _CRC32 crc
+        cdef char *buf = <char *>malloc(sizeof(char) * chunk_size)
+        if buf is NULL:
+            if owned:
+                os.close(fd)
+            raise MemoryError
+        try:
+            local_stat = os.fstat(fd)
+            if mode is None:
+                mode = local_stat.st_mode & 0o777
+            handle = _open_handle(self, b_remote_path, flags, mode,
+                                  c_sftp.LIBSSH2_SFTP_OPENFILE)
+            if not resume:
+                total = _fd_to_sftp(handle, fd, LLONG_MAX, buf, chunk_size,
+                                    hash.update if hash is not None else None)
+                return (total, hash.digest()) if hash is not None else total
+            journal = TransferJournal(journal_path, local_stat.st_size,
+                                      int(local_stat.st_mtime),
+                                      journal_range_size)
+            if journal.load():
+                attrs = SFTPAttributes()
+                _handle_fstat(handle, attrs, 0)
+                # Remote file replaced or written to since last range
+                if journal.dest_mtime is None or \
+                   attrs.mtime != journal.dest_mtime:
+                    journal.ranges = {}
+                    journal.dest_mtime = None
+                journal.truncate(attrs.filesize)
+                if checksums:
+                    journal.verify(fd)
+            journal.begin()
+            for offset, length in journal.missing():
+                crc = _CRC32() if checksums else None
+                c_sftp.libssh2_sftp_seek64(handle._handle, offset)
+                if fd_seek(fd, offset) != 0:
+                    PyErr_SetFromErrno(OSError)
+                copied = _fd_to_sftp(handle, fd, length, buf, chunk_size, crc)
+                if copied != length:
+                    raise OSError(
+                        "Local file %s changed size during upload" % (local,))
+                attrs = SFTPAttributes()
+                _handle_fstat(handle, attrs, 0)
+                journal.record(offset, length,
+                               crc.value if crc is not None else None,
+                               attrs.mtime)
+                total += copied
+            attrs = SFTPAttributes()
+            attrs.flags = c_sftp.LIBSSH2_SFTP_ATTR_SIZE
+            attrs.filesize = journal.size
+            _handle_fstat(handle, attrs, 1)
+            journal.remove()
+            return total
+        finally:
+            free(buf)
+            if journal is not None:
+                journal.close()
+            if handle is not None:
+                _close_handle(handle)
+            if self.attr_cache is not None:
+                self.attr_cache._invalidate(b_remote_path)
+            if owned:
+                os.close(fd)
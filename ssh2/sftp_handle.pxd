@@ -17,21 +17,53 @@
 from .sftp cimport SFTP
 
 from . cimport c_sftp
+from . cimport c_ssh2
 
 
 cdef object PySFTPHandle(c_sftp.LIBSSH2_SFTP_HANDLE *handle, SFTP sftp)
 
 
+cdef class SFTPAttributes:
+    cdef c_sftp.LIBSSH2_SFTP_ATTRIBUTES *_attrs
+
+
 cdef class SFTPHandle:
     cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
     cdef SFTP _sftp
     cdef bint _closed
+    cdef bytes _path
+    cdef object _read_cache
+    cdef size_t _block_size
+    cdef size_t _cache_blocks
+    cdef size_t _max_prefetch
+    cdef size_t _prefetch
+    cdef long long _last_block
+    cdef c_ssh2.libssh2_uint64_t _offset
+    cdef bint _reposition
+    cdef readonly unsigned long long read_cache_hits
+    cdef readonly unsigned long long read_cache_misses
 
-
-cdef class SFTPAttributes:
-    cdef c_sftp.LIBSSH2_SFTP_ATTRIBUTES *_attrs
+    cdef int _cache_entry(self, bytes name, SFTPAttributes attrs) except -1
+    cdef int _invalidate_cache(self) except -1
+    cdef int _fetch_blocks(self, c_ssh2.libssh2_uint64_t first_block,
+                           size_t num_blocks) except -1
+    cdef bytes _cached_read(self, size_t size)
+    cdef int _drop_blocks(self, c_ssh2.libssh2_uint64_t offset,
+                          size_t length) except -1
 
 
 cdef class SFTPStatVFS:
     cdef c_sftp.LIBSSH2_SFTP_STATVFS *_ptr
     cdef object _sftp_ref
+
+
+cdef class SFTPDirListing:
+    cdef readonly bytes names
+    cdef readonly object name_offsets
+    cdef readonly object flags
+    cdef readonly object filesizes
+    cdef readonly object uids
+    cdef readonly object gids
+    cdef readonly object permissions
+    cdef readonly object atimes
+    cdef readonly object mtimes
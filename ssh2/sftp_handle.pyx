@@ -14,11 +14,15 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
-"""SFTP handle, attributes and stat VFS classes."""
+"""SFTP handle, attributes, directory listing and stat VFS classes."""
+
+from collections import OrderedDict
+
+from cpython.array cimport array
 
 from libc.stdlib cimport malloc, free
 
-from .utils cimport handle_error_codes
+from .utils cimport handle_error_codes, wait_session
 
 from . cimport c_ssh2
 from . cimport c_sftp
@@ -109,12 +113,83 @@ cdef class SFTPAttributes:
         self._attrs.mtime = mtime
 
 
+cdef class SFTPDirListing:
+    """Columnar directory listing.
+
+    Entry names are stored one after the other in a single bytes object,
+    with the name of entry ``i`` being
+    ``names[name_offsets[i]:name_offsets[i + 1]]``. Entry attributes are
+    stored in parallel :py:class:`array.array` columns, one item per entry,
+    which support the buffer protocol - eg
+    ``numpy.frombuffer(listing.filesizes, dtype=numpy.uint64)``.
+
+    :py:attr:`filesizes` and :py:attr:`name_offsets` are arrays of unsigned
+    64-bit integers, all other columns are arrays of unsigned 32-bit
+    integers as per the SFTP protocol.
+
+    :py:attr:`flags` has the ``LIBSSH2_SFTP_ATTR_*`` flags of which
+    attributes were provided by the server for each entry.
+    """
+
+    def __cinit__(self):
+        self.names = b''
+        self.name_offsets = array('Q', [0])
+        self.flags = array('I')
+        self.filesizes = array('Q')
+        self.uids = array('I')
+        self.gids = array('I')
+        self.permissions = array('I')
+        self.atimes = array('I')
+        self.mtimes = array('I')
+
+    def __len__(self):
+        return len(self.filesizes)
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(len(self)):
+            yield self.name(i)
+
+    def __getitem__(self, Py_ssize_t i):
+        return self.name(i), self.attributes(i)
+
+    def name(self, Py_ssize_t i):
+        """Get name of entry.
+
+        :rtype: bytes"""
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("Listing index out of range")
+        return self.names[self.name_offsets[i]:self.name_offsets[i + 1]]
+
+    def attributes(self, Py_ssize_t i):
+        """Get attributes of entry.
+
+        :rtype: :py:class:`ssh2.sftp_handle.SFTPAttributes`"""
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError("Listing index out of range")
+        cdef SFTPAttributes attrs = SFTPAttributes()
+        attrs._attrs.flags = self.flags[i]
+        attrs._attrs.filesize = self.filesizes[i]
+        attrs._attrs.uid = self.uids[i]
+        attrs._attrs.gid = self.gids[i]
+        attrs._attrs.permissions = self.permissions[i]
+        attrs._attrs.atime = self.atimes[i]
+        attrs._attrs.mtime = self.mtimes[i]
+        return attrs
+
+
 cdef class SFTPHandle:
 
     def __cinit__(self, sftp):
         self._handle = NULL
         self._sftp = sftp
         self._closed = 0
+        self._path = None
+        self._read_cache = None
 
     def __dealloc__(self):
         if self._closed == 0:
@@ -161,6 +236,172 @@ cdef class SFTPHandle:
         self._closed = 1
         return rc
 
+    @property
+    def read_cache_enabled(self):
+        """Whether block read cache is enabled."""
+        return self._read_cache is not None
+
+    def enable_read_cache(self, size_t block_size=65536,
+                          double capacity_mb=16, size_t max_prefetch=16):
+        """Enable block level read cache on this handle.
+
+        With the cache enabled, :py:func:`read` is served from cached blocks
+        of ``block_size`` bytes, fetching missing blocks from the server, so
+        repeated and overlapping reads at scattered offsets, like reading
+        archive directories or database pages, only cost a round trip the
+        first time a block is read. Least recently used blocks are evicted
+        once cache is at capacity.
+
+        A read missing a block immediately following the last block read is
+        treated as a forward scan, and that many more blocks are fetched at
+        once up to ``max_prefetch`` blocks, doubling on each consecutive
+        sequential miss.
+
+        The handle's file offset is tracked by the cache - :py:func:`seek64`
+        and :py:func:`tell64` work as without it. Writes through this handle
+        update the cache. Changes to the file by other handles or clients
+        are not seen until blocks are evicted or the cache is disabled.
+
+        Reads through the cache wait on the socket in non-blocking mode
+        rather than returning ``LIBSSH2_ERROR_EAGAIN``.
+
+        :param block_size: Size of cached blocks.
+        :type block_size: int
+        :param capacity_mb: Max size of cached blocks in MB.
+        :type capacity_mb: float
+        :param max_prefetch: Max number of blocks to fetch at once on forward
+          scans.
+        :type max_prefetch: int"""
+        cdef size_t cache_blocks
+        if block_size == 0:
+            raise ValueError("Block size must be greater than zero")
+        cache_blocks = <size_t>(capacity_mb * 1048576 / block_size)
+        if cache_blocks == 0:
+            raise ValueError("Cache capacity must be at least one block")
+        if self._read_cache is None:
+            with nogil:
+                self._offset = c_sftp.libssh2_sftp_tell64(self._handle)
+            self._reposition = False
+        self._read_cache = OrderedDict()
+        self._block_size = block_size
+        self._cache_blocks = cache_blocks
+        self._max_prefetch = max_prefetch if max_prefetch > 0 else 1
+        self._prefetch = 1
+        self._last_block = -2
+        self.read_cache_hits = 0
+        self.read_cache_misses = 0
+
+    def disable_read_cache(self):
+        """Disable block read cache and free cached blocks. File offset is
+        kept."""
+        cdef c_ssh2.libssh2_uint64_t offset = self._offset
+        if self._read_cache is None:
+            return
+        self._read_cache = None
+        with nogil:
+            c_sftp.libssh2_sftp_seek64(self._handle, offset)
+
+    cdef int _fetch_blocks(self, c_ssh2.libssh2_uint64_t first_block,
+                           size_t num_blocks) except -1:
+        """Read ``num_blocks`` blocks from server with one seek, storing them in
+        cache."""
+        cdef size_t block_size = self._block_size
+        cdef size_t want = block_size * num_blocks
+        cdef size_t total = 0
+        cdef size_t i
+        cdef size_t end
+        cdef ssize_t rc
+        cdef c_ssh2.libssh2_uint64_t offset = first_block * block_size
+        cdef char *cbuf = <char *>malloc(sizeof(char) * want)
+        if cbuf is NULL:
+            raise MemoryError
+        # Handle's position no longer matches cache offset
+        self._reposition = True
+        try:
+            with nogil:
+                c_sftp.libssh2_sftp_seek64(self._handle, offset)
+            while total < want:
+                with nogil:
+                    rc = c_sftp.libssh2_sftp_read(
+                        self._handle, cbuf + total, want - total)
+                if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    wait_session(self._sftp._session)
+                    continue
+                elif rc < 0:
+                    handle_error_codes(rc)
+                elif rc == 0:
+                    break
+                total += rc
+            for i in range(num_blocks):
+                # Block containing end of file is stored even if empty
+                if i * block_size > total:
+                    break
+                end = (i + 1) * block_size
+                self._read_cache[first_block + i] = cbuf[
+                    i * block_size:end if end < total else total]
+                self._read_cache.move_to_end(first_block + i)
+                if end > total:
+                    break
+        finally:
+            free(cbuf)
+        while len(self._read_cache) > self._cache_blocks:
+            self._read_cache.popitem(last=False)
+        return 0
+
+    cdef bytes _cached_read(self, size_t size):
+        cdef size_t block_size = self._block_size
+        cdef c_ssh2.libssh2_uint64_t block_num
+        cdef size_t block_offset
+        cdef size_t num_blocks
+        cdef size_t i
+        cdef bytes block
+        cdef bytes chunk
+        cdef list chunks = []
+        while size > 0:
+            block_num = self._offset // block_size
+            block_offset = self._offset % block_size
+            block = self._read_cache.get(block_num)
+            if block is not None:
+                self._read_cache.move_to_end(block_num)
+                self.read_cache_hits += 1
+            else:
+                self.read_cache_misses += 1
+                if <long long>block_num == self._last_block + 1:
+                    self._prefetch = self._prefetch * 2 \
+                        if self._prefetch * 2 < self._max_prefetch \
+                        else self._max_prefetch
+                else:
+                    self._prefetch = 1
+                # Do not re-fetch blocks already cached
+                num_blocks = 1
+                for i in range(1, self._prefetch):
+                    if block_num + i in self._read_cache:
+                        break
+                    num_blocks += 1
+                self._fetch_blocks(block_num, num_blocks)
+                block = self._read_cache[block_num]
+            self._last_block = block_num
+            if block_offset >= <size_t>len(block):
+                break
+            chunk = block[block_offset:block_offset + size]
+            chunks.append(chunk)
+            self._offset += len(chunk)
+            size -= len(chunk)
+            if <size_t>len(block) < block_size and \
+               block_offset + len(chunk) == <size_t>len(block):
+                break
+        return b''.join(chunks)
+
+    cdef int _drop_blocks(self, c_ssh2.libssh2_uint64_t offset,
+                          size_t length) except -1:
+        cdef c_ssh2.libssh2_uint64_t block_num
+        if length == 0:
+            return 0
+        for block_num in range(offset // self._block_size,
+                               (offset + length - 1) // self._block_size + 1):
+            self._read_cache.pop(block_num, None)
+        return 0
+
     def read(self, size_t buffer_maxlen=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
         """Read buffer from file handle.
 
@@ -172,6 +413,9 @@ cdef class SFTPHandle:
         cdef ssize_t rc
         cdef bytes buf = b''
         cdef char *cbuf
+        if self._read_cache is not None:
+            buf = self._cached_read(buffer_maxlen)
+            return len(buf), buf
         with nogil:
             cbuf = <char *>malloc(sizeof(char)*buffer_maxlen)
             if cbuf is NULL:
@@ -230,6 +474,7 @@ cdef class SFTPHandle:
             if rc > 0:
                 buf = cbuf[:rc]
                 b_longentry = longentry
+                self._cache_entry(buf, attrs)
         finally:
             free(cbuf)
             free(longentry)
@@ -265,10 +510,21 @@ cdef class SFTPHandle:
         try:
             if rc > 0:
                 buf = cbuf[:rc]
+                self._cache_entry(buf, attrs)
         finally:
             free(cbuf)
         return rc, buf, attrs
 
+    cdef int _cache_entry(self, bytes name, SFTPAttributes attrs) except -1:
+        if self._sftp.attr_cache is not None and self._path is not None:
+            self._sftp.attr_cache._put_entry(self._path, name, attrs)
+        return 0
+
+    cdef int _invalidate_cache(self) except -1:
+        if self._sftp.attr_cache is not None and self._path is not None:
+            self._sftp.attr_cache._invalidate(self._path)
+        return 0
+
     def write(self, bytes buf):
         """Write buffer to file handle.
 
@@ -292,6 +548,14 @@ cdef class SFTPHandle:
         cdef size_t bytes_written = 0
         cdef char *cbuf = buf
         cdef ssize_t rc = 0
+        cdef c_ssh2.libssh2_uint64_t offset = self._offset
+        cdef bint cached = self._read_cache is not None
+        # Seeking flushes pipelined writes, only reposition handle when
+        # cache reads or seeks moved it - never when resuming after EAGAIN
+        if cached and self._reposition:
+            with nogil:
+                c_sftp.libssh2_sftp_seek64(self._handle, offset)
+            self._reposition = False
         with nogil:
             while _size > 0:
                 rc = c_sftp.libssh2_sftp_write(self._handle, cbuf, _size)
@@ -304,6 +568,11 @@ cdef class SFTPHandle:
                 cbuf += rc
                 _size -= rc
             bytes_written = tot_size - _size
+        if bytes_written > 0:
+            self._invalidate_cache()
+            if cached:
+                self._drop_blocks(offset, bytes_written)
+                self._offset += bytes_written
         return rc, bytes_written
 
     def fsync(self):
@@ -324,6 +593,10 @@ cdef class SFTPHandle:
         :type offset: int
 
         :rtype: None"""
+        if self._read_cache is not None:
+            self._offset = offset
+            self._reposition = True
+            return
         with nogil:
             c_sftp.libssh2_sftp_seek(self._handle, offset)
 
@@ -334,6 +607,10 @@ cdef class SFTPHandle:
         :type offset: int
 
         :rtype: None"""
+        if self._read_cache is not None:
+            self._offset = offset
+            self._reposition = True
+            return
         with nogil:
             c_sftp.libssh2_sftp_seek64(self._handle, offset)
 
@@ -341,6 +618,10 @@ cdef class SFTPHandle:
         """Rewind file handle to beginning of file.
 
         :rtype: None"""
+        if self._read_cache is not None:
+            self._offset = 0
+            self._reposition = True
+            return
         with nogil:
             c_sftp.libssh2_sftp_rewind(self._handle)
 
@@ -351,6 +632,8 @@ cdef class SFTPHandle:
 
         :rtype: int"""
         cdef size_t rc
+        if self._read_cache is not None:
+            return self._offset
         with nogil:
             rc = c_sftp.libssh2_sftp_tell(self._handle)
         return handle_error_codes(rc)
@@ -360,6 +643,8 @@ cdef class SFTPHandle:
 
         :rtype: int"""
         cdef c_ssh2.libssh2_uint64_t rc
+        if self._read_cache is not None:
+            return self._offset
         with nogil:
             rc = c_sftp.libssh2_sftp_tell(self._handle)
         return handle_error_codes(rc)
@@ -371,6 +656,11 @@ cdef class SFTPHandle:
         with nogil:
             rc = c_sftp.libssh2_sftp_fstat_ex(
                 self._handle, attrs._attrs, setstat)
+        if setstat:
+            self._invalidate_cache()
+            if self._read_cache is not None:
+                # Size may have changed
+                self._read_cache.clear()
         return handle_error_codes(rc)
 
     def fstat(self):
@@ -393,6 +683,9 @@ cdef class SFTPHandle:
         cdef int rc
         with nogil:
             rc = c_sftp.libssh2_sftp_fsetstat(self._handle, attrs._attrs)
+        self._invalidate_cache()
+        if self._read_cache is not None:
+            self._read_cache.clear()
         return handle_error_codes(rc)
 
     def fstatvfs(self):
@@ -0,0 +1,392 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Mirroring of directory trees between the local file system and an SFTP
+server, transferring only files that differ."""
+
+import os
+import stat
+import zlib
+
+from .exceptions import SFTPError, SFTPProtocolError
+
+from .session cimport Session
+from .sftp cimport SFTP
+from .sftp_handle cimport SFTPAttributes, SFTPHandle
+from .utils cimport wait_session
+
+from . cimport c_ssh2
+from . cimport c_sftp
+
+
+MIRROR_UPLOAD = 'upload'
+MIRROR_DOWNLOAD = 'download'
+
+
+cdef class MirrorResult:
+    """Changes made by :py:func:`mirror`.
+
+    Paths are relative to the mirrored directories with ``/`` separators,
+    with a destination directory that was created listed as ``''``.
+
+    :ivar transferred: Files copied to the destination.
+    :ivar updated: Files and directories whose permissions or modification
+      time were updated without transferring contents.
+    :ivar created: Directories created on the destination.
+    :ivar deleted: Files and directories deleted from the destination.
+    :ivar unchanged: Number of files already identical on the destination.
+    :ivar bytes_transferred: Total bytes of file contents copied."""
+
+    def __cinit__(self):
+        self.transferred = []
+        self.updated = []
+        self.created = []
+        self.deleted = []
+        self.unchanged = 0
+        self.bytes_transferred = 0
+
+
+cdef str _join(str root, str rel):
+    if not rel:
+        return root
+    return root + rel if root.endswith('/') else root + '/' + rel
+
+
+cdef str _local_join(str root, str rel):
+    if not rel:
+        return root
+    return os.path.join(root, *rel.split('/'))
+
+
+cdef dict _local_tree(str root):
+    """Get ``{relative path: (is_dir, size, mtime, atime, mode)}`` of all
+    directories and regular files under local root."""
+    cdef dict tree = {}
+    cdef list stack = ['']
+    while stack:
+        rel = stack.pop()
+        with os.scandir(_local_join(root, rel)) as entries:
+            for entry in entries:
+                _stat = entry.stat(follow_symlinks=False)
+                relpath = rel + '/' + entry.name if rel else entry.name
+                if stat.S_ISDIR(_stat.st_mode):
+                    tree[relpath] = (True, 0, int(_stat.st_mtime),
+                                     int(_stat.st_atime), _stat.st_mode & 0o7777)
+                    stack.append(relpath)
+                elif stat.S_ISREG(_stat.st_mode):
+                    tree[relpath] = (False, _stat.st_size, int(_stat.st_mtime),
+                                     int(_stat.st_atime), _stat.st_mode & 0o7777)
+    return tree
+
+
+cdef dict _remote_tree(SFTP sftp, str root):
+    """Get ``{relative path: (is_dir, size, mtime, atime, mode)}`` of all
+    directories and regular files under remote root, with one directory
+    listing per directory."""
+    cdef dict tree = {}
+    cdef list stack = ['']
+    cdef SFTPAttributes attrs
+    while stack:
+        rel = stack.pop()
+        for name, attrs in sftp.listdir_attr(_join(root, rel)):
+            # Undecodable names are kept as is, like os.fsdecode
+            name = name.decode('utf-8', 'surrogateescape')
+            relpath = rel + '/' + name if rel else name
+            if c_sftp.LIBSSH2_SFTP_S_ISDIR(attrs._attrs.permissions):
+                tree[relpath] = (True, 0, attrs._attrs.mtime,
+                                 attrs._attrs.atime,
+                                 attrs._attrs.permissions & 0o7777)
+                stack.append(relpath)
+            elif c_sftp.LIBSSH2_SFTP_S_ISREG(attrs._attrs.permissions):
+                tree[relpath] = (False, attrs._attrs.filesize,
+                                 attrs._attrs.mtime, attrs._attrs.atime,
+                                 attrs._attrs.permissions & 0o7777)
+    return tree
+
+
+cdef unsigned long _local_crc32(str path, size_t chunk_size) except? 0:
+    cdef unsigned long crc = 0
+    with open(path, 'rb') as fh:
+        data = fh.read(chunk_size)
+        while data:
+            crc = zlib.crc32(data, crc)
+            data = fh.read(chunk_size)
+    return crc
+
+
+cdef unsigned long _remote_crc32(SFTP sftp, str path, size_t chunk_size) except? 0:
+    cdef unsigned long crc = 0
+    cdef SFTPHandle handle = sftp.open(path, c_sftp.LIBSSH2_FXF_READ, 0)
+    with handle:
+        rc, data = handle.read(chunk_size)
+        while rc > 0:
+            crc = zlib.crc32(data, crc)
+            rc, data = handle.read(chunk_size)
+    return crc
+
+
+cdef int _setstat_many(SFTP sftp, list items, int concurrency) except -1:
+    """Set attributes of ``(path, attributes)`` items, with up to
+    ``concurrency`` requests in flight on separate SFTP channels."""
+    cdef Session session = sftp._session
+    cdef list channels
+    cdef list active
+    cdef list pending
+    cdef SFTP channel
+    cdef bint progressed
+    cdef bint blocking
+    cdef Py_ssize_t i
+    if concurrency <= 1 or len(items) < 2:
+        for path, attrs in items:
+            sftp.setstat(path, attrs)
+        return 0
+    channels = [session.sftp_init()
+                for _ in range(min(concurrency, len(items)))]
+    active = [None] * len(channels)
+    pending = list(reversed(items))
+    blocking = session.get_blocking()
+    session.set_blocking(False)
+    try:
+        while pending or any(_item is not None for _item in active):
+            progressed = False
+            for i in range(len(channels)):
+                if active[i] is None:
+                    if not pending:
+                        continue
+                    active[i] = pending.pop()
+                channel = channels[i]
+                path, attrs = active[i]
+                if channel.setstat(path, attrs) == \
+                   c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    continue
+                active[i] = None
+                progressed = True
+            if not progressed:
+                wait_session(session)
+    finally:
+        session.set_blocking(blocking)
+    if sftp.attr_cache is not None:
+        for path, _ in items:
+            sftp.attr_cache.invalidate(path)
+    return 0
+
+
+def mirror(SFTP sftp not None, local_dir not None, remote_dir not None,
+           direction=MIRROR_UPLOAD, bint delete=False, bint checksum=False,
+           int concurrency=4,
+           size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT):
+    """Mirror a directory tree from local to remote, or remote to local,
+    transferring only files that differ.
+
+    Both trees are listed in bulk up front - one directory listing per
+    directory on the remote side rather than a ``stat`` per file. Files
+    that are missing on the destination, or whose size or modification time
+    differ, are transferred with :py:func:`ssh2.sftp.SFTP.put_file` or
+    :py:func:`ssh2.sftp.SFTP.get_file`. With ``checksum`` enabled, files of
+    equal size but different modification time are compared by CRC32 of
+    their contents and only have their modification time updated if
+    identical.
+
+    Permissions and access and modification times of transferred files, and
+    permissions of directories, are then set to those of the source. For
+    uploads, attributes are set with up to ``concurrency`` ``setstat``
+    requests in flight over separate SFTP channels. Directories are created
+    with ``0o700`` permissions and have theirs set last, deepest first, so
+    that read-only source directories can be mirrored.
+
+    Only directories and regular files are mirrored - symbolic links and
+    other file types are ignored on both sides.
+
+    Session must be in blocking mode.
+
+    :param sftp: SFTP session to mirror over.
+    :type sftp: :py:class:`ssh2.sftp.SFTP`
+    :param local_dir: Local directory.
+    :type local_dir: str
+    :param remote_dir: Remote directory.
+    :type remote_dir: str
+    :param direction: ``MIRROR_UPLOAD`` to mirror local directory to remote,
+      ``MIRROR_DOWNLOAD`` for remote to local. Destination directory is
+      created if it does not exist.
+    :type direction: str
+    :param delete: Delete files and directories on destination that do not
+      exist on source. Also allows replacing a directory with a file or vice
+      versa.
+    :type delete: bool
+    :param checksum: Compare contents of files with equal size but different
+      modification time instead of transferring them.
+    :type checksum: bool
+    :param concurrency: Max number of attribute updates in flight.
+    :type concurrency: int
+    :param chunk_size: Transfer and checksum read size.
+    :type chunk_size: int
+
+    :rtype: :py:class:`ssh2.sftp_sync.MirrorResult`
+
+    :raises: :py:class:`ssh2.exceptions.SFTPError` on a path being a file on
+      one side and a directory on the other without ``delete`` enabled.
+    :raises: :py:class:`ssh2.exceptions.SFTPProtocolError` on errors reading
+      source or writing destination on the remote side.
+    :raises: :py:class:`OSError` on local errors."""
+    cdef bint upload
+    cdef dict src_tree
+    cdef dict dst_tree
+    cdef list remote_attrs = []
+    cdef list dir_modes = []
+    cdef dict levels = {}
+    cdef SFTPAttributes attrs
+    cdef MirrorResult result = MirrorResult()
+    if direction not in (MIRROR_UPLOAD, MIRROR_DOWNLOAD):
+        raise ValueError("Invalid mirror direction %s" % (direction,))
+    if chunk_size == 0:
+        raise ValueError("Chunk size must be greater than zero")
+    upload = direction == MIRROR_UPLOAD
+    local_dir = os.fspath(local_dir)
+    if isinstance(remote_dir, bytes):
+        remote_dir = remote_dir.decode('utf-8', 'surrogateescape')
+    if upload:
+        src_tree = _local_tree(local_dir)
+        try:
+            sftp.lstat(remote_dir)
+        except SFTPProtocolError:
+            sftp.mkdir(remote_dir, 0o700)
+            dir_modes.append(('', os.stat(local_dir).st_mode & 0o7777))
+            result.created.append('')
+            dst_tree = {}
+        else:
+            dst_tree = _remote_tree(sftp, remote_dir)
+    else:
+        src_tree = _remote_tree(sftp, remote_dir)
+        if not os.path.isdir(local_dir):
+            os.makedirs(local_dir, 0o700)
+            dir_modes.append(('', sftp.stat(remote_dir).permissions & 0o7777))
+            result.created.append('')
+            dst_tree = {}
+        else:
+            dst_tree = _local_tree(local_dir)
+
+    def _unlink(rel):
+        if upload:
+            sftp.unlink(_join(remote_dir, rel))
+        else:
+            os.unlink(_local_join(local_dir, rel))
+        result.deleted.append(rel)
+
+    def _rmdir(rel):
+        if upload:
+            sftp.rmdir(_join(remote_dir, rel))
+        else:
+            os.rmdir(_local_join(local_dir, rel))
+        result.deleted.append(rel)
+
+    def _remove_tree(rel):
+        prefix = rel + '/'
+        paths = sorted((_path for _path in dst_tree
+                        if _path == rel or _path.startswith(prefix)),
+                       reverse=True)
+        for _path in paths:
+            if dst_tree.pop(_path)[0]:
+                _rmdir(_path)
+            else:
+                _unlink(_path)
+
+    def _set_attrs(rel, long mode, src, list items):
+        """Set permissions, and times of ``src`` if given. Remote
+        attributes are added to ``items`` to be set in bulk."""
+        cdef SFTPAttributes _attrs
+        if upload:
+            _attrs = SFTPAttributes()
+            _attrs.flags = c_sftp.LIBSSH2_SFTP_ATTR_PERMISSIONS
+            _attrs.permissions = mode
+            if src is not None:
+                _attrs.flags |= c_sftp.LIBSSH2_SFTP_ATTR_ACMODTIME
+                _attrs.atime = src[3]
+                _attrs.mtime = src[2]
+            items.append((_join(remote_dir, rel), _attrs))
+        else:
+            os.chmod(_local_join(local_dir, rel), mode)
+            if src is not None:
+                os.utime(_local_join(local_dir, rel), (src[3], src[2]))
+
+    # Sorted so that parent directories are created before their contents
+    for rel in sorted(src_tree):
+        src = src_tree[rel]
+        dst = dst_tree.get(rel)
+        if dst is not None and dst[0] != src[0]:
+            if not delete:
+                raise SFTPError(
+                    "Cannot mirror %s - it is a %s on the source and a %s on "
+                    "the destination" % (
+                        rel, 'directory' if src[0] else 'file',
+                        'directory' if dst[0] else 'file'))
+            _remove_tree(rel)
+            dst = None
+        if src[0]:
+            if dst is None:
+                if upload:
+                    sftp.mkdir(_join(remote_dir, rel), 0o700)
+                else:
+                    os.mkdir(_local_join(local_dir, rel), 0o700)
+                result.created.append(rel)
+                dir_modes.append((rel, src[4]))
+            elif dst[4] != src[4]:
+                dir_modes.append((rel, src[4]))
+                result.updated.append(rel)
+            continue
+        if dst is not None and dst[1] == src[1] and dst[2] == src[2]:
+            if dst[4] != src[4]:
+                _set_attrs(rel, src[4], src, remote_attrs)
+                result.updated.append(rel)
+            else:
+                result.unchanged += 1
+            continue
+        if dst is not None and checksum and dst[1] == src[1] and \
+           _local_crc32(_local_join(local_dir, rel), chunk_size) == \
+           _remote_crc32(sftp, _join(remote_dir, rel), chunk_size):
+            _set_attrs(rel, src[4], src, remote_attrs)
+            result.updated.append(rel)
+            continue
+        if upload:
+            result.bytes_transferred += sftp.put_file(
+                _local_join(local_dir, rel), _join(remote_dir, rel),
+                mode=src[4], chunk_size=chunk_size)
+        else:
+            result.bytes_transferred += sftp.get_file(
+                _join(remote_dir, rel), _local_join(local_dir, rel),
+                chunk_size=chunk_size)
+        _set_attrs(rel, src[4], src, remote_attrs)
+        result.transferred.append(rel)
+    if remote_attrs:
+        _setstat_many(sftp, remote_attrs, concurrency)
+    if delete:
+        for rel in sorted((_path for _path in dst_tree
+                           if _path not in src_tree), reverse=True):
+            if dst_tree[rel][0]:
+                _rmdir(rel)
+            else:
+                _unlink(rel)
+    # Directory permissions last and deepest first, so that read-only
+    # directories do not stop their contents from being written
+    for rel, mode in dir_modes:
+        levels.setdefault(rel.count('/') if rel else -1, []).append(
+            (rel, mode))
+    for depth in sorted(levels, reverse=True):
+        remote_attrs = []
+        for rel, mode in levels[depth]:
+            _set_attrs(rel, mode, None, remote_attrs)
+        if remote_attrs:
+            _setstat_many(sftp, remote_attrs, concurrency)
+    return result
@@ -0,0 +1,442 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Streaming copies between SSH sessions, without touching local disk.
+
+Data is moved through a fixed pair of buffers in a native loop with the GIL
+released - one buffer is filled from the source while the other is written
+to the destination - so memory used is the same regardless of file size."""
+
+from select import select
+
+from cpython.buffer cimport PyBUF_READ
+from cpython.memoryview cimport PyMemoryView_FromMemory
+from libc.limits cimport LLONG_MAX
+from libc.stdlib cimport malloc, free
+
+from .exceptions import SCPProtocolError, SFTPHandleError
+
+from .channel cimport Channel, PyChannel, _channel_finish
+from .fileinfo cimport FileInfo
+from .session cimport Session, _scp_read_ack, _scp_write
+from .sftp cimport SFTP
+from .sftp_handle cimport SFTPHandle, PySFTPHandle, SFTPAttributes
+from .utils cimport to_bytes, handle_error_codes, wait_session, new_hash
+
+from . cimport c_ssh2
+from . cimport c_sftp
+
+
+cdef enum _endpoint_kind:
+    _SFTP_HANDLE
+    _CHANNEL
+
+
+cdef struct _endpoint:
+    _endpoint_kind kind
+    void *ptr
+
+
+cdef inline ssize_t _endpoint_read(_endpoint *src, char *buf, size_t size) nogil:
+    if src.kind == _SFTP_HANDLE:
+        return c_sftp.libssh2_sftp_read(
+            <c_sftp.LIBSSH2_SFTP_HANDLE *>src.ptr, buf, size)
+    return c_ssh2.libssh2_channel_read_ex(
+        <c_ssh2.LIBSSH2_CHANNEL *>src.ptr, 0, buf, size)
+
+
+cdef inline ssize_t _endpoint_write(_endpoint *dst, const char *buf,
+                                    size_t size) nogil:
+    if dst.kind == _SFTP_HANDLE:
+        return c_sftp.libssh2_sftp_write(
+            <c_sftp.LIBSSH2_SFTP_HANDLE *>dst.ptr, buf, size)
+    return c_ssh2.libssh2_channel_write_ex(
+        <c_ssh2.LIBSSH2_CHANNEL *>dst.ptr, 0, buf, size)
+
+
+cdef int _wait_sessions(Session src, Session dst) except -1:
+    """Block until either session's socket is ready for the direction(s)
+    libssh2 is waiting on."""
+    cdef int directions
+    cdef list readfds = []
+    cdef list writefds = []
+    if src is dst:
+        return wait_session(src)
+    for session in (src, dst):
+        directions = session.block_directions()
+        if directions == 0 or session.sock is None:
+            continue
+        if directions & c_ssh2.LIBSSH2_SESSION_BLOCK_INBOUND:
+            readfds.append(session.sock)
+        if directions & c_ssh2.LIBSSH2_SESSION_BLOCK_OUTBOUND:
+            writefds.append(session.sock)
+    if readfds or writefds:
+        select(readfds, writefds, ())
+    return 0
+
+
+cdef long long _pump(_endpoint src, Session src_session,
+                     _endpoint dst, Session dst_session,
+                     size_t chunk_size, long long length,
+                     object sink) except -1:
+    """Copy up to ``length`` bytes, or until end of file, from source to
+    destination with both sessions in non-blocking mode so that reads and
+    writes overlap. Data read is passed to ``sink``, if any, in order.
+
+    Returns number of bytes copied."""
+    cdef char *buf = <char *>malloc(sizeof(char) * chunk_size * 2)
+    cdef char *bufs[2]
+    cdef size_t filled[2]
+    cdef size_t written = 0
+    cdef int read_idx = 0
+    cdef int write_idx = 0
+    cdef long long remaining = length
+    cdef long long total = 0
+    cdef bint eof = remaining == 0
+    cdef bint done = False
+    cdef bint progressed
+    cdef ssize_t rc
+    cdef int error = 0
+    cdef bint has_sink = sink is not None
+    cdef bint src_blocking = src_session.get_blocking()
+    cdef bint dst_blocking = dst_session.get_blocking()
+    if buf is NULL:
+        raise MemoryError
+    bufs[0] = buf
+    bufs[1] = buf + chunk_size
+    filled[0] = filled[1] = 0
+    src_session.set_blocking(False)
+    dst_session.set_blocking(False)
+    try:
+        while True:
+            with nogil:
+                while True:
+                    progressed = False
+                    if not eof and filled[read_idx] == 0:
+                        rc = _endpoint_read(
+                            &src, bufs[read_idx],
+                            chunk_size if <long long>chunk_size < remaining
+                            else <size_t>remaining)
+                        if rc > 0:
+                            if has_sink:
+                                with gil:
+                                    sink(PyMemoryView_FromMemory(
+                                        bufs[read_idx], rc, PyBUF_READ))
+                            filled[read_idx] = rc
+                            read_idx ^= 1
+                            remaining -= rc
+                            eof = remaining == 0
+                            progressed = True
+                        elif rc == 0:
+                            eof = True
+                            progressed = True
+                        elif rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                            error = rc
+                            break
+                    if filled[write_idx] > 0:
+                        rc = _endpoint_write(
+                            &dst, bufs[write_idx] + written,
+                            filled[write_idx] - written)
+                        if rc > 0:
+                            written += rc
+                            total += rc
+                            progressed = True
+                            if written == filled[write_idx]:
+                                filled[write_idx] = 0
+                                written = 0
+                                write_idx ^= 1
+                        elif rc < 0 and rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                            error = rc
+                            break
+                    if eof and filled[0] == 0 and filled[1] == 0:
+                        done = True
+                        break
+                    if not progressed:
+                        break
+            if error != 0:
+                handle_error_codes(error)
+            if done:
+                return total
+            _wait_sessions(src_session, dst_session)
+    finally:
+        free(buf)
+        src_session.set_blocking(src_blocking)
+        dst_session.set_blocking(dst_blocking)
+
+
+cdef SFTPHandle _open_handle(SFTP sftp, bytes b_path, unsigned long flags,
+                             long mode):
+    """Open file handle, waiting on socket in non-blocking mode."""
+    cdef c_sftp.LIBSSH2_SFTP_HANDLE *_handle
+    cdef SFTPHandle handle
+    cdef char *_path = b_path
+    cdef int rc
+    while True:
+        with nogil:
+            _handle = c_sftp.libssh2_sftp_open(sftp._sftp, _path, flags, mode)
+        if _handle is not NULL:
+            handle = PySFTPHandle(_handle, sftp)
+            handle._path = b_path
+            return handle
+        rc = c_ssh2.libssh2_session_last_errno(sftp._session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise SFTPHandleError("Error opening handle for %s" % (b_path,))
+        wait_session(sftp._session)
+
+
+cdef int _close_handle(SFTPHandle handle) except -1:
+    """Close file handle, waiting on socket in non-blocking mode."""
+    cdef int rc
+    while not handle._closed:
+        with nogil:
+            rc = c_sftp.libssh2_sftp_close_handle(handle._handle)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            wait_session(handle._sftp._session)
+            continue
+        handle._closed = 1
+        handle_error_codes(rc)
+    return 0
+
+
+cdef int _check_exit_status(Channel channel, bytes b_path) except -1:
+    """Raise error if remote SCP command of finished channel failed."""
+    cdef int status = c_ssh2.libssh2_channel_get_exit_status(channel._channel)
+    if status != 0:
+        raise SCPProtocolError(
+            "Remote SCP command for %s exited with status %s" % (
+                b_path, status))
+    return 0
+
+
+def copy(SFTP src_sftp not None, src_path not None,
+         SFTP dst_sftp not None, dst_path not None, mode=None,
+         size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT, hash=None):
+    """Copy file from one SFTP session to another, streaming through memory
+    without touching local disk.
+
+    The two SFTP sessions are typically on different hosts but can also be
+    the same host. Memory used is ``2 * chunk_size`` regardless of file size.
+
+    Works whether sessions are in blocking or non-blocking mode - both are
+    put in non-blocking mode for the duration of the copy and restored.
+
+    :param src_sftp: SFTP session to copy from.
+    :type src_sftp: :py:class:`ssh2.sftp.SFTP`
+    :param src_path: Path of file to copy.
+    :type src_path: str
+    :param dst_sftp: SFTP session to copy to.
+    :type dst_sftp: :py:class:`ssh2.sftp.SFTP`
+    :param dst_path: Path of file to create or overwrite.
+    :type dst_path: str
+    :param mode: Permissions of created file. Defaults to source file's.
+    :type mode: int
+    :param chunk_size: Size of each of the two buffers.
+    :type chunk_size: int
+    :param hash: :py:mod:`hashlib` algorithm name, like ``'sha256'``, or hash
+      object to feed copied data into as it passes through.
+    :type hash: str or hash object
+
+    :returns: Number of bytes copied, or tuple of number of bytes and digest
+      of copied data if ``hash`` is given.
+    :rtype: int or (int, bytes)"""
+    cdef SFTPHandle src_handle = None
+    cdef SFTPHandle dst_handle = None
+    cdef SFTPAttributes attrs
+    cdef _endpoint src
+    cdef _endpoint dst
+    cdef int rc
+    cdef long long copied
+    if chunk_size == 0:
+        raise ValueError("Chunk size must be greater than zero")
+    hash = new_hash(hash) if hash is not None else None
+    try:
+        src_handle = _open_handle(src_sftp, to_bytes(src_path),
+                                  c_sftp.LIBSSH2_FXF_READ, 0)
+        if mode is None:
+            attrs = SFTPAttributes()
+            while True:
+                with nogil:
+                    rc = c_sftp.libssh2_sftp_fstat(
+                        src_handle._handle, attrs._attrs)
+                if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+                    break
+                wait_session(src_sftp._session)
+            handle_error_codes(rc)
+            mode = attrs._attrs.permissions & 0o777
+        dst_handle = _open_handle(
+            dst_sftp, to_bytes(dst_path),
+            c_sftp.LIBSSH2_FXF_WRITE | c_sftp.LIBSSH2_FXF_CREAT |
+            c_sftp.LIBSSH2_FXF_TRUNC, mode)
+        src.kind = _SFTP_HANDLE
+        src.ptr = src_handle._handle
+        dst.kind = _SFTP_HANDLE
+        dst.ptr = dst_handle._handle
+        copied = _pump(src, src_sftp._session, dst, dst_sftp._session,
+                       chunk_size, LLONG_MAX,
+                       hash.update if hash is not None else None)
+        return (copied, hash.digest()) if hash is not None else copied
+    finally:
+        if dst_handle is not None:
+            dst_handle._invalidate_cache()
+            _close_handle(dst_handle)
+        if src_handle is not None:
+            _close_handle(src_handle)
+
+
+def scp_copy(Session src_session not None, src_path not None,
+             Session dst_session not None, dst_path not None, mode=None,
+             size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+             hash=None):
+    """Copy file from one session to another via SCP, streaming through
+    memory without touching local disk.
+
+    Modification and access times of the source file are sent with it.
+    Memory used is ``2 * chunk_size`` regardless of file size.
+
+    :param src_session: Session to copy from.
+    :type src_session: :py:class:`ssh2.session.Session`
+    :param src_path: Path of file to copy.
+    :type src_path: str
+    :param dst_session: Session to copy to.
+    :type dst_session: :py:class:`ssh2.session.Session`
+    :param dst_path: Path of file to create or overwrite.
+    :type dst_path: str
+    :param mode: Permissions of created file. Defaults to source file's.
+    :type mode: int
+    :param chunk_size: Size of each of the two buffers.
+    :type chunk_size: int
+    :param hash: :py:mod:`hashlib` algorithm name, like ``'sha256'``, or hash
+      object to feed copied data into as it passes through.
+    :type hash: str or hash object
+
+    :returns: Number of bytes copied, or tuple of number of bytes and digest
+      of copied data if ``hash`` is given.
+    :rtype: int or (int, bytes)
+
+    :raises: :py:class:`ssh2.exceptions.SCPProtocolError` on errors opening
+      either file, source ending early or either remote SCP command failing."""
+    cdef FileInfo fileinfo = FileInfo()
+    cdef bytes b_src_path = to_bytes(src_path)
+    cdef bytes b_dst_path = to_bytes(dst_path)
+    cdef char *_src_path = b_src_path
+    cdef char *_dst_path = b_dst_path
+    cdef c_ssh2.LIBSSH2_CHANNEL *_channel
+    cdef Channel src_channel
+    cdef Channel dst_channel
+    cdef c_ssh2.libssh2_int64_t size
+    cdef int _mode
+    cdef int rc
+    cdef long long copied
+    cdef _endpoint src
+    cdef _endpoint dst
+    if chunk_size == 0:
+        raise ValueError("Chunk size must be greater than zero")
+    hash = new_hash(hash) if hash is not None else None
+    while True:
+        with nogil:
+            _channel = c_ssh2.libssh2_scp_recv2(
+                src_session._session, _src_path, fileinfo._stat)
+        if _channel is not NULL:
+            break
+        rc = c_ssh2.libssh2_session_last_errno(src_session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise SCPProtocolError(
+                "Error receiving %s via SCP" % (b_src_path,))
+        wait_session(src_session)
+    src_channel = PyChannel(_channel, src_session)
+    size = fileinfo._stat.st_size
+    _mode = fileinfo._stat.st_mode & 0o777 if mode is None else mode
+    while True:
+        with nogil:
+            _channel = c_ssh2.libssh2_scp_send64(
+                dst_session._session, _dst_path, _mode, size,
+                fileinfo._stat.st_mtime, fileinfo._stat.st_atime)
+        if _channel is not NULL:
+            break
+        rc = c_ssh2.libssh2_session_last_errno(dst_session._session)
+        if rc != c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            handle_error_codes(rc)
+            raise SCPProtocolError(
+                "Error sending %s via SCP" % (b_dst_path,))
+        wait_session(dst_session)
+    dst_channel = PyChannel(_channel, dst_session)
+    src.kind = _CHANNEL
+    src.ptr = src_channel._channel
+    dst.kind = _CHANNEL
+    dst.ptr = dst_channel._channel
+    copied = _pump(src, src_session, dst, dst_session, chunk_size, size,
+                   hash.update if hash is not None else None)
+    if copied != size:
+        raise SCPProtocolError(
+            "Source %s ended after %s of %s bytes" % (
+                b_src_path, copied, size))
+    # Source sends its status after the file's data and waits for it to be
+    # acknowledged before exiting
+    _scp_read_ack(src_session, src_channel._channel)
+    _scp_write(src_session, src_channel._channel, b"\0")
+    # Likewise for destination
+    _scp_write(dst_session, dst_channel._channel, b"\0")
+    _scp_read_ack(dst_session, dst_channel._channel)
+    _channel_finish(dst_channel)
+    _channel_finish(src_channel)
+    _check_exit_status(src_channel, b_src_path)
+    _check_exit_status(dst_channel, b_dst_path)
+    return (copied, hash.digest()) if hash is not None else copied
+
+
+def copy_channel(Channel src not None, Channel dst not None, length=None,
+                 size_t chunk_size=c_ssh2.LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+                 hash=None):
+    """Copy data read from one channel to another until end of file on the
+    source, or until ``length`` bytes have been copied.
+
+    Channels can be on the same or different sessions. EOF is not sent on
+    the destination channel - callers should do so if needed once copy has
+    completed.
+
+    :param src: Channel to read from.
+    :type src: :py:class:`ssh2.channel.Channel`
+    :param dst: Channel to write to.
+    :type dst: :py:class:`ssh2.channel.Channel`
+    :param length: Max number of bytes to copy. Defaults to no limit.
+    :type length: int
+    :param chunk_size: Size of each of the two buffers.
+    :type chunk_size: int
+    :param hash: :py:mod:`hashlib` algorithm name, like ``'sha256'``, or hash
+      object to feed copied data into as it passes through.
+    :type hash: str or hash object
+
+    :returns: Number of bytes copied, or tuple of number of bytes and digest
+      of copied data if ``hash`` is given.
+    :rtype: int or (int, bytes)"""
+    cdef _endpoint _src
+    cdef long long copied
+    cdef _endpoint _dst
+    if chunk_size == 0:
+        raise ValueError("Chunk size must be greater than zero")
+    if length is not None and length < 0:
+        raise ValueError("Length must not be negative")
+    hash = new_hash(hash) if hash is not None else None
+    _src.kind = _CHANNEL
+    _src.ptr = src._channel
+    _dst.kind = _CHANNEL
+    _dst.ptr = dst._channel
+    copied = _pump(_src, src._session, _dst, dst._session, chunk_size,
+                   LLONG_MAX if length is None else length,
+                   hash.update if hash is not None else None)
+    return (copied, hash.digest()) if hash is not None else copied
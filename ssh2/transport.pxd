@@ -0,0 +1,38 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+from .channel cimport Channel
+
+from . cimport c_ssh2
+
+
+cdef ssize_t _transport_send(c_ssh2.libssh2_socket_t sock, const void *buf,
+                             size_t length, int flags,
+                             void **abstract) noexcept nogil
+cdef ssize_t _transport_recv(c_ssh2.libssh2_socket_t sock, void *buf,
+                             size_t length, int flags,
+                             void **abstract) noexcept nogil
+
+
+cdef class Transport:
+    cdef readonly object error
+
+    cdef ssize_t _send(self, const char *buf, size_t length) noexcept nogil
+    cdef ssize_t _recv(self, char *buf, size_t length) noexcept nogil
+
+
+cdef class ChannelTransport(Transport):
+    cdef Channel _channel
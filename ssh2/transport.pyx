@@ -0,0 +1,164 @@
+# This file is part of ssh2-python.
+# Copyright (C) 2017-2020 Panos Kittenis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Custom session transports.
+
+A transport set with ``ssh2.session.Session.set_transport`` replaces the
+socket libssh2 sends and receives session data on. libssh2 still waits on
+the file descriptor of the object passed to
+``ssh2.session.Session.handshake`` when a blocking call would block - a
+transport's ``fileno`` should return a descriptor that becomes ready when
+the transport can make progress."""
+
+from libc.errno cimport EAGAIN, ECONNRESET
+from libc.string cimport memcpy
+
+from .channel cimport Channel
+from .session cimport Session
+
+from . cimport c_ssh2
+
+
+cdef ssize_t _transport_send(c_ssh2.libssh2_socket_t sock, const void *buf,
+                             size_t length, int flags,
+                             void **abstract) noexcept nogil:
+    return (<Transport>(<Session>abstract[0]).transport)._send(
+        <const char *>buf, length)
+
+
+cdef ssize_t _transport_recv(c_ssh2.libssh2_socket_t sock, void *buf,
+                             size_t length, int flags,
+                             void **abstract) noexcept nogil:
+    return (<Transport>(<Session>abstract[0]).transport)._recv(
+        <char *>buf, length)
+
+
+cdef ssize_t _py_send(Transport transport, const char *buf,
+                      size_t length) noexcept with gil:
+    try:
+        sent = transport.send(buf[:length])
+    except BlockingIOError:
+        return -EAGAIN
+    except Exception as ex:
+        transport.error = ex
+        return -ECONNRESET
+    if sent is None:
+        return -EAGAIN
+    return sent
+
+
+cdef ssize_t _py_recv(Transport transport, char *buf,
+                      size_t length) noexcept with gil:
+    cdef bytes b_data
+    cdef size_t size
+    try:
+        data = transport.recv(length)
+    except BlockingIOError:
+        return -EAGAIN
+    except Exception as ex:
+        transport.error = ex
+        return -ECONNRESET
+    if data is None:
+        return -EAGAIN
+    b_data = bytes(data)
+    size = len(b_data)
+    if size > length:
+        transport.error = ValueError(
+            "Received %s bytes, more than the %s requested" % (size, length))
+        return -ECONNRESET
+    memcpy(buf, <const char *>b_data, size)
+    return size
+
+
+cdef class Transport:
+    """Base class for session transports.
+
+    Transports implemented in Python override ``send``, ``recv`` and
+    ``fileno``, which are called with the GIL held. Either of ``send`` and
+    ``recv`` may return ``None`` or raise ``BlockingIOError`` when they
+    would block. Other exceptions fail the session call in progress with a
+    socket error and are available as ``error``.
+
+    Native transports override the C level send and receive functions and
+    run without the GIL."""
+
+    def fileno(self):
+        """File descriptor to wait on when a blocking call would block."""
+        raise NotImplementedError
+
+    def send(self, data):
+        """Send data.
+
+        :param data: Data to send.
+        :type data: bytes
+
+        :returns: Number of bytes sent."""
+        raise NotImplementedError
+
+    def recv(self, size_t size):
+        """Receive up to ``size`` bytes.
+
+        :returns: Data received, empty on end of file.
+        :rtype: bytes"""
+        raise NotImplementedError
+
+    cdef ssize_t _send(self, const char *buf, size_t length) noexcept nogil:
+        return _py_send(self, buf, length)
+
+    cdef ssize_t _recv(self, char *buf, size_t length) noexcept nogil:
+        return _py_recv(self, buf, length)
+
+
+cdef class ChannelTransport(Transport):
+    """Transport over a channel of another session, for example a
+    ``direct_tcpip`` channel - runs a session inside another without any
+    sockets or relaying threads.
+
+    Data is written to and read from the channel without the GIL. The
+    channel's session is switched to non-blocking mode and must not be used
+    for anything else while the transport is in use. Its socket is the
+    file descriptor to wait on."""
+
+    def __cinit__(self, Channel channel not None):
+        self._channel = channel
+        channel._session.set_blocking(False)
+
+    @property
+    def channel(self):
+        return self._channel
+
+    def fileno(self):
+        return self._channel._session.sock.fileno()
+
+    cdef ssize_t _send(self, const char *buf, size_t length) noexcept nogil:
+        cdef ssize_t rc = c_ssh2.libssh2_channel_write_ex(
+            self._channel._channel, 0, buf, length)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN:
+            return -EAGAIN
+        elif rc < 0:
+            return -ECONNRESET
+        return rc
+
+    cdef ssize_t _recv(self, char *buf, size_t length) noexcept nogil:
+        cdef ssize_t rc = c_ssh2.libssh2_channel_read_ex(
+            self._channel._channel, 0, buf, length)
+        if rc == c_ssh2.LIBSSH2_ERROR_EAGAIN or (
+                rc == 0 and not c_ssh2.libssh2_channel_eof(
+                    self._channel._channel)):
+            return -EAGAIN
+        elif rc < 0:
+            return -ECONNRESET
+        return rc
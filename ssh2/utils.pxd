@@ -16,7 +16,17 @@
 
 cdef extern from "ext/find_eol.h" nogil:
     int c_find_eol "find_eol" (char* data, int* new_pos)
+cdef extern from "ext/fileio.h" nogil:
+    ctypedef long long ssh2_off_t
+    long long fd_read(int fd, char *buf, size_t n)
+    int fd_write_all(int fd, const char *buf, size_t n)
+    int fd_seek(int fd, ssh2_off_t offset)
+
+from .session cimport Session
+
 cdef bytes to_bytes(_str)
 cdef object to_str(char *c_str)
 cdef object to_str_len(char *c_str, int length)
 cpdef int handle_error_codes(int errcode) except -1
+cdef int wait_session(Session session) except -1
+cdef object new_hash(object hash)
@@ -14,6 +14,7 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
+import hashlib
 from select import select
 
 from cpython.version cimport PY_MAJOR_VERSION
@@ -31,7 +32,9 @@ cdef bytes to_bytes(_str):
     if isinstance(_str, bytes):
         return _str
     elif isinstance(_str, unicode):
-        return _str.encode(ENCODING)
+        # Names decoded with surrogateescape, like remote file names that
+        # are not valid UTF-8, encode back to their original bytes
+        return _str.encode(ENCODING, 'surrogateescape')
     return _str
 
 
@@ -113,6 +116,37 @@ def wait_socket(_socket not None, Session session, timeout=1):
     return select(readfds, writefds, (), timeout)
 
 
+cdef int wait_session(Session session) except -1:
+    """Block until the session socket is ready for the direction(s) libssh2
+    is waiting on.
+
+    Used by native loops to resume after ``LIBSSH2_ERROR_EAGAIN`` when the
+    session is in non-blocking mode."""
+    cdef int directions = session.block_directions()
+    if directions == 0 or session.sock is None:
+        return 0
+    readfds = [session.sock] \
+        if (directions & c_ssh2.LIBSSH2_SESSION_BLOCK_INBOUND) else ()
+    writefds = [session.sock] \
+        if (directions & c_ssh2.LIBSSH2_SESSION_BLOCK_OUTBOUND) else ()
+    select(readfds, writefds, ())
+    return 0
+
+
+cdef object new_hash(object hash):
+    """Get incremental hash object for ``hash`` parameter of transfer
+    functions - either a :py:mod:`hashlib` algorithm name or an object with
+    ``update`` and ``digest`` methods, like those returned by
+    :py:func:`hashlib.new`."""
+    if isinstance(hash, str):
+        return hashlib.new(hash)
+    if not hasattr(hash, 'update') or not hasattr(hash, 'digest'):
+        raise TypeError(
+            "Hash must be an algorithm name or have update and digest "
+            "methods, got %r" % (hash,))
+    return hash
+
+
 cpdef int handle_error_codes(int errcode) except -1:
     """Raise appropriate exception for given error code.
 
@@ -24,3 +24,36 @@ class SessionTestCase(SSH2TestCase):
         for bad_flag in (LIBSSH2_FLAG_QUOTE_PATHS, LIBSSH2_FLAG_SK_PRESENCE_REQUIRED,
                          LIBSSH2_FLAG_SK_VERIFICATION_REQUIRED):
             self.assertRaises(ValueError, session.flag, bad_flag)
+
+    def test_scp_put_file_args(self):
+        session = Session()
+        self.assertRaises(ValueError, session.scp_put_file, 'local', 'remote', chunk_size=0)
+
+    def test_scp_get_file_args(self):
+        session = Session()
+        self.assertRaises(ValueError, session.scp_get_file, 'remote', 'local', chunk_size=0)
+
+    def test_scp_many_args(self):
+        session = Session()
+        for func in (session.scp_put_many, session.scp_get_many):
+            self.assertRaises(ValueError, func, [], chunk_size=0)
+            self.assertRaises(ValueError, func, [], concurrency=0)
+            self.assertEqual(func([]), [])
+
+    def test_scp_dir_args(self):
+        session = Session()
+        self.assertRaises(ValueError, session.scp_put_dir, 'local', 'remote', chunk_size=0)
+        self.assertRaises(ValueError, session.scp_get_dir, 'remote', 'local', chunk_size=0)
+        self.assertRaises(ValueError, session.scp_put_dir, 'local', '/')
+
+    def test_forward_args(self):
+        session = Session()
+        self.assertRaises(ValueError, session.forward_local, '127.0.0.1', 0, 'localhost', 22, buffer_size=0)
+        self.assertRaises(ValueError, session.forward_local, '127.0.0.1', 0, 'localhost', 22)
+        self.assertRaises(ValueError, session.forward_remote, 0, 'localhost', 22, buffer_size=0)
+        self.assertRaises(ValueError, session.forward_remote, 0, 'localhost', 22)
+        self.assertRaises(ValueError, session.forward_streamlocal, '/tmp/local.sock', '/tmp/remote.sock', buffer_size=0)
+        self.assertRaises(ValueError, session.forward_streamlocal, '/tmp/local.sock', '/tmp/remote.sock')
+        self.assertRaises(ValueError, session.forward_dynamic, '127.0.0.1', 0)
+        self.assertRaises(ValueError, session.open_tunnel, 'localhost', 22)
+        self.assertRaises(ValueError, Session().handshake_via, session, 'localhost', 22)
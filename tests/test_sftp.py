@@ -1,6 +1,14 @@
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+
+from ssh2.exceptions import SFTPProtocolError
 from ssh2.session import Session
-from ssh2.sftp import SFTP
-from ssh2.sftp_handle import SFTPAttributes, SFTPHandle
+from ssh2.sftp import SFTP, SFTPAttributeCache, SFTPPool, TransferJournal, \
+    _fxp_packet_length
+from ssh2.sftp_handle import SFTPAttributes, SFTPHandle, SFTPDirListing
 
 from .base_test import SSH2TestCase
 
@@ -27,3 +35,177 @@ class SFTPTestCase(SSH2TestCase):
         sftp = SFTP(session)
         sftp_fh = SFTPHandle(sftp)
         self.assertFalse(sftp_fh.closed)
+
+    def test_attr_cache(self):
+        sftp = SFTP(Session())
+        self.assertIsNone(sftp.attr_cache)
+        cache = sftp.enable_attr_cache(max_entries=10, ttl=1)
+        self.assertIsInstance(cache, SFTPAttributeCache)
+        self.assertEqual(sftp.attr_cache, cache)
+        self.assertEqual(cache.max_entries, 10)
+        self.assertEqual(cache.ttl, 1)
+        self.assertEqual(len(cache), 0)
+        cache.invalidate('/tmp', recursive=True)
+        cache.clear()
+        sftp.disable_attr_cache()
+        self.assertIsNone(sftp.attr_cache)
+        self.assertRaises(ValueError, SFTPAttributeCache, max_entries=0)
+
+    def test_read_cache_args(self):
+        sftp_fh = SFTPHandle(SFTP(Session()))
+        self.assertFalse(sftp_fh.read_cache_enabled)
+        self.assertRaises(ValueError, sftp_fh.enable_read_cache, block_size=0)
+        self.assertRaises(ValueError, sftp_fh.enable_read_cache,
+                          block_size=65536, capacity_mb=0.01)
+        self.assertFalse(sftp_fh.read_cache_enabled)
+
+    def test_get_file_mmap_resume(self):
+        sftp = SFTP(Session())
+        self.assertRaises(ValueError, sftp.get_file, 'remote', 'local',
+                          mmap=True, resume=True)
+
+    def test_transfer_hash_args(self):
+        sftp = SFTP(Session())
+        self.assertRaises(ValueError, sftp.get_file, 'remote', 'local',
+                          resume=True, hash='sha256')
+        self.assertRaises(ValueError, sftp.put_file, 'local', 'remote',
+                          resume=True, hash='sha256')
+        self.assertRaises(TypeError, sftp.get_file, 'remote', 'local',
+                          hash=object())
+
+    def test_sftp_pool_size(self):
+        session = Session()
+        self.assertRaises(ValueError, session.sftp_pool, 0)
+        self.assertRaises(ValueError, SFTPPool, session, size=-1)
+
+    def test_open_file_invalid_mode(self):
+        sftp = SFTP(Session())
+        for mode in ('', 'rw', 'rr', 'q', 'rbt', 'r+w'):
+            self.assertRaises(ValueError, sftp.open_file, 'path', mode)
+        self.assertRaises(ValueError, sftp.open_file, 'path', 'r', buffering=0)
+        self.assertRaises(ValueError, sftp.open_file, 'path', 'rb',
+                          encoding='utf-8')
+
+    def test_dir_listing(self):
+        listing = SFTPDirListing()
+        self.assertEqual(len(listing), 0)
+        self.assertEqual(list(listing), [])
+        self.assertEqual(listing.names, b'')
+        self.assertEqual(list(listing.name_offsets), [0])
+        self.assertEqual(listing.filesizes.typecode, 'Q')
+        self.assertEqual(memoryview(listing.mtimes).nbytes, 0)
+        self.assertRaises(IndexError, listing.name, 0)
+        self.assertRaises(IndexError, listing.attributes, -1)
+
+    def test_fxp_packet_length(self):
+        self.assertEqual(_fxp_packet_length(b'\x00\x00\x00\x05'), 5)
+        self.assertEqual(_fxp_packet_length(b'\x00\x04\x00\x00'), 262144)
+        for header in (b'\x00\x00\x00\x00', b'\x00\x04\x00\x01',
+                       b'\xff\xff\xff\xff'):
+            self.assertRaises(SFTPProtocolError, _fxp_packet_length, header)
+
+
+class TransferJournalTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_missing(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        self.assertEqual(journal.missing(), [(0, 10), (10, 10), (20, 5)])
+        journal.begin()
+        journal.record(10, 10)
+        journal.close()
+        self.assertEqual(journal.missing(), [(0, 10), (20, 5)])
+
+    def test_load(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        journal.record(0, 10, 1234)
+        journal.record(20, 5)
+        journal.close()
+        journal = TransferJournal(self.path, 25, 1, 10)
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.ranges, {0: (10, 1234), 20: (5, None)})
+        self.assertEqual(journal.missing(), [(10, 10)])
+
+    def test_load_dest_mtime(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        journal.record(0, 10, 1234, dest_mtime=100)
+        journal.record(10, 10, dest_mtime=200)
+        journal.close()
+        journal = TransferJournal(self.path, 25, 1, 10)
+        self.assertIsNone(journal.dest_mtime)
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.dest_mtime, 200)
+        self.assertEqual(journal.ranges, {0: (10, 1234), 10: (10, None)})
+        # Rewritten journal keeps destination modification time
+        journal.begin()
+        journal.close()
+        journal = TransferJournal(self.path, 25, 1, 10)
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.dest_mtime, 200)
+
+    def test_load_different_source(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        journal.record(0, 10)
+        journal.close()
+        for size, mtime, range_size in ((26, 1, 10), (25, 2, 10), (25, 1, 5)):
+            journal = TransferJournal(self.path, size, mtime, range_size)
+            self.assertFalse(journal.load())
+            self.assertEqual(journal.ranges, {})
+
+    def test_load_missing_and_partial(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        self.assertFalse(journal.load())
+        journal.begin()
+        journal.record(0, 10)
+        journal.close()
+        with open(self.path, 'a') as fh:
+            fh.write('10 1')
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.missing(), [(10, 10), (20, 5)])
+
+    def test_verify(self):
+        data = os.urandom(25)
+        local_file = os.path.join(self.tmp_dir, 'local')
+        with open(local_file, 'wb') as fh:
+            fh.write(data)
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        journal.record(0, 10, zlib.crc32(data[0:10]))
+        journal.record(10, 10, zlib.crc32(data[10:20]) ^ 1)
+        journal.record(20, 5)
+        journal.close()
+        fd = os.open(local_file, os.O_RDONLY)
+        try:
+            self.assertEqual(journal.verify(fd), 2)
+        finally:
+            os.close(fd)
+        self.assertEqual(journal.missing(), [(10, 10), (20, 5)])
+
+    def test_truncate(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        journal.record(0, 10)
+        journal.record(10, 10)
+        journal.close()
+        journal.truncate(15)
+        self.assertEqual(journal.missing(), [(10, 10), (20, 5)])
+
+    def test_remove(self):
+        journal = TransferJournal(self.path, 25, 1, 10)
+        journal.begin()
+        self.assertTrue(os.path.exists(self.path))
+        journal.remove()
+        self.assertFalse(os.path.exists(self.path))
+        journal.remove()
+
+    def test_zero_range_size(self):
+        self.assertRaises(ValueError, TransferJournal, self.path, 25, 1, 0)
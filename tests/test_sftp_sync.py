@@ -0,0 +1,23 @@
+from ssh2.session import Session
+from ssh2.sftp import SFTP
+from ssh2.sftp_sync import mirror, MirrorResult
+
+from .base_test import SSH2TestCase
+
+
+class SFTPSyncTestCase(SSH2TestCase):
+
+    def test_mirror_result(self):
+        result = MirrorResult()
+        self.assertEqual(result.transferred, [])
+        self.assertEqual(result.updated, [])
+        self.assertEqual(result.created, [])
+        self.assertEqual(result.deleted, [])
+        self.assertEqual(result.unchanged, 0)
+        self.assertEqual(result.bytes_transferred, 0)
+
+    def test_mirror_invalid_args(self):
+        sftp = SFTP(Session())
+        self.assertRaises(ValueError, mirror, sftp, '.', '.',
+                          direction='sideways')
+        self.assertRaises(ValueError, mirror, sftp, '.', '.', chunk_size=0)
@@ -0,0 +1,21 @@
+from ssh2.channel import Channel
+from ssh2.session import Session
+from ssh2.sftp import SFTP
+from ssh2.transfer import copy, copy_channel
+
+from .base_test import SSH2TestCase
+
+
+class TransferTestCase(SSH2TestCase):
+
+    def test_invalid_args(self):
+        session = Session()
+        sftp = SFTP(session)
+        self.assertRaises(ValueError, copy, sftp, 'src', sftp, 'dst',
+                          chunk_size=0)
+        chan = Channel(session)
+        self.assertRaises(ValueError, copy_channel, chan, chan, chunk_size=0)
+        self.assertRaises(ValueError, copy_channel, chan, chan, length=-1)
+        self.assertRaises(ValueError, copy, sftp, 'src', sftp, 'dst',
+                          hash='notahash')
+        self.assertRaises(TypeError, copy_channel, chan, chan, hash=object())
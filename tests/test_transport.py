@@ -0,0 +1,60 @@
+import socket
+import unittest
+
+from ssh2.exceptions import SocketDisconnectError, SocketRecvError, SocketSendError
+from ssh2.session import Session
+from ssh2.transport import Transport
+
+
+class SocketTransport(Transport):
+
+    def __init__(self, sock):
+        self.sock = sock
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def send(self, data):
+        return self.sock.send(data)
+
+    def recv(self, size):
+        return self.sock.recv(size)
+
+
+class TransportTest(unittest.TestCase):
+
+    def test_base_transport(self):
+        transport = Transport()
+        self.assertRaises(NotImplementedError, transport.fileno)
+        self.assertRaises(NotImplementedError, transport.send, b"data")
+        self.assertRaises(NotImplementedError, transport.recv, 10)
+        self.assertIsNone(transport.error)
+
+    def test_set_transport(self):
+        session = Session()
+        self.assertRaises(TypeError, session.set_transport, None)
+        transport = Transport()
+        session.set_transport(transport)
+        self.assertEqual(session.transport, transport)
+
+    def test_python_transport_banner(self):
+        sock, peer = socket.socketpair()
+        transport = SocketTransport(sock)
+        session = Session()
+        session.set_transport(transport)
+        peer.sendall(b"SSH-2.0-test\r\n")
+        peer.close()
+        self.assertRaises((SocketDisconnectError, SocketRecvError, SocketSendError),
+                          session.handshake, transport)
+        sock.close()
+
+    def test_python_transport_error(self):
+        sock, peer = socket.socketpair()
+        peer.close()
+        transport = SocketTransport(sock)
+        session = Session()
+        session.set_transport(transport)
+        self.assertRaises((SocketRecvError, SocketSendError),
+                          session.handshake, transport)
+        self.assertIsInstance(transport.error, OSError)
+        sock.close()